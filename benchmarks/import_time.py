@@ -0,0 +1,119 @@
+# Copyright (c) 2022 Dimitrios-Georgios Akestoridis
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Benchmark script for the import time of the ``mcdm`` package.
+
+Each measurement imports the package in a fresh Python interpreter, so that
+the reported times correspond to the cold start of a process:
+
+    $ python benchmarks/import_time.py --repeat 20
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+
+ROOT_DIRPATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure_wall_time(statement):
+    """
+    Return the wall-clock time, in seconds, that a fresh Python interpreter
+    needs in order to execute the provided statement.
+    """
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-c", statement],
+        cwd=ROOT_DIRPATH,
+        check=True,
+    )
+    return time.perf_counter() - start
+
+
+def measure_import_time(module_name):
+    """
+    Return the cumulative import time, in seconds, of the provided module
+    according to the ``-X importtime`` option of the Python interpreter.
+    """
+    cp = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import " + module_name],
+        cwd=ROOT_DIRPATH,
+        capture_output=True,
+        check=True,
+    )
+    for line in cp.stderr.decode().splitlines():
+        match = re.search(
+            r"^import time:\s+[0-9]+ \|\s+([0-9]+) \| {}$".format(
+                re.escape(module_name),
+            ),
+            line,
+        )
+        if match:
+            return int(match.group(1)) / 1e6
+    raise ValueError(
+        "The import time of {} was not reported".format(module_name),
+    )
+
+
+def main():
+    """
+    Print the median and the minimum import times of the ``mcdm`` package,
+    with the import time of NumPy as the baseline.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=10,
+        help="number of fresh interpreters per measurement",
+    )
+    args = parser.parse_args()
+
+    for module_name in ["numpy", "mcdm"]:
+        wall_times = [
+            measure_wall_time("import " + module_name)
+            for _ in range(args.repeat)
+        ]
+        import_times = [
+            measure_import_time(module_name)
+            for _ in range(args.repeat)
+        ]
+        print(
+            "{:<6} wall median {:8.2f} ms, min {:8.2f} ms | ".format(
+                module_name,
+                1e3 * statistics.median(wall_times),
+                1e3 * min(wall_times),
+            )
+            + "importtime median {:8.2f} ms, min {:8.2f} ms".format(
+                1e3 * statistics.median(import_times),
+                1e3 * min(import_times),
+            ),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,382 @@
+# Copyright (c) 2022 Dimitrios-Georgios Akestoridis
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Benchmark script for the execution time of the methods of the ``mcdm``
+package.
+
+The methods are timed on synthetic decision matrices over a grid of sizes
+and the results are written to a JSON file, so that two runs can be
+compared in order to flag regressions:
+
+    $ python benchmarks/method_time.py run --output before.json
+    $ python benchmarks/method_time.py run --output after.json
+    $ python benchmarks/method_time.py compare before.json after.json
+
+The measured package is the one that the interpreter imports, e.g., after
+running ``pip install -e .`` in the root directory of the repository.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import timeit
+
+import numpy as np
+
+import mcdm
+from mcdm.helper_registry import get_method, list_methods
+
+
+# Distributions of the synthetic values, which are all positive
+DISTRIBUTIONS = {
+    "uniform": lambda rng, size: rng.uniform(1.0, 10.0, size),
+    "normal": lambda rng, size: np.abs(rng.normal(5.0, 1.0, size)) + 1e-3,
+    "lognormal": lambda rng, size: rng.lognormal(0.0, 1.0, size),
+    "integer": lambda rng, size: rng.integers(1, 6, size).astype(float),
+}
+
+# Methods whose cost grows quadratically with the number of alternatives
+QUADRATIC_METHODS = {("correlation", "dCor")}
+
+
+def generate_matrix(
+    n_alts,
+    n_crits,
+    benefit_ratio=0.5,
+    distribution="uniform",
+    ties=0.0,
+    seed=0,
+):
+    """
+    Return a synthetic decision matrix with the provided number of
+    alternatives and criteria, whose values follow the selected
+    distribution, along with the type of each criterion. The provided ratio
+    of the criteria are benefit criteria and the provided fraction of the
+    alternatives are copies of other alternatives, which results in ties.
+    """
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError("Unknown distribution ({})".format(distribution))
+    if not 0.0 <= benefit_ratio <= 1.0:
+        raise ValueError("The benefit ratio must be between 0 and 1")
+    if not 0.0 <= ties < 1.0:
+        raise ValueError("The fraction of ties must be in [0, 1)")
+
+    rng = np.random.default_rng(seed)
+    x_matrix = DISTRIBUTIONS[distribution](rng, (n_alts, n_crits))
+
+    # Replace some alternatives with copies of the remaining alternatives
+    n_copies = int(round(ties * n_alts))
+    if n_copies > 0:
+        rows = rng.permutation(n_alts)
+        x_matrix[rows[:n_copies]] = x_matrix[
+            rng.choice(rows[n_copies:], n_copies)
+        ]
+
+    # Select the benefit criteria
+    is_benefit_x = [False] * n_crits
+    for j in rng.permutation(n_crits)[:int(round(benefit_ratio * n_crits))]:
+        is_benefit_x[j] = True
+
+    return x_matrix, is_benefit_x
+
+
+def parse_size(text):
+    """
+    Return the number of alternatives and criteria of a size in the
+    ``<alternatives>x<criteria>`` format.
+    """
+    try:
+        n_alts, n_crits = (int(value) for value in text.split("x"))
+    except ValueError as err:
+        raise argparse.ArgumentTypeError(
+            "Invalid size ({})".format(text),
+        ) from err
+    if n_alts < 2 or n_crits < 2:
+        raise argparse.ArgumentTypeError(
+            "Sizes need at least 2 alternatives and 2 criteria",
+        )
+    return n_alts, n_crits
+
+
+def list_cases(x_matrix, is_benefit_x):
+    """
+    Return the name and the function of each benchmark case for the
+    provided decision matrix.
+    """
+    z_matrix, is_benefit_z = mcdm.normalize(x_matrix, is_benefit_x, "Linear1")
+    z_sums, _ = mcdm.normalize(x_matrix, is_benefit_x, "Linear3")
+    w_vector = mcdm.weigh(z_matrix, "MW")
+
+    cases = []
+    for n_method in list_methods("normalization"):
+        cases.append((
+            ("normalization", n_method),
+            lambda n_method=n_method: mcdm.normalize(
+                x_matrix,
+                is_benefit_x,
+                n_method,
+            ),
+        ))
+    for w_method in list_methods("weighting"):
+        capabilities = get_method("weighting", w_method).capabilities
+        cases.append((
+            ("weighting", w_method),
+            lambda w_method=w_method, capabilities=capabilities: mcdm.weigh(
+                z_sums if capabilities["column_sums_to_one"] else z_matrix,
+                w_method,
+                "AbsPearson" if capabilities["nonnegative_correlation"]
+                else "Pearson",
+            ),
+        ))
+    for c_method in list_methods("correlation"):
+        cases.append((
+            ("correlation", c_method),
+            lambda c_method=c_method: mcdm.correlate(z_matrix, c_method),
+        ))
+    for s_method in list_methods("scoring"):
+        cases.append((
+            ("scoring", s_method),
+            lambda s_method=s_method: mcdm.score(
+                z_matrix,
+                is_benefit_z,
+                w_vector,
+                s_method,
+            ),
+        ))
+    cases.append((
+        ("rank", "Linear1-MW-SAW"),
+        lambda: mcdm.rank(
+            x_matrix,
+            is_benefit_x=is_benefit_x,
+            n_method="Linear1",
+        ),
+    ))
+    return cases
+
+
+def time_function(function, repeat):
+    """
+    Return the minimum and the median execution times, in seconds, of the
+    provided function, along with the number of calls per measurement.
+    """
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    times = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+    return min(times), statistics.median(times), number
+
+
+def run_benchmarks(args):
+    """
+    Time every registered method over the grid of sizes and write the
+    results to the output file.
+    """
+    mcdm.disable_cache()
+    mcdm.disable_disk_cache()
+    results = []
+    for n_alts, n_crits in args.sizes:
+        x_matrix, is_benefit_x = generate_matrix(
+            n_alts,
+            n_crits,
+            benefit_ratio=args.benefit_ratio,
+            distribution=args.distribution,
+            ties=args.ties,
+            seed=args.seed,
+        )
+        for (category, method), function in list_cases(
+            x_matrix,
+            is_benefit_x,
+        ):
+            if (
+                (category, method) in QUADRATIC_METHODS
+                and n_alts > args.max_quadratic_alts
+            ):
+                continue
+            min_time, median_time, number = time_function(
+                function,
+                args.repeat,
+            )
+            results.append({
+                "category": category,
+                "method": method,
+                "size": "{}x{}".format(n_alts, n_crits),
+                "min": min_time,
+                "median": median_time,
+                "number": number,
+            })
+            print(
+                "{:<13} {:<14} {:>11} min {:12.6f} ms, median {:12.6f} ms"
+                .format(
+                    category,
+                    method,
+                    results[-1]["size"],
+                    1e3 * min_time,
+                    1e3 * median_time,
+                ),
+            )
+
+    with open(args.output, mode="w", encoding="utf-8") as fp:
+        json.dump(
+            {
+                "metadata": {
+                    "python": platform.python_version(),
+                    "numpy": np.__version__,
+                    "mcdm": mcdm.__version__,
+                    "platform": platform.platform(),
+                    "benefit_ratio": args.benefit_ratio,
+                    "distribution": args.distribution,
+                    "ties": args.ties,
+                    "seed": args.seed,
+                    "repeat": args.repeat,
+                },
+                "results": results,
+            },
+            fp,
+            indent=2,
+        )
+
+
+def compare_runs(args):
+    """
+    Print the ratio of the minimum execution times of the cases that the two
+    provided runs have in common and return the number of regressions.
+    """
+    runs = []
+    settings = []
+    for filepath in (args.baseline, args.candidate):
+        with open(filepath, mode="r", encoding="utf-8") as fp:
+            data = json.load(fp)
+        runs.append({
+            (result["category"], result["method"], result["size"]):
+            result["min"]
+            for result in data["results"]
+        })
+        settings.append({
+            key: data["metadata"][key]
+            for key in ("benefit_ratio", "distribution", "ties", "seed")
+        })
+    if settings[0] != settings[1]:
+        print("Warning: The runs used different synthetic matrices")
+
+    n_regressions = 0
+    for key in runs[0]:
+        if key not in runs[1]:
+            continue
+        ratio = runs[1][key] / runs[0][key]
+        if ratio > 1.0 + args.threshold:
+            flag = "REGRESSION"
+            n_regressions += 1
+        elif ratio < 1.0 / (1.0 + args.threshold):
+            flag = "improvement"
+        else:
+            flag = ""
+        print(
+            "{:<13} {:<14} {:>11} {:8.3f}x {}".format(*key, ratio, flag)
+            .rstrip(),
+        )
+    print("{} regressions".format(n_regressions))
+    return n_regressions
+
+
+def main():
+    """
+    Run the benchmarks or compare two runs, according to the subcommand.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="time the methods")
+    run_parser.add_argument(
+        "--output",
+        default="benchmark.json",
+        help="path of the JSON file with the results",
+    )
+    run_parser.add_argument(
+        "--sizes",
+        type=parse_size,
+        nargs="+",
+        default=[(100, 5), (1000, 10), (10000, 20)],
+        help="sizes of the decision matrices, e.g., 1000x10",
+    )
+    run_parser.add_argument(
+        "--benefit-ratio",
+        type=float,
+        default=0.5,
+        help="ratio of the benefit criteria",
+    )
+    run_parser.add_argument(
+        "--distribution",
+        choices=sorted(DISTRIBUTIONS),
+        default="uniform",
+        help="distribution of the values of the decision matrices",
+    )
+    run_parser.add_argument(
+        "--ties",
+        type=float,
+        default=0.0,
+        help="fraction of the alternatives that copy other alternatives",
+    )
+    run_parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="seed of the random number generator",
+    )
+    run_parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="number of measurements per case",
+    )
+    run_parser.add_argument(
+        "--max-quadratic-alts",
+        type=int,
+        default=100,
+        help="maximum number of alternatives for quadratic-time methods",
+    )
+
+    compare_parser = subparsers.add_parser(
+        "compare",
+        help="compare two runs",
+    )
+    compare_parser.add_argument("baseline", help="JSON file of the baseline")
+    compare_parser.add_argument(
+        "candidate",
+        help="JSON file of the candidate",
+    )
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative slowdown that is flagged as a regression",
+    )
+
+    args = parser.parse_args()
+    if args.command == "run":
+        run_benchmarks(args)
+    elif compare_runs(args) > 0:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
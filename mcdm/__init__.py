@@ -379,7 +379,9 @@ Copyright (c) 2020-2022 Dimitrios-Georgios Akestoridis
 This project is licensed under the terms of the MIT License (MIT).
 """
 
+import importlib
 import os
+from typing import TYPE_CHECKING
 
 from ._metadata import (  # noqa: F401
     __author__,
@@ -387,6 +389,7 @@ from ._metadata import (  # noqa: F401
     __classifiers__,
     __copyright__,
     __description__,
+    __extras_require__,
     __install_requires__,
     __keywords__,
     __license__,
@@ -394,16 +397,126 @@ from ._metadata import (  # noqa: F401
     __title__,
     __url__,
 )
-from ._version import get_version
-from .helper_correlation import correlate
-from .helper_normalization import normalize
-from .helper_scoring import score
-from .helper_weighting import weigh
-from .main import (
-    load,
-    rank,
-)
-
-
-__version__ = get_version(os.path.dirname(os.path.abspath(__file__)))
-__all__ = ["rank", "load", "score", "weigh", "correlate", "normalize"]
+from .helper_lazy import load_attribute
+
+if TYPE_CHECKING:
+    from . import (  # noqa: F401
+        correlation,
+        normalization,
+        scoring,
+        weighting,
+    )
+    from .helper_cache import (
+        cache_info,
+        disable_cache,
+        enable_cache,
+    )
+    from .helper_correlation import correlate
+    from .helper_diskcache import (
+        disable_disk_cache,
+        enable_disk_cache,
+    )
+    from .helper_grid import rank_all
+    from .helper_incremental import IncrementalRanker
+    from .helper_normalization import normalize
+    from .helper_problem import DecisionProblem
+    from .helper_profiling import Profiler
+    from .helper_quantization import QuantizedMatrix
+    from .helper_registry import register_method
+    from .helper_rolling import (
+        RollingRanker,
+        rolling_rank,
+    )
+    from .helper_scoring import score
+    from .helper_skyline import (
+        pareto_layers,
+        skyline,
+    )
+    from .helper_topk import SawIndex
+    from .helper_weighting import weigh
+    from .main import (
+        load,
+        load_chunks,
+        rank,
+        save,
+    )
+
+
+# Each attribute is imported from its module only when it is first accessed
+_LAZY_ATTRIBUTES = {
+    "rank": ".main",
+    "rank_all": ".helper_grid",
+    "load": ".main",
+    "load_chunks": ".main",
+    "save": ".main",
+    "score": ".helper_scoring",
+    "weigh": ".helper_weighting",
+    "correlate": ".helper_correlation",
+    "normalize": ".helper_normalization",
+    "rolling_rank": ".helper_rolling",
+    "RollingRanker": ".helper_rolling",
+    "DecisionProblem": ".helper_problem",
+    "register_method": ".helper_registry",
+    "enable_cache": ".helper_cache",
+    "disable_cache": ".helper_cache",
+    "cache_info": ".helper_cache",
+    "enable_disk_cache": ".helper_diskcache",
+    "disable_disk_cache": ".helper_diskcache",
+    "Profiler": ".helper_profiling",
+    "IncrementalRanker": ".helper_incremental",
+    "SawIndex": ".helper_topk",
+    "skyline": ".helper_skyline",
+    "pareto_layers": ".helper_skyline",
+    "QuantizedMatrix": ".helper_quantization",
+}
+_LAZY_SUBPACKAGES = {
+    "correlation",
+    "normalization",
+    "scoring",
+    "weighting",
+}
+
+__all__ = [
+    "rank",
+    "rank_all",
+    "load",
+    "load_chunks",
+    "save",
+    "score",
+    "weigh",
+    "correlate",
+    "normalize",
+    "rolling_rank",
+    "RollingRanker",
+    "DecisionProblem",
+    "register_method",
+    "enable_cache",
+    "disable_cache",
+    "cache_info",
+    "enable_disk_cache",
+    "disable_disk_cache",
+    "Profiler",
+    "IncrementalRanker",
+    "SawIndex",
+    "skyline",
+    "pareto_layers",
+    "QuantizedMatrix",
+]
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBPACKAGES:
+        return importlib.import_module("." + name, __name__)
+    if name == "__version__":
+        # The version number is read from the file that was written at build
+        # time only when it is first accessed
+        version = importlib.import_module("._version", __name__).read_version(
+            os.path.dirname(os.path.abspath(__file__)),
+        )
+        globals()["__version__"] = version
+        return version
+    return load_attribute(globals(), _LAZY_ATTRIBUTES, name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | _LAZY_SUBPACKAGES)
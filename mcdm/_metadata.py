@@ -55,4 +55,7 @@ __classifiers__ = [
 __install_requires__ = [
     "numpy>=1.21.6, <2",
 ]
+__extras_require__ = {
+    "zstd": ["zstandard>=0.18"],
+}
 __python_requires__ = ">=3.7, <4"
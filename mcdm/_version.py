@@ -44,6 +44,18 @@ def get_version(pkg_dirpath):
     return version
 
 
+def read_version(pkg_dirpath):
+    """
+    Return the version number of the ``mcdm`` package that was written to a
+    file when the package was built, without invoking any Git commands.
+    """
+    version = get_version_from_file(os.path.join(pkg_dirpath, "VERSION.txt"))
+    if version is None:
+        version = "0+unknown"
+
+    return version
+
+
 def get_version_from_git(version_filepath, git_dirpath):
     """
     Try to derive and then return the version number of the ``mcdm`` package
@@ -23,9 +23,29 @@
 Python implementation of correlation methods.
 """
 
-from .abspearson_method import abspearson
-from .dcor_method import dcor
-from .pearson_method import pearson
+from typing import TYPE_CHECKING
 
+from ..helper_lazy import load_attribute
+
+if TYPE_CHECKING:
+    from .abspearson_method import abspearson
+    from .dcor_method import dcor
+    from .pearson_method import pearson
+
+
+# Each method module is imported only when its function is first accessed
+_METHOD_MODULES = {
+    "abspearson": ".abspearson_method",
+    "dcor": ".dcor_method",
+    "pearson": ".pearson_method",
+}
 
 __all__ = ["pearson", "abspearson", "dcor"]
+
+
+def __getattr__(name):
+    return load_attribute(globals(), _METHOD_MODULES, name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -32,13 +32,20 @@ information, see the following publication:
 
 import numpy as np
 
+from ..helper_dtype import current_dtype
+
 
 def abspearson(z_matrix):
     """
     Return the absolute value of the Pearson correlation coefficients of the
     provided matrix.
     """
-    # Make sure that the provided matrix is a float64 NumPy array
-    z_matrix = np.array(z_matrix, dtype=np.float64)
+    # Make sure that the provided matrix is a NumPy array of the selected
+    # data type
+    z_matrix = np.array(z_matrix, dtype=current_dtype())
 
-    return np.absolute(np.corrcoef(z_matrix, rowvar=False))
+    # Accumulate the reductions in float64 and only store the result with
+    # the selected data type
+    return np.absolute(
+        np.corrcoef(z_matrix, rowvar=False).astype(z_matrix.dtype),
+    )
@@ -36,18 +36,21 @@ see the following publications:
 
 import numpy as np
 
+from ..helper_dtype import current_dtype
+
 
 def dcor(z_matrix):
     """
     Return the distance correlation coefficients of the provided matrix.
     """
-    # Make sure that the provided matrix is a float64 NumPy array
-    z_matrix = np.array(z_matrix, dtype=np.float64)
+    # Make sure that the provided matrix is a NumPy array of the selected
+    # data type
+    z_matrix = np.array(z_matrix, dtype=current_dtype())
 
     # Initialize the matrix for the distance correlation coefficients
     dcor_matrix = np.ones(
         (z_matrix.shape[1], z_matrix.shape[1]),
-        dtype=np.float64,
+        dtype=z_matrix.dtype,
     )
 
     # Compute the matrix of squared distance covariances
@@ -89,7 +92,7 @@ def squared_dcov_matrix(z_matrix):
     # Initialize the distance covariance matrix
     dcov2_matrix = np.zeros(
         (z_matrix.shape[1], z_matrix.shape[1]),
-        dtype=np.float64,
+        dtype=z_matrix.dtype,
     )
 
     for j_col in range(z_matrix.shape[1]):
@@ -124,7 +127,7 @@ def dist_matrix(z_vector):
     # Initialize the Euclidean distance matrix
     dmatrix = np.zeros(
         (z_vector.shape[0], z_vector.shape[0]),
-        dtype=np.float64,
+        dtype=z_vector.dtype,
     )
 
     for i_row in range(z_vector.shape[0]):
@@ -143,9 +146,12 @@ def lin_func(dmatrix):
     """
     return (
         dmatrix
-        - np.mean(dmatrix, axis=0)
-        - np.reshape(np.mean(dmatrix, axis=1), (dmatrix.shape[0], 1))
-        + np.mean(dmatrix)
+        - np.mean(dmatrix, axis=0, dtype=np.float64).astype(dmatrix.dtype)
+        - np.reshape(
+            np.mean(dmatrix, axis=1, dtype=np.float64).astype(dmatrix.dtype),
+            (dmatrix.shape[0], 1),
+        )
+        + dmatrix.dtype.type(np.mean(dmatrix, dtype=np.float64))
     )
 
 
@@ -153,7 +159,10 @@ def squared_dcov(j_func, l_func):
     """
     Return the squared distance covariance between the corresponding columns.
     """
-    return np.sum(np.multiply(j_func, l_func)) / (j_func.shape[0] ** 2)
+    return (
+        np.sum(np.multiply(j_func, l_func), dtype=np.float64)
+        / (j_func.shape[0] ** 2)
+    )
 
 
 def squared_dcor(jl_dcov2, j_dvar2, l_dvar2):
@@ -32,12 +32,96 @@ see the following publication:
 
 import numpy as np
 
+from ..helper_dtype import current_dtype
+
 
 def pearson(z_matrix):
     """
     Return the Pearson correlation coefficients of the provided matrix.
     """
-    # Make sure that the provided matrix is a float64 NumPy array
-    z_matrix = np.array(z_matrix, dtype=np.float64)
+    # Make sure that the provided matrix is a NumPy array of the selected
+    # data type
+    z_matrix = np.array(z_matrix, dtype=current_dtype())
+
+    # Accumulate the reductions in float64 and only store the result with
+    # the selected data type
+    return np.corrcoef(z_matrix, rowvar=False).astype(z_matrix.dtype)
+
+
+def pearson_sums(z_matrix, workspace=None):
+    """
+    Return the sum of the Pearson correlation coefficients of each column of
+    the provided matrix with all of its columns, without computing the
+    correlation matrix. If a workspace array is provided, the standardized
+    matrix is constructed in it.
+    """
+    # Make sure that the provided matrix is a NumPy array of the selected
+    # data type
+    z_matrix = np.asarray(z_matrix, dtype=current_dtype())
+
+    # Standardize each column, so that the correlation coefficient of two
+    # columns is the mean of their element-wise product
+    if workspace is None:
+        workspace = np.empty(z_matrix.shape, dtype=z_matrix.dtype)
+    u_matrix = workspace
+    u_matrix /= column_sd(z_matrix, workspace)
+
+    corr_sums = np.einsum(
+        "ij,i->j",
+        u_matrix,
+        np.sum(u_matrix, axis=1),
+        dtype=np.float64,
+    ) / z_matrix.shape[0]
+
+    return corr_sums.astype(z_matrix.dtype)
+
+
+def pearson_row(z_matrix, j_col):
+    """
+    Return the Pearson correlation coefficients of the selected column of the
+    provided matrix with all of its columns, without computing the
+    correlation matrix.
+    """
+    # Make sure that the provided matrix is a NumPy array of the selected
+    # data type, without copying it if it already is one
+    z_matrix = np.asarray(z_matrix, dtype=current_dtype())
+
+    # Center the selected column, so that its products with the uncentered
+    # columns sum to the covariances
+    u_vector = z_matrix[:, j_col] - column_mean(z_matrix[:, j_col])
+    sd_vector = np.std(z_matrix, axis=0, dtype=np.float64)
+    corr_row = np.einsum(
+        "i,ij->j",
+        u_vector,
+        z_matrix,
+        dtype=np.float64,
+    ) / z_matrix.shape[0]
+    corr_row /= sd_vector * sd_vector[j_col]
 
-    return np.corrcoef(z_matrix, rowvar=False)
+    return np.clip(corr_row, -1.0, 1.0).astype(z_matrix.dtype)
+
+
+def column_mean(z_matrix):
+    """
+    Return the mean of each column of the provided matrix, accumulated in
+    float64 and returned with the data type of the matrix.
+    """
+    return np.mean(z_matrix, axis=0, dtype=np.float64).astype(z_matrix.dtype)
+
+
+def column_sd(z_matrix, workspace=None):
+    """
+    Return the standard deviation of each column of the provided matrix,
+    accumulated in float64 and returned with the data type of the matrix.
+    If a workspace array is provided, the deviations of the elements from
+    the means of their columns are computed in it and left there, instead of
+    being stored in a temporary matrix.
+    """
+    if workspace is None:
+        workspace = np.empty(z_matrix.shape, dtype=z_matrix.dtype)
+    d_matrix = np.subtract(z_matrix, column_mean(z_matrix), out=workspace)
+    sd_vector = np.sqrt(
+        np.einsum("ij,ij->j", d_matrix, d_matrix, dtype=np.float64)
+        / z_matrix.shape[0],
+    )
+    return sd_vector.astype(z_matrix.dtype)
@@ -0,0 +1,132 @@
+# Copyright (c) 2022 Dimitrios-Georgios Akestoridis
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Helper module for the binary file format of the ``mcdm`` package.
+
+A binary file starts with a magic string, followed by the length of a JSON
+header as a little-endian 32-bit unsigned integer, the JSON header itself,
+padded with spaces so that the matrix data start at a multiple of 64 bytes,
+and the matrix data as little-endian float64 values in row-major order. The
+JSON header contains the shape of the matrix, the row labels, and the types
+of the criteria, if available.
+"""
+
+import json
+import struct
+
+import numpy as np
+
+
+MAGIC = b"\x93MCDM\x01"
+ALIGNMENT = 64
+
+# Mapping modes that do not modify the file, the first being the default
+MMAP_MODES = ("r", "c", None)
+
+
+def is_binary_file(filepath):
+    """
+    Return a Boolean value to indicate whether the file is a binary file of
+    the ``mcdm`` package or not.
+    """
+    with open(filepath, mode="rb") as fp:
+        return fp.read(len(MAGIC)) == MAGIC
+
+
+def write_binary(filepath, x_matrix, row_labels=None, is_benefit_x=None):
+    """
+    Write a matrix, and potentially its row labels and the types of its
+    criteria, to a binary file.
+    """
+    # Perform sanity checks
+    x_matrix = np.asarray(x_matrix, dtype="<f8")
+    if x_matrix.ndim != 2:
+        raise ValueError("The matrix must be two-dimensional")
+    if row_labels is not None and len(row_labels) != x_matrix.shape[0]:
+        raise ValueError(
+            "The number of row labels does not match the number of rows in "
+            + "the matrix",
+        )
+    if is_benefit_x is not None and len(is_benefit_x) != x_matrix.shape[1]:
+        raise ValueError(
+            "The number of variables in the list that determines whether "
+            + "each criterion is a benefit or a cost criterion does not "
+            + "match the number of columns in the matrix",
+        )
+
+    header = json.dumps(
+        {
+            "shape": list(x_matrix.shape),
+            "row_labels": None if row_labels is None else list(row_labels),
+            "is_benefit": (
+                None if is_benefit_x is None
+                else [bool(is_benefit) for is_benefit in is_benefit_x]
+            ),
+        },
+    ).encode("utf-8")
+
+    # Pad the header so that the matrix data are properly aligned
+    header_length = len(MAGIC) + 4 + len(header)
+    header += b" " * (-header_length % ALIGNMENT)
+
+    with open(filepath, mode="wb") as fp:
+        fp.write(MAGIC)
+        fp.write(struct.pack("<I", len(header)))
+        fp.write(header)
+        np.ascontiguousarray(x_matrix).tofile(fp)
+
+
+def read_binary(filepath, mmap_mode="r"):
+    """
+    Return the matrix of a binary file, which is memory-mapped unless the
+    mapping mode is None, its row labels, and the types of its criteria. The
+    matrix can only be mapped as read-only ("r") or copy-on-write ("c"), so
+    that the file is never modified.
+    """
+    if mmap_mode not in MMAP_MODES:
+        raise ValueError(
+            "The mapping mode must be either \"r\", \"c\", or None",
+        )
+    with open(filepath, mode="rb") as fp:
+        if fp.read(len(MAGIC)) != MAGIC:
+            raise ValueError("The file is not a binary file of mcdm")
+        (header_length,) = struct.unpack("<I", fp.read(4))
+        header = json.loads(fp.read(header_length).decode("utf-8"))
+        offset = fp.tell()
+
+        shape = tuple(header["shape"])
+        if mmap_mode is None or shape[0] * shape[1] == 0:
+            x_matrix = np.fromfile(
+                fp,
+                dtype="<f8",
+                count=shape[0] * shape[1],
+            ).reshape(shape)
+        else:
+            x_matrix = np.memmap(
+                fp,
+                dtype="<f8",
+                mode=mmap_mode,
+                offset=offset,
+                shape=shape,
+            )
+
+    return x_matrix, header["row_labels"], header["is_benefit"]
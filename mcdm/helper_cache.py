@@ -0,0 +1,225 @@
+# Copyright (c) 2022 Dimitrios-Georgios Akestoridis
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Helper module for the memoization of intermediate results of the ``mcdm``
+package.
+"""
+
+from collections import OrderedDict
+import functools
+import hashlib
+import threading
+
+import numpy as np
+
+from .helper_dtype import current_dtype, float_dtype
+
+
+class MemoCache:
+    """
+    Least recently used cache of intermediate results, whose total size is
+    bounded by a byte budget. The cache is disabled while its budget is zero.
+    """
+    def __init__(self, max_bytes=0):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.num_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Return the cached value of the provided key, or None if it is not
+        cached.
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, value):
+        """
+        Insert the provided value into the cache, evicting the least recently
+        used values until the byte budget is respected.
+        """
+        value_bytes = count_bytes(value)
+        if value_bytes > self.max_bytes:
+            return
+        with self.lock:
+            if key in self.entries:
+                self.num_bytes -= self.entries.pop(key)[1]
+            self.entries[key] = (value, value_bytes)
+            self.num_bytes += value_bytes
+            self.evict()
+
+    def evict(self):
+        """
+        Evict the least recently used values until the byte budget is
+        respected, while the lock of the cache is held.
+        """
+        while self.num_bytes > self.max_bytes:
+            _, (_, evicted_bytes) = self.entries.popitem(last=False)
+            self.num_bytes -= evicted_bytes
+
+    def clear(self):
+        """
+        Remove all the cached values and reset the statistics.
+        """
+        with self.lock:
+            self.entries.clear()
+            self.num_bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+
+MEMO_CACHE = MemoCache()
+
+# Memoization cache that overrides the global one in the current thread
+SCOPE = threading.local()
+
+
+def enable_cache(max_bytes=256 * 2**20):
+    """
+    Enable the memoization of the results of the ``normalize``, ``weigh``,
+    and ``correlate`` functions, with the provided byte budget.
+    """
+    if max_bytes <= 0:
+        raise ValueError("The byte budget of the cache must be positive")
+    with MEMO_CACHE.lock:
+        MEMO_CACHE.max_bytes = max_bytes
+        MEMO_CACHE.evict()
+
+
+def disable_cache():
+    """
+    Disable the memoization of intermediate results and clear the cache.
+    """
+    MEMO_CACHE.max_bytes = 0
+    MEMO_CACHE.clear()
+
+
+def cache_info():
+    """
+    Return a dictionary with the statistics of the memoization cache.
+    """
+    return {
+        "hits": MEMO_CACHE.hits,
+        "misses": MEMO_CACHE.misses,
+        "entries": len(MEMO_CACHE.entries),
+        "bytes": MEMO_CACHE.num_bytes,
+        "max_bytes": MEMO_CACHE.max_bytes,
+    }
+
+
+def memoize(function):
+    """
+    Return a version of the provided function, whose first argument is a
+    matrix, that uses the memoization cache while it is enabled. The results
+    are keyed by a hash of the bytes of the matrix and the remaining
+    arguments, and copies of them are returned, so that callers cannot
+    modify the cached values.
+    """
+    @functools.wraps(function)
+    def wrapper(matrix, *args, **kwargs):
+        cache = getattr(SCOPE, "cache", None)
+        if cache is None:
+            if MEMO_CACHE.max_bytes <= 0:
+                return function(matrix, *args, **kwargs)
+            cache = MEMO_CACHE
+
+        matrix = np.ascontiguousarray(matrix, dtype=float_dtype(matrix))
+        key = (
+            function.__name__,
+            current_dtype().str,
+            matrix.dtype.str,
+            matrix.shape,
+            hashlib.blake2b(matrix, digest_size=16).digest(),
+            freeze_arguments(args),
+            freeze_arguments(sorted(kwargs.items())),
+        )
+        value = cache.get(key)
+        if value is None:
+            value = function(matrix, *args, **kwargs)
+            cache.put(key, copy_value(value))
+        return copy_value(value)
+
+    return wrapper
+
+
+def call_with_cache(cache, function, *args):
+    """
+    Return the result of the provided function, which is called with the
+    provided memoization cache in place of the global one in the current
+    thread.
+    """
+    previous_cache = getattr(SCOPE, "cache", None)
+    SCOPE.cache = cache
+    try:
+        return function(*args)
+    finally:
+        SCOPE.cache = previous_cache
+
+
+def freeze_arguments(args):
+    """
+    Return a hashable version of the provided arguments, where method names
+    are case-insensitive.
+    """
+    frozen_args = []
+    for arg in args:
+        if isinstance(arg, str):
+            frozen_args.append(arg.upper())
+        elif isinstance(arg, (list, tuple, np.ndarray)):
+            frozen_args.append(freeze_arguments(arg))
+        else:
+            frozen_args.append(arg)
+    return tuple(frozen_args)
+
+
+def copy_value(value):
+    """
+    Return a copy of the provided result, which is either an array, a list,
+    or a tuple of them.
+    """
+    if isinstance(value, tuple):
+        return tuple(copy_value(item) for item in value)
+    if isinstance(value, (list, np.ndarray)):
+        return value.copy()
+    return value
+
+
+def count_bytes(value):
+    """
+    Return the approximate number of bytes of the provided result.
+    """
+    if isinstance(value, tuple):
+        return sum(count_bytes(item) for item in value)
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, list):
+        return 8 * len(value)
+    return 8
@@ -23,19 +23,25 @@
 Helper module for the correlation methods of the ``mcdm`` package.
 """
 
-from . import correlation
+import numpy as np
 
+from .helper_cache import memoize
+from .helper_diskcache import call_with_disk_cache
+from .helper_dtype import select_dtype
+from .helper_profiling import profile_stage
+from .helper_registry import get_method
 
-def correlate(z_matrix, c_method):
+
+@profile_stage("correlate")
+@memoize
+def correlate(z_matrix, c_method, dtype=None):
     """
-    Return the selected correlation coefficients of the provided matrix.
+    Return the selected correlation coefficients of the provided matrix,
+    computed with the selected floating-point data type.
     """
-    # Use the selected correlation method
-    if c_method.upper() == "PEARSON":
-        return correlation.pearson(z_matrix)
-    elif c_method.upper() == "ABSPEARSON":
-        return correlation.abspearson(z_matrix)
-    elif c_method.upper() == "DCOR":
-        return correlation.dcor(z_matrix)
-    else:
-        raise ValueError("Unknown correlation method ({})".format(c_method))
+    with select_dtype(dtype) as selected_dtype:
+        # Use the selected correlation method
+        return call_with_disk_cache(
+            get_method("correlation", c_method).function,
+            np.asarray(z_matrix, dtype=selected_dtype),
+        )
@@ -0,0 +1,93 @@
+# Copyright (c) 2022 Dimitrios-Georgios Akestoridis
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Helper module for the deduplication of the alternatives of the ``mcdm``
+package.
+"""
+
+import numpy as np
+
+from .helper_dtype import float_dtype
+from .helper_profiling import profile_stage
+from .helper_scoring import score
+
+
+# Constants of the hash function that mixes the values of each row
+HASH_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+HASH_SHIFT = np.uint64(29)
+
+
+@profile_stage("dedup")
+def unique_rows(z_matrix):
+    """
+    Return the indices of the first occurrence of each distinct row of the
+    provided matrix, in ascending order, and the position of each row among
+    them. The rows are hashed into 64-bit integers, so that only a vector of
+    hashes needs to be sorted, and the rows are compared with the rows of
+    their hashes to detect collisions, in which case the rows are sorted
+    lexicographically instead.
+    """
+    # Compare the bits of the values, after replacing negative zeros
+    z_matrix = np.asarray(z_matrix, dtype=float_dtype(z_matrix))
+    bits = np.ascontiguousarray(z_matrix + 0.0).view(
+        "u{}".format(z_matrix.dtype.itemsize),
+    )
+    h_vector = np.zeros(bits.shape[0], dtype=np.uint64)
+    for j in range(bits.shape[1]):
+        h_vector ^= bits[:, j]
+        h_vector *= HASH_MULTIPLIER
+        h_vector ^= h_vector >> HASH_SHIFT
+    _, u_indices, inverse = np.unique(
+        h_vector,
+        return_index=True,
+        return_inverse=True,
+    )
+    if not np.array_equal(bits[u_indices[inverse]], bits):
+        _, u_indices, inverse = np.unique(
+            bits,
+            return_index=True,
+            return_inverse=True,
+            axis=0,
+        )
+
+    # Renumber the distinct rows in the order of their first occurrence
+    order = np.argsort(u_indices)
+    positions = np.empty_like(order)
+    positions[order] = np.arange(order.shape[0])
+    return u_indices[order], positions[inverse.reshape(-1)]
+
+
+def score_unique(z_matrix, is_benefit_z, w_vector, s_method, dtype=None):
+    """
+    Return the selected scores of the provided decision matrix with the
+    provided weight vector, computed only once for each distinct row with
+    the selected floating-point data type.
+    """
+    u_indices, positions = unique_rows(z_matrix)
+    s_vector, desc_order = score(
+        z_matrix[u_indices],
+        is_benefit_z,
+        w_vector,
+        s_method,
+        dtype=dtype,
+    )
+    return s_vector[positions], desc_order
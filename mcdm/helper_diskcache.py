@@ -0,0 +1,232 @@
+# Copyright (c) 2022 Dimitrios-Georgios Akestoridis
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Helper module for the on-disk cache of correlation matrices of the ``mcdm``
+package.
+"""
+
+import contextlib
+import hashlib
+import os
+import tempfile
+import time
+import types
+
+import numpy as np
+
+from .helper_dtype import float_dtype
+
+
+# Version of the key derivation, which invalidates older entries if changed
+KEY_VERSION = b"3"
+
+# Age in seconds after which a temporary file is considered to be left
+# behind by a process that failed while writing it
+STALE_SECONDS = 3600
+
+
+class DiskCache:
+    """
+    Directory of memory-mapped ``.npy`` files with cached results, whose
+    total size is bounded by a byte budget. Entries are written atomically,
+    so that multiple processes can share the same directory, and the least
+    recently used entries are evicted first. The cache is disabled while it
+    does not have a directory.
+    """
+    def __init__(self):
+        self.dirpath = None
+        self.max_bytes = 0
+
+    def get_filepath(self, function, matrix):
+        """
+        Return the path of the entry for the result of the provided function
+        on the provided float matrix. The key depends on the bytecode of the
+        function, so that a redefined function does not reuse the entries of
+        its previous definition.
+        """
+        digest = hashlib.blake2b(KEY_VERSION, digest_size=20)
+        digest.update(
+            "{}.{}".format(
+                function.__module__,
+                function.__qualname__,
+            ).encode(),
+        )
+        code = getattr(function, "__code__", None)
+        if code is not None:
+            update_code_digest(digest, code)
+        digest.update(matrix.dtype.str.encode())
+        digest.update(np.array(matrix.shape, dtype=np.int64).tobytes())
+        digest.update(matrix)
+        return os.path.join(
+            self.dirpath,
+            "{}-{}.npy".format(function.__name__, digest.hexdigest()),
+        )
+
+    def load(self, filepath):
+        """
+        Return the memory-mapped copy-on-write array of the provided entry,
+        or None if the entry does not exist.
+        """
+        try:
+            array = np.load(filepath, mmap_mode="c", allow_pickle=False)
+            os.utime(filepath)
+        except (FileNotFoundError, ValueError):
+            # The entry is missing or it was evicted before it was loaded
+            return None
+        return array
+
+    def store(self, filepath, array):
+        """
+        Atomically write the provided array to the provided entry and then
+        evict entries until the byte budget is respected. The entry is not
+        written if the cache directory is read-only or full.
+        """
+        try:
+            fd, tmp_filepath = tempfile.mkstemp(
+                suffix=".tmp",
+                dir=self.dirpath,
+            )
+        except OSError:
+            return
+        is_written = False
+        try:
+            with os.fdopen(fd, mode="wb") as fp:
+                np.save(fp, array, allow_pickle=False)
+            os.replace(tmp_filepath, filepath)
+            is_written = True
+        except OSError:
+            # A failed write only means that the result is not cached
+            pass
+        finally:
+            if not is_written:
+                with contextlib.suppress(OSError):
+                    os.remove(tmp_filepath)
+        if is_written:
+            self.evict()
+
+    def evict(self):
+        """
+        Delete the least recently used entries until their total size does
+        not exceed the byte budget, along with the temporary files that
+        failed writes left behind.
+        """
+        entries = []
+        for entry in os.scandir(self.dirpath):
+            if entry.name.endswith(".tmp"):
+                remove_stale_file(entry)
+            elif entry.name.endswith(".npy"):
+                try:
+                    stat_result = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append(
+                    (stat_result.st_mtime, stat_result.st_size, entry.path),
+                )
+        num_bytes = sum(size for _, size, _ in entries)
+        for _, size, filepath in sorted(entries):
+            if num_bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(filepath)
+            except OSError:
+                # Another process has already removed the entry, or the
+                # entry is still open on a platform that prevents this
+                continue
+            num_bytes -= size
+
+
+DISK_CACHE = DiskCache()
+
+
+def remove_stale_file(entry):
+    """
+    Delete the provided temporary file if it is old enough to have been left
+    behind by a process that failed while writing it.
+    """
+    with contextlib.suppress(OSError):
+        if entry.stat().st_mtime < time.time() - STALE_SECONDS:
+            os.remove(entry.path)
+
+
+def update_code_digest(digest, code):
+    """
+    Update the provided digest with the bytecode, the referenced names, and
+    the constants of the provided code object and its nested code objects.
+    """
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode())
+    for constant in code.co_consts:
+        if isinstance(constant, types.CodeType):
+            update_code_digest(digest, constant)
+        else:
+            digest.update(repr(constant).encode())
+
+
+def is_cacheable(function):
+    """
+    Return a Boolean value to indicate whether the results of the provided
+    function can be cached on disk, which excludes lambda functions and
+    functions defined inside other functions, whose results may depend on
+    the values of their closures.
+    """
+    qualname = getattr(function, "__qualname__", None)
+    return qualname is not None and "<" not in qualname
+
+
+def enable_disk_cache(dirpath, max_bytes=2**30):
+    """
+    Enable the on-disk cache of the correlation matrices that the
+    ``correlate`` function computes, in the provided directory and with the
+    provided byte budget.
+    """
+    if max_bytes <= 0:
+        raise ValueError("The byte budget of the cache must be positive")
+    os.makedirs(dirpath, exist_ok=True)
+    DISK_CACHE.dirpath = dirpath
+    DISK_CACHE.max_bytes = max_bytes
+    DISK_CACHE.evict()
+
+
+def disable_disk_cache():
+    """
+    Disable the on-disk cache, without deleting its entries.
+    """
+    DISK_CACHE.dirpath = None
+    DISK_CACHE.max_bytes = 0
+
+
+def call_with_disk_cache(function, matrix):
+    """
+    Return the result of the provided function on the provided matrix, which
+    is loaded from the on-disk cache if possible and stored in it otherwise.
+    """
+    if DISK_CACHE.dirpath is None or not is_cacheable(function):
+        return function(matrix)
+
+    matrix = np.ascontiguousarray(matrix, dtype=float_dtype(matrix))
+    filepath = DISK_CACHE.get_filepath(function, matrix)
+    result = DISK_CACHE.load(filepath)
+    if result is None:
+        result = function(matrix)
+        DISK_CACHE.store(filepath, result)
+
+    return result
@@ -0,0 +1,94 @@
+# Copyright (c) 2022 Dimitrios-Georgios Akestoridis
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Helper module for the floating-point data types of the ``mcdm`` package.
+"""
+
+import contextlib
+import threading
+
+import numpy as np
+
+
+# Floating-point data types that can be selected, the first being the default
+FLOAT_DTYPES = (np.dtype(np.float64), np.dtype(np.float32))
+
+
+class DtypeState(threading.local):
+    # pylint: disable=too-few-public-methods
+    """
+    Thread-local state with the floating-point data type that the methods
+    use in each thread, which is float64 unless another one was selected.
+    """
+    dtype = FLOAT_DTYPES[0]
+
+
+DTYPE = DtypeState()
+
+
+def current_dtype():
+    """
+    Return the floating-point data type that the methods use in the current
+    thread.
+    """
+    return DTYPE.dtype
+
+
+def get_dtype(dtype):
+    """
+    Return the selected floating-point data type, or the data type of the
+    current thread if no data type was selected, after performing sanity
+    checks.
+    """
+    if dtype is None:
+        return current_dtype()
+    try:
+        is_float = np.dtype(dtype) in FLOAT_DTYPES
+    except TypeError:
+        is_float = False
+    if not is_float:
+        raise ValueError("The data type must be either float64 or float32")
+    return np.dtype(dtype)
+
+
+@contextlib.contextmanager
+def select_dtype(dtype):
+    """
+    Return a context manager that makes the methods use the selected
+    floating-point data type in the current thread, and yields it.
+    """
+    previous_dtype = DTYPE.dtype
+    DTYPE.dtype = get_dtype(dtype)
+    try:
+        yield DTYPE.dtype
+    finally:
+        DTYPE.dtype = previous_dtype
+
+
+def float_dtype(array):
+    """
+    Return the floating-point data type of the provided array, which is
+    float32 if it is already a float32 NumPy array and float64 otherwise.
+    """
+    if getattr(array, "dtype", None) == FLOAT_DTYPES[1]:
+        return FLOAT_DTYPES[1]
+    return FLOAT_DTYPES[0]
@@ -0,0 +1,114 @@
+# Copyright (c) 2022 Dimitrios-Georgios Akestoridis
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Helper module for the fused normalization and scoring kernels of the
+``mcdm`` package.
+"""
+
+import numpy as np
+
+from .helper_profiling import profile_stage
+from .helper_registry import get_method
+from .helper_validation import check_normalization_input, is_normalized_vector
+
+
+# Qualified names of the built-in functions that the fused kernel replaces,
+# so that they are not imported in advance
+LINEAR1 = "mcdm.normalization.linear1_method.linear1"
+LINEAR3 = "mcdm.normalization.linear3_method.linear3"
+VECTOR = "mcdm.normalization.vector_method.vector"
+SAW = "mcdm.scoring.saw_method.saw"
+MW = "mcdm.weighting.mw_method.mw"
+
+
+def compute_column_scales(x_matrix, n_name):
+    """
+    Return the value that divides each column of the provided matrix when
+    it is normalized with the scale-only normalization function that has
+    the provided qualified name.
+    """
+    if n_name == LINEAR1:
+        return np.amax(x_matrix, axis=0)
+    if n_name == LINEAR3:
+        return np.sum(x_matrix, axis=0, dtype=np.float64).astype(
+            x_matrix.dtype,
+        )
+    return np.sqrt(
+        np.einsum("ij,ij->j", x_matrix, x_matrix, dtype=np.float64),
+    ).astype(x_matrix.dtype)
+
+
+def is_fusable(is_benefit_x, n_method, w_vector, w_method, s_method):
+    """
+    Return a Boolean value to indicate whether the selected methods can be
+    evaluated with the fused kernel, i.e., whether the normalization method
+    only scales each column, the scores are SAW scores, and the weights do
+    not depend on the normalized matrix.
+    """
+    if n_method is None or s_method is None:
+        return False
+    if get_method("scoring", s_method).qualified_name != SAW:
+        return False
+    if w_vector is None and (
+        w_method is None
+        or get_method("weighting", w_method).qualified_name != MW
+    ):
+        return False
+    n_name = get_method("normalization", n_method).qualified_name
+    if all(is_benefit_x):
+        return n_name in {LINEAR1, LINEAR3, VECTOR}
+    if not any(is_benefit_x):
+        return n_name in {LINEAR3, VECTOR}
+    return False
+
+
+@profile_stage("fused")
+def fused_saw(x_matrix, is_benefit_x, n_method, w_vector):
+    """
+    Return the SAW scores of the provided decision matrix after its
+    normalization with the selected scale-only method, along with whether
+    they should be sorted in descending order, or None if the general
+    pipeline is needed in order to report invalid arguments. The scores are
+    computed as ``x_matrix @ (w_vector / column_scales)``, so that the
+    normalized matrix is never materialized.
+    """
+    n_name = get_method("normalization", n_method).qualified_name
+    check_normalization_input(x_matrix, is_benefit_x, n_method)
+    if w_vector is None:
+        w_vector = np.full(
+            x_matrix.shape[1],
+            1.0 / x_matrix.shape[1],
+            dtype=x_matrix.dtype,
+        )
+    else:
+        w_vector = np.array(w_vector, dtype=x_matrix.dtype)
+        if (
+            w_vector.shape != (x_matrix.shape[1],)
+            or not is_normalized_vector(w_vector)
+        ):
+            return None
+
+    c_scales = compute_column_scales(x_matrix, n_name)
+    if np.any(c_scales == 0.0):
+        return None
+
+    return x_matrix.dot(w_vector / c_scales), all(is_benefit_x)
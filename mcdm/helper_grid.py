@@ -0,0 +1,248 @@
+# Copyright (c) 2022 Dimitrios-Georgios Akestoridis
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Helper module for the evaluation of many combinations of methods of the
+``mcdm`` package.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from .helper_cache import (
+    MemoCache,
+    call_with_cache,
+)
+from .helper_correlation import correlate
+from .helper_normalization import normalize
+from .helper_problem import prepare_problem
+from .helper_registry import (
+    get_method,
+    list_methods,
+)
+from .helper_scoring import score
+from .helper_weighting import weigh
+from .main import sort_alternatives
+
+
+def rank_all(
+    x_matrix,
+    alt_names=None,
+    is_benefit_x=None,
+    n_methods=None,
+    w_methods=None,
+    c_methods=None,
+    s_methods=None,
+    workers=None,
+    skip_invalid=True,
+):
+    """
+    Return a dictionary with the ranking of the alternatives for each
+    combination of the selected normalization, weighting, correlation, and
+    scoring methods, keyed by (n_method, w_method, c_method, s_method)
+    tuples. All the registered methods of a category are selected unless a
+    list of methods is provided. The correlation methods are only combined
+    with weighting methods that use them. Each normalized matrix,
+    correlation matrix, and weight vector is computed once and shared by all
+    the combinations that depend on it, optionally by a pool of threads.
+    Combinations whose methods are not compatible with each other or with
+    the decision matrix are skipped, unless they should raise an exception.
+    """
+    # pylint: disable=too-many-locals
+    x_matrix, alt_names, is_benefit_x, w_vector = prepare_problem(
+        x_matrix,
+        alt_names,
+        is_benefit_x,
+        None,
+    )
+
+    # Build the stages of the evaluation graph, from the normalized matrices
+    # to the rankings, after making sure that all the methods are known
+    n_methods = select_methods("normalization", n_methods)
+    w_nodes = build_weight_nodes(
+        select_methods("weighting", w_methods),
+        select_methods("correlation", c_methods),
+        w_vector,
+    )
+    w_keys = [
+        (n_method, w_method, c_method)
+        for n_method in n_methods
+        for w_method, c_method in w_nodes
+    ]
+    r_keys = [
+        w_key + (s_method,)
+        for w_key in w_keys
+        for s_method in select_methods("scoring", s_methods)
+    ]
+
+    executor = None
+    if workers is not None and workers > 1:
+        executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        r_results = evaluate_graph(
+            executor,
+            (x_matrix, alt_names, is_benefit_x, w_vector),
+            n_methods,
+            w_keys,
+            r_keys,
+        )
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    rankings = {}
+    for r_key, r_result in zip(r_keys, r_results):
+        if not isinstance(r_result, ValueError):
+            rankings[r_key] = r_result
+        elif not skip_invalid:
+            raise r_result
+
+    return rankings
+
+
+def evaluate_graph(executor, problem, n_methods, w_keys, r_keys):
+    """
+    Return the results of the rankings of the evaluation graph, whose stages
+    are evaluated in order, so that the shared memoization cache holds the
+    intermediate results that each stage depends on.
+    """
+    # pylint: disable=too-many-locals
+    x_matrix, alt_names, is_benefit_x, w_vector = problem
+    cache = MemoCache(max_bytes=float("inf"))
+
+    z_tasks = [
+        (normalize, x_matrix, is_benefit_x, n_method)
+        for n_method in n_methods
+    ]
+    z_results = dict(zip(n_methods, run_stage(executor, cache, z_tasks)))
+
+    # The correlation matrices are shared by the weighting methods that use
+    # the same correlation method on the same normalized matrix
+    c_keys = []
+    for n_method, _, c_method in w_keys:
+        if (
+            c_method is not None
+            and (n_method, c_method) not in c_keys
+            and not isinstance(z_results[n_method], ValueError)
+        ):
+            c_keys.append((n_method, c_method))
+    c_tasks = [
+        (correlate, z_results[n_method][0], c_method)
+        for n_method, c_method in c_keys
+    ]
+    run_stage(executor, cache, c_tasks)
+
+    w_tasks = [
+        (select_weights, z_results[w_key[0]], w_vector, *w_key[1:])
+        for w_key in w_keys
+    ]
+    w_results = dict(zip(w_keys, run_stage(executor, cache, w_tasks)))
+
+    r_tasks = [
+        (
+            score_alternatives,
+            z_results[r_key[0]],
+            w_results[r_key[:3]],
+            r_key[3],
+            alt_names,
+        )
+        for r_key in r_keys
+    ]
+    return run_stage(executor, cache, r_tasks)
+
+
+def build_weight_nodes(w_methods, c_methods, w_vector):
+    """
+    Return the (w_method, c_method) pairs of the weighting stage, where the
+    correlation methods are only combined with weighting methods that use
+    them.
+    """
+    if w_vector is not None:
+        # The preset weights of the decision problem replace the weighting
+        return [(None, None)]
+
+    w_nodes = []
+    for w_method in w_methods:
+        if get_method("weighting", w_method).capabilities["correlation"]:
+            w_nodes.extend((w_method, c_method) for c_method in c_methods)
+        else:
+            w_nodes.append((w_method, None))
+
+    return w_nodes
+
+
+def select_methods(category, methods):
+    """
+    Return the list of the selected methods of the provided category, which
+    includes all of its registered methods unless they are provided.
+    """
+    if methods is None:
+        return list_methods(category)
+    for method in methods:
+        if method is not None or category != "normalization":
+            get_method(category, method)
+    return list(methods)
+
+
+def run_stage(executor, cache, tasks):
+    """
+    Return the results of the provided tasks of a stage, which are tuples of
+    a function and its arguments, using the shared memoization cache. The
+    exceptions that the tasks raise due to incompatible methods are returned
+    as their results.
+    """
+    if executor is None:
+        return [run_task(cache, task) for task in tasks]
+    return list(executor.map(run_task, [cache for _ in tasks], tasks))
+
+
+def run_task(cache, task):
+    """
+    Return the result of the provided task, or the exception that it raised
+    due to incompatible methods, including the ones of its dependencies.
+    """
+    function, *args = task
+    for arg in args:
+        if isinstance(arg, ValueError):
+            return arg
+    try:
+        return call_with_cache(cache, function, *args)
+    except ValueError as error:
+        return error
+
+
+def select_weights(z_result, w_vector, w_method, c_method):
+    """
+    Return the preset weight vector, if there is one, or the weight vector
+    of the normalized decision matrix using the selected methods.
+    """
+    if w_vector is not None:
+        return w_vector
+    return weigh(z_result[0], w_method, c_method)
+
+
+def score_alternatives(z_result, w_vector, s_method, alt_names):
+    """
+    Return the ranking of the alternatives of the normalized decision matrix
+    with the provided weight vector using the selected scoring method.
+    """
+    z_matrix, is_benefit_z = z_result
+    s_vector, desc_order = score(z_matrix, is_benefit_z, w_vector, s_method)
+    return sort_alternatives(alt_names, s_vector, desc_order)
@@ -0,0 +1,315 @@
+# Copyright (c) 2022 Dimitrios-Georgios Akestoridis
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Helper module for the incremental ranking of the ``mcdm`` package.
+"""
+
+import operator
+
+import numpy as np
+
+from .correlation.abspearson_method import abspearson
+from .correlation.pearson_method import column_sd, pearson, pearson_row
+from .helper_correlation import correlate
+from .helper_normalization import normalize
+from .helper_problem import prepare_problem
+from .helper_profiling import profile_stage
+from .helper_registry import get_method
+from .helper_validation import (
+    check_saw_matrix,
+    check_saw_weights,
+    check_weighting_input,
+)
+from .helper_weighting import weigh
+from .main import build_ranking, sort_scores
+from .normalization.linear1_method import linear1
+from .normalization.linear2_method import linear2
+from .normalization.linear3_method import linear3
+from .normalization.vector_method import vector
+from .weighting.critic_method import critic, critic_weights
+from .weighting.vic_method import vic, vic_weights
+
+
+# Normalization functions that normalize each column independently
+COLUMN_NORMALIZATIONS = {linear1, linear2, linear3, vector}
+
+# Default correlation method and weight function of the weighting functions
+# that are derived from the sums of correlation coefficients
+CORRELATION_WEIGHTS = {
+    critic: ("Pearson", critic_weights),
+    vic: ("dCor", vic_weights),
+}
+
+
+class IncrementalRanker:
+    # pylint: disable=too-many-instance-attributes
+    """
+    Rank the alternatives of a decision matrix with the SAW method for a
+    sequence of weight vectors and column updates. The scores of the
+    previous ranking are only updated by the contribution of the criteria
+    whose weights or values changed, and the alternatives are re-sorted
+    starting from their previous order. If the weights are derived from the
+    correlation coefficients of the criteria, only the correlation
+    coefficients of updated criteria are recomputed. The scores are
+    recomputed from scratch after the provided number of delta updates, in
+    order to bound the accumulation of floating-point errors.
+    """
+    def __init__(
+        self,
+        x_matrix,
+        alt_names=None,
+        is_benefit_x=None,
+        n_method=None,
+        c_method=None,
+        w_method="MW",
+        refresh_interval=64,
+    ):
+        if refresh_interval < 1:
+            raise ValueError(
+                "The refresh interval must be a positive integer",
+            )
+
+        self.x_matrix, self.alt_names, self.is_benefit_x, w_vector = (
+            prepare_problem(x_matrix, alt_names, is_benefit_x, None)
+        )
+        self.n_method = n_method
+        self.c_method = c_method
+        self.w_method = w_method
+
+        # Normalize the decision matrix once for all weight vectors
+        self.z_matrix, is_benefit_z = normalize(
+            self.x_matrix,
+            self.is_benefit_x,
+            n_method,
+        )
+        check_saw_matrix(self.z_matrix, is_benefit_z)
+        self.desc_order = all(is_benefit_z)
+
+        # Use the weights of a decision problem until others are provided,
+        # instead of the weights of the selected weighting method
+        self.corr_matrix = None
+        self.fixed_w_vector = None
+        self.method_w_vector = None
+        if w_vector is not None:
+            self.fixed_w_vector = self.check_weights(w_vector)
+        else:
+            self.method_w_vector = self.weigh_criteria()
+
+        self.refresh_interval = refresh_interval
+        self.w_vector = None
+        self.num_updates = 0
+        self.s_vector = None
+        self.r_indices = None
+
+    def check_weights(self, w_vector):
+        """
+        Return the provided weight vector as a float64 NumPy array, after
+        performing sanity checks.
+        """
+        w_vector = np.array(w_vector, dtype=np.float64)
+        check_saw_weights(w_vector, self.z_matrix.shape[1])
+        return w_vector
+
+    def rank(self, w_vector=None):
+        """
+        Return the ranking of the alternatives with the provided weight
+        vector, which defaults to the previously provided weight vector or
+        to the weights of the selected weighting method.
+        """
+        if w_vector is not None:
+            self.fixed_w_vector = self.check_weights(w_vector)
+        if self.fixed_w_vector is not None:
+            w_vector = self.fixed_w_vector
+        else:
+            w_vector = self.method_w_vector
+
+        self.rescore(w_vector)
+        self.resort()
+
+        return build_ranking(self.alt_names, self.s_vector, self.r_indices)
+
+    @profile_stage("score")
+    def rescore(self, w_vector):
+        """
+        Update the scores of the alternatives for the provided weight vector.
+        """
+        if self.s_vector is None:
+            changed = None
+        else:
+            changed = np.flatnonzero(w_vector != self.w_vector)
+
+        if (
+            changed is None
+            or self.num_updates >= self.refresh_interval
+            or 2 * changed.size > w_vector.size
+        ):
+            # Compute the scores from scratch
+            self.s_vector = self.z_matrix.dot(w_vector)
+            self.num_updates = 0
+        elif changed.size > 0:
+            # Add the change of the contribution of each changed criterion
+            self.s_vector += self.z_matrix[:, changed].dot(
+                w_vector[changed] - self.w_vector[changed],
+            )
+            self.num_updates += 1
+
+        self.w_vector = w_vector
+
+    @profile_stage("sort")
+    def resort(self):
+        """
+        Update the order of the alternatives according to their scores.
+        """
+        if self.r_indices is None:
+            self.r_indices = sort_scores(self.s_vector, self.desc_order)
+            return
+
+        # Sorting the scores in their previous order is faster than sorting
+        # them from scratch, because only a few of them are out of place
+        s_sorted = self.s_vector[self.r_indices]
+        if self.desc_order:
+            s_sorted = -s_sorted
+        order = np.argsort(s_sorted, kind="stable")
+        r_indices = self.r_indices[order]
+        s_sorted = s_sorted[order]
+
+        # Tied scores keep their previous order, which already sorts them by
+        # the indices of their alternatives, as in the sort_scores function,
+        # unless their scores have only now become tied
+        is_misordered = (s_sorted[1:] == s_sorted[:-1]) & (
+            r_indices[1:] < r_indices[:-1]
+        )
+        if np.any(is_misordered):
+            r_indices = r_indices[np.lexsort((r_indices, s_sorted))]
+        self.r_indices = r_indices
+
+    def update_column(self, j_col, x_column):
+        """
+        Replace the values of the selected criterion with the provided
+        values and update the normalized matrix, the weights of the selected
+        weighting method, and the scores accordingly.
+        """
+        j_col = operator.index(j_col)
+        if not 0 <= j_col < self.x_matrix.shape[1]:
+            raise ValueError(
+                "The index of the criterion is out of range ({})".format(
+                    j_col,
+                ),
+            )
+        x_column = np.array(x_column, dtype=np.float64)
+        if x_column.shape != (self.x_matrix.shape[0],):
+            raise ValueError(
+                "The number of values of the criterion does not match the "
+                + "number of rows in the decision matrix",
+            )
+
+        if (
+            self.n_method is not None
+            and get_method("normalization", self.n_method).function
+            not in COLUMN_NORMALIZATIONS
+        ):
+            # The normalization of each criterion may depend on all
+            # criteria, so the scores and weights are recomputed from scratch
+            x_matrix = np.copy(self.x_matrix)
+            x_matrix[:, j_col] = x_column
+            z_matrix, _ = normalize(
+                x_matrix,
+                self.is_benefit_x,
+                self.n_method,
+            )
+            check_saw_matrix(z_matrix, [self.desc_order])
+            self.x_matrix = x_matrix
+            self.z_matrix = z_matrix
+            self.s_vector = None
+            if self.fixed_w_vector is None:
+                self.method_w_vector = self.weigh_criteria()
+            return
+
+        # Normalize only the updated criterion, into an output array so
+        # that the single-use result is not memoized
+        z_column, _ = normalize(
+            x_column[:, np.newaxis],
+            [self.is_benefit_x[j_col]],
+            self.n_method,
+            dtype=self.z_matrix.dtype,
+            out=np.empty((x_column.shape[0], 1), dtype=self.z_matrix.dtype),
+        )
+        check_saw_matrix(z_column, [self.desc_order])
+        self.x_matrix[:, j_col] = x_column
+        z_delta = z_column[:, 0] - self.z_matrix[:, j_col]
+        self.z_matrix[:, j_col] = z_column[:, 0]
+
+        # Update the contribution of the criterion to the scores
+        if self.s_vector is not None:
+            self.s_vector += self.w_vector[j_col] * z_delta
+            self.num_updates += 1
+
+        if self.fixed_w_vector is None:
+            self.method_w_vector = self.weigh_criteria(j_col)
+
+    def weigh_criteria(self, j_col=None):
+        """
+        Return the weights of the selected weighting method. If the index of
+        an updated criterion is provided and the weights are derived from
+        the sums of correlation coefficients, only the correlation
+        coefficients of that criterion are recomputed.
+        """
+        w_function = get_method("weighting", self.w_method).function
+        if w_function not in CORRELATION_WEIGHTS:
+            return weigh(self.z_matrix, self.w_method, self.c_method)
+
+        c_method, weight_function = CORRELATION_WEIGHTS[w_function]
+        if self.c_method is not None:
+            c_method = self.c_method
+        if j_col is None:
+            check_weighting_input(self.z_matrix, c_method, self.w_method)
+            self.corr_matrix = np.array(correlate(self.z_matrix, c_method))
+        else:
+            self.update_correlations(j_col, c_method)
+
+        return weight_function(
+            column_sd(self.z_matrix),
+            np.sum(self.corr_matrix, axis=1),
+        )
+
+    def update_correlations(self, j_col, c_method):
+        """
+        Recompute the correlation coefficients of the selected criterion
+        with all criteria.
+        """
+        c_function = get_method("correlation", c_method).function
+        if c_function is pearson:
+            corr_row = pearson_row(self.z_matrix, j_col)
+            self.corr_matrix[j_col, :] = corr_row
+            self.corr_matrix[:, j_col] = corr_row
+        elif c_function is abspearson:
+            corr_row = np.absolute(pearson_row(self.z_matrix, j_col))
+            self.corr_matrix[j_col, :] = corr_row
+            self.corr_matrix[:, j_col] = corr_row
+        else:
+            # Compute the coefficients of each pair of criteria separately,
+            # bypassing the memoization and on-disk caches, which would
+            # otherwise be filled with entries that are never used again
+            for l_col in range(self.z_matrix.shape[1]):
+                corr_pair = c_function(self.z_matrix[:, [j_col, l_col]])
+                self.corr_matrix[j_col, l_col] = corr_pair[0, 1]
+                self.corr_matrix[l_col, j_col] = corr_pair[1, 0]
@@ -0,0 +1,47 @@
+# Copyright (c) 2022 Dimitrios-Georgios Akestoridis
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Helper module for the lazy loading of the modules of the ``mcdm`` package.
+"""
+
+import importlib
+
+
+def load_attribute(namespace, lazy_attributes, name):
+    """
+    Import the module that provides the selected attribute of a package,
+    store the attribute in the namespace of the package, and return it.
+    """
+    if name not in lazy_attributes:
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(
+                namespace["__name__"],
+                name,
+            ),
+        )
+    module = importlib.import_module(
+        lazy_attributes[name],
+        namespace["__name__"],
+    )
+    value = getattr(module, name)
+    namespace[name] = value
+    return value
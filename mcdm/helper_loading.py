@@ -0,0 +1,427 @@
+# Copyright (c) 2022 Dimitrios-Georgios Akestoridis
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Helper module for the loading functions of the ``mcdm`` package.
+"""
+
+import csv
+
+import numpy as np
+
+
+# Whether np.loadtxt is backed by the C parser of NumPy 1.23 or later, since
+# its earlier pure-Python implementation is slower than splitting each line
+FAST_LOADTXT = tuple(
+    int(part) for part in np.__version__.split(".")[:2]
+) >= (1, 23)
+
+
+def detect_compression(filepath):
+    """
+    Return the name of the compression format of the provided file, based on
+    its magic number, or None if the file is not compressed.
+    """
+    with open(filepath, mode="rb") as fp:
+        head = fp.read(10)
+    if head.startswith(b"\x1f\x8b"):
+        return "gzip"
+    if head.startswith(b"BZh") and head[4:10] == b"1AY&SY":
+        return "bz2"
+    if head.startswith(b"\xfd7zXZ\x00"):
+        return "xz"
+    if head.startswith(b"\x28\xb5\x2f\xfd"):
+        return "zstd"
+    return None
+
+
+def open_text(filepath):
+    """
+    Return a text stream for the provided file, which is decompressed on the
+    fly if it is compressed with gzip, bzip2, xz, or Zstandard.
+    """
+    # The decompression modules are only imported when they are needed
+    # pylint: disable=import-outside-toplevel
+    compression = detect_compression(filepath)
+    if compression == "gzip":
+        import gzip
+        return gzip.open(filepath, mode="rt", encoding="utf-8")
+    elif compression == "bz2":
+        import bz2
+        return bz2.open(filepath, mode="rt", encoding="utf-8")
+    elif compression == "xz":
+        import lzma
+        return lzma.open(filepath, mode="rt", encoding="utf-8")
+    elif compression == "zstd":
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError(
+                "The zstandard package is required in order to load "
+                + "Zstandard-compressed files",
+            ) from None
+        return zstandard.open(filepath, mode="rt", encoding="utf-8")
+    return open(filepath, mode="r", encoding="utf-8")
+
+
+def read_header(fp, delimiter, skiprows, header, labeled_rows):
+    """
+    Skip the selected number of rows of a text stream and return a dictionary
+    with the parsed values of the header rows that follow them, whose kinds
+    are provided in order.
+    """
+    for _ in range(skiprows):
+        fp.readline()
+
+    header_values = {}
+    num_fields = None
+    for i, kind in enumerate(header, start=skiprows + 1):
+        if kind not in {"names", "types", "weights"}:
+            raise ValueError("Unknown header row ({})".format(kind))
+        if kind in header_values:
+            raise ValueError("Duplicate header row ({})".format(kind))
+
+        fields = split_header_line(fp.readline(), delimiter)
+
+        # The first column of labeled rows contains the header of the labels
+        if labeled_rows:
+            fields = fields[1:]
+
+        # Perform sanity checks
+        if num_fields is None:
+            num_fields = len(fields)
+        if len(fields) != num_fields:
+            raise ValueError(
+                "Wrong number of columns at line {}".format(i),
+            )
+
+        header_values[kind] = parse_header_fields(kind, fields, i)
+
+    return header_values
+
+
+def split_header_line(line, delimiter):
+    """
+    Return the stripped fields of the provided header line.
+    """
+    line = line.rstrip("\r\n")
+    if delimiter is None:
+        return line.split()
+    return [
+        field.strip()
+        for field in next(csv.reader([line], delimiter=delimiter))
+    ]
+
+
+def parse_header_fields(kind, fields, line_number):
+    """
+    Return the criterion names, the criterion types, or the weights that are
+    contained in the provided fields of a header row.
+    """
+    if kind == "types":
+        is_benefit_x = []
+        for field in fields:
+            if field.lower() not in {"benefit", "cost"}:
+                raise ValueError(
+                    "Invalid criterion type at line {}".format(line_number),
+                )
+            is_benefit_x.append(field.lower() == "benefit")
+        return is_benefit_x
+    elif kind == "weights":
+        try:
+            return np.array(fields, dtype=np.float64)
+        except ValueError:
+            raise ValueError(
+                "Invalid weight at line {}".format(line_number),
+            ) from None
+    return fields
+
+
+def read_labeled_chunks(
+    fp,
+    delimiter,
+    skiprows,
+    chunk_rows=65536,
+    first_line=1,
+    num_columns=None,
+):
+    """
+    Yield the float64 matrix data and the row labels of consecutive chunks
+    of rows from a text stream whose first column contains the row labels.
+    The first line of the stream is numbered according to the provided
+    value, and the expected number of columns is inferred from the first row
+    unless it is provided.
+    """
+    row_labels = []
+    data_lines = []
+    line_numbers = []
+    for i, line in iter_records(fp, first_line):
+        # Skip the selected number of rows
+        if i <= skiprows:
+            continue
+
+        # The row labels are expected to be
+        # in the first column of the text file
+        label, data_line, row_length = split_labeled_line(line, delimiter)
+
+        # Determine the expected number of columns
+        if num_columns is None:
+            num_columns = row_length - 1
+
+        # Perform sanity checks
+        if row_length <= 1:
+            raise ValueError(
+                "The matrix should have at least 1 column with data",
+            )
+        if row_length - 1 != num_columns:
+            raise ValueError(
+                "Wrong number of columns at line {}".format(i),
+            )
+        if isinstance(data_line, list):
+            data_line = join_fields(data_line, delimiter, i)
+        if not data_line.strip():
+            raise ValueError(
+                "Missing value at line {}".format(i),
+            )
+
+        row_labels.append(label)
+        data_lines.append(data_line)
+        line_numbers.append(i)
+        if len(data_lines) == chunk_rows:
+            yield parse_lines(data_lines, delimiter, line_numbers), row_labels
+            row_labels = []
+            data_lines = []
+            line_numbers = []
+
+    if data_lines:
+        yield parse_lines(data_lines, delimiter, line_numbers), row_labels
+
+
+def iter_records(fp, first_line=1):
+    """
+    Yield the number of the first line and the text of each record of a text
+    stream, joining consecutive lines while a quoted field is left open, as
+    the csv module does.
+    """
+    record_lines = []
+    record_number = first_line
+    is_quoted = False
+    for i, line in enumerate(fp, start=first_line):
+        if not record_lines:
+            record_number = i
+        record_lines.append(line)
+        if line.count('"') % 2 == 1:
+            is_quoted = not is_quoted
+        if not is_quoted:
+            yield record_number, "".join(record_lines)
+            record_lines = []
+
+    if record_lines:
+        yield record_number, "".join(record_lines)
+
+
+def read_unlabeled_chunks(
+    fp,
+    delimiter,
+    skiprows,
+    chunk_rows=65536,
+    first_line=1,
+    num_columns=None,
+):
+    """
+    Yield the float64 matrix data of consecutive chunks of rows from a text
+    stream without row labels, ignoring empty lines and comments. The first
+    line of the stream is numbered according to the provided value, and the
+    expected number of columns is inferred from the first row unless it is
+    provided.
+    """
+    data_lines = []
+    line_numbers = []
+    for i, line in enumerate(fp, start=first_line):
+        # Skip the selected number of rows
+        if i <= skiprows:
+            continue
+
+        # Skip lines that do not contain any data
+        content = line.split("#", 1)[0]
+        if not content.strip():
+            continue
+
+        # Perform sanity checks
+        row_length = count_fields(content, delimiter)
+        if num_columns is None:
+            num_columns = row_length
+        if row_length != num_columns:
+            raise ValueError(
+                "Wrong number of columns at line {}".format(i),
+            )
+
+        data_lines.append(content)
+        line_numbers.append(i)
+        if len(data_lines) == chunk_rows:
+            yield parse_lines(data_lines, delimiter, line_numbers), None
+            data_lines = []
+            line_numbers = []
+
+    if data_lines:
+        yield parse_lines(data_lines, delimiter, line_numbers), None
+
+
+def count_fields(content, delimiter):
+    """
+    Return the number of fields in the provided line of an unlabeled matrix.
+    """
+    if delimiter is None:
+        return len(content.split())
+    return content.count(delimiter) + 1
+
+
+def split_labeled_line(line, delimiter):
+    """
+    Return the label of the provided line, the rest of the line, or the list
+    of its remaining fields if it contains other quoted fields, and the
+    number of fields in the line.
+    """
+    num_quotes = line.count('"')
+    if num_quotes == 0:
+        # Fast path for lines without any quoted fields
+        label, separator, data_line = line.partition(delimiter)
+        if separator:
+            return label, data_line, data_line.count(delimiter) + 2
+        return label.rstrip("\r\n"), "", 1 if label.strip("\r\n") else 0
+
+    if num_quotes == 2 and line.startswith('"'):
+        # Fast path for lines whose label is the only quoted field
+        label, separator, data_line = line[1:].partition('"' + delimiter)
+        if separator:
+            return label, data_line, data_line.count(delimiter) + 2
+
+    # Other quoted fields are handled according to the rules of the csv
+    # module, and their values may contain the delimiter
+    rows = list(
+        csv.reader(line.splitlines(keepends=True), delimiter=delimiter),
+    )
+    row = rows[0] if rows else []
+    if len(row) <= 1:
+        return "".join(row), "", len(row)
+    return row[0], row[1:], len(row)
+
+
+def join_fields(fields, delimiter, line_number):
+    """
+    Return a line with the values of the provided fields, which are
+    converted to float64 first, so that a delimiter within a quoted field
+    cannot split it, using the line number to report any invalid values.
+    """
+    try:
+        values = [float(field) for field in fields]
+    except ValueError:
+        raise ValueError(
+            "Invalid value at line {}".format(line_number),
+        ) from None
+    return delimiter.join(repr(value) for value in values)
+
+
+def parse_lines(data_lines, delimiter, line_numbers):
+    """
+    Return a float64 NumPy array with the values of the provided lines,
+    using their line numbers to report any invalid values.
+    """
+    try:
+        return convert_lines(data_lines, delimiter)
+    except ValueError:
+        # Report the first line that contains an invalid value
+        line_number = next(
+            (
+                line_number
+                for data_line, line_number in zip(data_lines, line_numbers)
+                if not is_float_line(data_line, delimiter)
+            ),
+            line_numbers[-1],
+        )
+        raise ValueError(
+            "Invalid value at line {}".format(line_number),
+        ) from None
+
+
+def is_float_line(data_line, delimiter):
+    """
+    Return a Boolean value to indicate whether all the values of the
+    provided line can be converted to float64 or not.
+    """
+    try:
+        convert_lines([data_line], delimiter)
+    except ValueError:
+        return False
+    return True
+
+
+def convert_lines(data_lines, delimiter):
+    """
+    Return a float64 NumPy array with the values of the provided lines,
+    which are parsed by np.loadtxt if it is backed by a C parser and split
+    into fields otherwise.
+    """
+    if FAST_LOADTXT:
+        return np.loadtxt(
+            data_lines,
+            dtype=np.float64,
+            delimiter=delimiter,
+            comments=None,
+            ndmin=2,
+        )
+    return np.array(
+        [data_line.split(delimiter) for data_line in data_lines],
+        dtype=np.float64,
+        ndmin=2,
+    )
+
+
+def stack_chunks(chunks, dtype=np.float64):
+    """
+    Return the concatenation of the provided chunks of matrix data and row
+    labels, with the provided data type, using a preallocated buffer that
+    grows geometrically.
+    """
+    row_labels = []
+    buffer = None
+    num_rows = 0
+    for chunk_data, chunk_labels in chunks:
+        if buffer is None:
+            buffer = np.empty(chunk_data.shape, dtype=dtype)
+        elif num_rows + chunk_data.shape[0] > buffer.shape[0]:
+            buffer.resize(
+                (
+                    max(2 * buffer.shape[0], num_rows + chunk_data.shape[0]),
+                    buffer.shape[1],
+                ),
+                refcheck=False,
+            )
+        buffer[num_rows:num_rows + chunk_data.shape[0]] = chunk_data
+        num_rows += chunk_data.shape[0]
+        row_labels.extend(chunk_labels)
+
+    if buffer is None:
+        return np.array([], dtype=dtype), row_labels
+
+    # Release the unused capacity of the buffer
+    buffer.resize((num_rows, buffer.shape[1]), refcheck=False)
+    return buffer, row_labels
@@ -25,29 +25,119 @@ Helper module for the normalization methods of the ``mcdm`` package.
 
 import numpy as np
 
-from . import normalization
-from .helper_validation import check_normalization_input
+from .helper_cache import memoize
+from .helper_dtype import select_dtype
+from .helper_profiling import profile_stage
+from .helper_quantization import QuantizedMatrix
+from .helper_registry import get_method
+from .helper_validation import (
+    check_normalization_input,
+    check_preallocated_array,
+)
 
 
-def normalize(x_matrix, is_benefit_x, n_method):
+@profile_stage("normalize")
+def normalize(
+    x_matrix,
+    is_benefit_x,
+    n_method,
+    dtype=None,
+    quantize=None,
+    out=None,
+    inplace=False,
+):
     """
     Return the normalized version of the provided matrix using the selected
-    normalization method.
+    normalization method, computed with the selected floating-point data
+    type. If the data type of the codes is selected for the quantization,
+    i.e., either uint8 or uint16, the normalized matrix is returned as a
+    quantized matrix. If an output array is provided, or if the provided
+    matrix should be normalized in place, the normalized matrix is written
+    into that array without being memoized.
     """
-    # Use the selected normalization method
-    if n_method is None:
-        # Perform sanity checks
-        x_matrix = np.array(x_matrix, dtype=np.float64)
-        check_normalization_input(x_matrix, is_benefit_x, None)
-
-        return np.copy(x_matrix), is_benefit_x.copy()
-    elif n_method.upper() == "LINEAR1":
-        return normalization.linear1(x_matrix, is_benefit_x)
-    elif n_method.upper() == "LINEAR2":
-        return normalization.linear2(x_matrix, is_benefit_x)
-    elif n_method.upper() == "LINEAR3":
-        return normalization.linear3(x_matrix, is_benefit_x)
-    elif n_method.upper() == "VECTOR":
-        return normalization.vector(x_matrix, is_benefit_x)
+    if inplace and out is not None:
+        raise ValueError(
+            "An output array must not be provided when the matrix is "
+            + "normalized in place",
+        )
+    if out is None and not inplace:
+        z_matrix, is_benefit_z = normalize_matrix(
+            x_matrix,
+            is_benefit_x,
+            n_method,
+            dtype=dtype,
+        )
     else:
-        raise ValueError("Unknown normalization method ({})".format(n_method))
+        z_matrix, is_benefit_z = normalize_into(
+            x_matrix,
+            is_benefit_x,
+            n_method,
+            x_matrix if inplace else out,
+            dtype=dtype,
+            inplace=inplace,
+        )
+    if quantize is None:
+        return z_matrix, is_benefit_z
+    return QuantizedMatrix(z_matrix, quantize), is_benefit_z
+
+
+@memoize
+def normalize_matrix(x_matrix, is_benefit_x, n_method, dtype=None):
+    """
+    Return the normalized version of the provided matrix using the selected
+    normalization method, computed with the selected floating-point data
+    type.
+    """
+    with select_dtype(dtype) as selected_dtype:
+        # Use the selected normalization method
+        if n_method is None:
+            # Perform sanity checks
+            x_matrix = np.array(x_matrix, dtype=selected_dtype)
+            check_normalization_input(x_matrix, is_benefit_x, None)
+
+            return np.copy(x_matrix), is_benefit_x.copy()
+        return get_method("normalization", n_method).function(
+            x_matrix,
+            is_benefit_x,
+        )
+
+
+def normalize_into(
+    x_matrix,
+    is_benefit_x,
+    n_method,
+    out,
+    dtype=None,
+    inplace=False,
+):
+    """
+    Write the normalized version of the provided matrix into the provided
+    output array of the selected floating-point data type and return it. The
+    output array must not share memory with the provided matrix, unless it
+    is the provided matrix itself and the matrix is normalized in place.
+    Methods without the ``preallocated_arrays`` capability still allocate
+    their result, which is then copied into the output array.
+    """
+    with select_dtype(dtype) as selected_dtype:
+        x_matrix = np.asarray(x_matrix, dtype=selected_dtype)
+        check_preallocated_array(
+            out,
+            x_matrix.shape,
+            selected_dtype,
+            "output array",
+            None if inplace and out is x_matrix else x_matrix,
+        )
+
+        # Use the selected normalization method
+        if n_method is None:
+            # Perform sanity checks
+            check_normalization_input(x_matrix, is_benefit_x, None)
+
+            np.copyto(out, x_matrix)
+            return out, is_benefit_x.copy()
+        method = get_method("normalization", n_method)
+        if method.capabilities["preallocated_arrays"]:
+            return method.function(x_matrix, is_benefit_x, out=out)
+        z_matrix, is_benefit_z = method.function(x_matrix, is_benefit_x)
+        np.copyto(out, z_matrix)
+        return out, is_benefit_z
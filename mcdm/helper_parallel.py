@@ -0,0 +1,194 @@
+# Copyright (c) 2022 Dimitrios-Georgios Akestoridis
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Helper module for the parallel loading functions of the ``mcdm`` package.
+"""
+
+import io
+import os
+
+import numpy as np
+
+from .helper_loading import (
+    count_fields,
+    read_labeled_chunks,
+    read_unlabeled_chunks,
+    split_labeled_line,
+    stack_chunks,
+)
+
+
+def load_parallel(
+    filepath,
+    delimiter,
+    skiprows,
+    labeled_rows,
+    workers,
+    num_parts=None,
+    dtype=np.float64,
+):
+    """
+    Return a matrix with the provided data type, and potentially row labels,
+    from a text file whose byte ranges are parsed by a pool of worker
+    processes.
+    """
+    # Split the file into byte ranges that start at the beginning of a line
+    if num_parts is None:
+        num_parts = max(
+            1,
+            min(4 * workers, os.path.getsize(filepath) // 2**20),
+        )
+    byte_ranges = split_file(filepath, skiprows, num_parts)
+
+    # All the byte ranges are checked against the first row of the matrix
+    num_columns = count_columns(filepath, delimiter, skiprows, labeled_rows)
+    if num_columns is None:
+        return np.array([], dtype=dtype), [] if labeled_rows else None
+
+    # The multiprocessing machinery is only imported when it is needed
+    # pylint: disable-next=import-outside-toplevel
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunks = executor.map(
+            parse_range,
+            [filepath for _ in byte_ranges],
+            byte_ranges,
+            [delimiter for _ in byte_ranges],
+            [labeled_rows for _ in byte_ranges],
+            [num_columns for _ in byte_ranges],
+        )
+
+        # The parsed byte ranges are stitched back in their original order
+        matrix, row_labels = stack_chunks(chunks, dtype=dtype)
+
+    if not labeled_rows:
+        # Follow the conventions of the np.loadtxt function
+        row_labels = None
+        if matrix.ndim == 2 and 1 in matrix.shape:
+            matrix = np.squeeze(matrix)
+
+    return matrix, row_labels
+
+
+def split_file(filepath, skiprows, num_parts):
+    """
+    Return a list of byte ranges, together with the number of their first
+    line, that split the provided file at line boundaries after skipping the
+    selected number of rows.
+    """
+    with open(filepath, mode="rb") as fp:
+        # Skip the selected number of rows
+        for _ in range(skiprows):
+            fp.readline()
+        start = fp.tell()
+        file_size = os.fstat(fp.fileno()).st_size
+
+        # Move each boundary to the beginning of the next line
+        boundaries = [start]
+        for k in range(1, num_parts):
+            fp.seek(max(start + (file_size - start) * k // num_parts - 1, 0))
+            fp.readline()
+            if boundaries[-1] < fp.tell() < file_size:
+                boundaries.append(fp.tell())
+        boundaries.append(file_size)
+
+        # Count the lines of each byte range to number their first lines
+        byte_ranges = []
+        first_line = skiprows + 1
+        for i in range(len(boundaries) - 1):
+            byte_ranges.append((boundaries[i], boundaries[i + 1], first_line))
+            first_line += count_newlines(fp, boundaries[i], boundaries[i + 1])
+
+    return byte_ranges
+
+
+def count_newlines(fp, start, end, block_size=2**24):
+    """
+    Return the number of newline characters in a byte range of the provided
+    binary stream.
+    """
+    fp.seek(start)
+    num_newlines = 0
+    remaining = end - start
+    while remaining > 0:
+        block = fp.read(min(block_size, remaining))
+        num_newlines += block.count(b"\n")
+        remaining -= len(block)
+    return num_newlines
+
+
+def count_columns(filepath, delimiter, skiprows, labeled_rows):
+    """
+    Return the number of columns with data in the first row of the matrix,
+    or None if the file does not contain any rows.
+    """
+    with open(filepath, mode="r", encoding="utf-8") as fp:
+        for i, line in enumerate(fp, start=1):
+            # Skip the selected number of rows
+            if i <= skiprows:
+                continue
+
+            if labeled_rows:
+                return split_labeled_line(line, delimiter)[2] - 1
+
+            # Skip lines that do not contain any data
+            content = line.split("#", 1)[0]
+            if content.strip():
+                return count_fields(content, delimiter)
+
+    return None
+
+
+def parse_range(filepath, byte_range, delimiter, labeled_rows, num_columns):
+    """
+    Return the matrix data and the row labels of a byte range of the
+    provided file.
+    """
+    start, end, first_line = byte_range
+    with open(filepath, mode="rb") as fp:
+        fp.seek(start)
+        data = fp.read(end - start)
+
+    text_fp = io.TextIOWrapper(io.BytesIO(data), encoding="utf-8")
+    if labeled_rows:
+        chunks = read_labeled_chunks(
+            text_fp,
+            delimiter,
+            0,
+            first_line=first_line,
+            num_columns=num_columns,
+        )
+    else:
+        chunks = read_unlabeled_chunks(
+            text_fp,
+            delimiter,
+            0,
+            first_line=first_line,
+            num_columns=num_columns,
+        )
+    matrix, row_labels = stack_chunks(
+        (chunk_data, chunk_labels or [])
+        for chunk_data, chunk_labels in chunks
+    )
+
+    return matrix.reshape((-1, num_columns)), row_labels
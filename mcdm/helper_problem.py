@@ -0,0 +1,129 @@
+# Copyright (c) 2022 Dimitrios-Georgios Akestoridis
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Helper module for the decision problems of the ``mcdm`` package.
+"""
+
+import numpy as np
+
+from .helper_dtype import get_dtype
+
+
+class DecisionProblem:
+    # pylint: disable=too-few-public-methods
+    """
+    Decision matrix together with the names of its alternatives and
+    criteria, the types of its criteria, and potentially preset weights,
+    which the ``rank`` function uses unless they are explicitly overridden.
+    """
+    def __init__(
+        self,
+        x_matrix,
+        alt_names=None,
+        criteria_names=None,
+        is_benefit_x=None,
+        w_vector=None,
+    ):
+        num_columns = None
+        if getattr(x_matrix, "ndim", 0) == 2:
+            num_columns = x_matrix.shape[1]
+        for name, value in [
+            ("criterion names", criteria_names),
+            ("criterion types", is_benefit_x),
+            ("weights", w_vector),
+        ]:
+            if (
+                num_columns is not None
+                and value is not None
+                and len(value) != num_columns
+            ):
+                raise ValueError(
+                    "The number of {} does not match ".format(name)
+                    + "the number of columns in the decision matrix",
+                )
+
+        self.x_matrix = x_matrix
+        self.alt_names = alt_names
+        self.criteria_names = criteria_names
+        self.is_benefit_x = is_benefit_x
+        self.w_vector = w_vector
+
+    def __repr__(self):
+        return (
+            "DecisionProblem(shape={}, ".format(self.x_matrix.shape)
+            + "criteria_names={}, ".format(self.criteria_names)
+            + "is_benefit_x={})".format(self.is_benefit_x)
+        )
+
+
+def unpack_problem(x_matrix, alt_names, is_benefit_x, w_vector):
+    """
+    Return the decision matrix, the names of the alternatives, the types of
+    the criteria, and the weights, which are taken from the provided decision
+    problem unless they are explicitly provided.
+    """
+    if not isinstance(x_matrix, DecisionProblem):
+        return x_matrix, alt_names, is_benefit_x, w_vector
+    if alt_names is None:
+        alt_names = x_matrix.alt_names
+    if is_benefit_x is None:
+        is_benefit_x = x_matrix.is_benefit_x
+    if w_vector is None:
+        w_vector = x_matrix.w_vector
+    return x_matrix.x_matrix, alt_names, is_benefit_x, w_vector
+
+
+def prepare_problem(
+    x_matrix,
+    alt_names,
+    is_benefit_x,
+    w_vector,
+    dtype=None,
+):
+    """
+    Return the decision matrix with the selected floating-point data type,
+    the names of the alternatives, the types of the criteria, and the weights
+    of the provided decision matrix or decision problem, after performing
+    sanity checks and filling in the default names and types.
+    """
+    x_matrix, alt_names, is_benefit_x, w_vector = unpack_problem(
+        x_matrix,
+        alt_names,
+        is_benefit_x,
+        w_vector,
+    )
+
+    # Perform sanity checks
+    x_matrix = np.array(x_matrix, dtype=get_dtype(dtype))
+    if alt_names is None:
+        alt_names = ["a" + str(i + 1) for i in range(x_matrix.shape[0])]
+    if len(alt_names) != x_matrix.shape[0]:
+        raise ValueError(
+            "The number of names for the alternatives does not match the "
+            + "number of rows in the decision matrix",
+        )
+
+    # If not specified, consider all criteria as benefit criteria
+    if is_benefit_x is None:
+        is_benefit_x = [True for _ in range(x_matrix.shape[1])]
+
+    return x_matrix, alt_names, is_benefit_x, w_vector
@@ -0,0 +1,186 @@
+# Copyright (c) 2022 Dimitrios-Georgios Akestoridis
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Helper module for the profiling of the stages of the ``mcdm`` package.
+"""
+
+import functools
+import json
+import threading
+import time
+import tracemalloc
+
+
+class ProfilingState(threading.local):
+    # pylint: disable=too-few-public-methods
+    """
+    Thread-local state with the active profiler of each thread, which is
+    None while profiling is disabled.
+    """
+    profiler = None
+
+
+PROFILING = ProfilingState()
+
+
+class Profiler:
+    """
+    Context manager that records the wall time, the CPU time, and, if
+    memory tracing is enabled, the peak number of bytes allocated by each
+    stage that is executed in its thread, i.e., normalize, correlate, weigh,
+    score, sort, and build, or fused when the normalization is folded into
+    the scoring. The records of nested stages are included in the records of
+    their outer stages, e.g., the correlate stage is part of the weigh
+    stage. The optional callback is called with each record as soon as its
+    stage is completed. Memory tracing with the tracemalloc module is
+    disabled by default, because it slows down every allocation and thus
+    inflates the recorded times, so the memory of a pipeline should be
+    profiled in a separate run from its times.
+    """
+    def __init__(self, callback=None, trace_memory=False):
+        self.callback = callback
+        self.trace_memory = trace_memory
+        self.records = []
+        self.peaks = []
+        self.previous = None
+        self.started_tracing = False
+
+    def __enter__(self):
+        self.previous = PROFILING.profiler
+        PROFILING.profiler = self
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.started_tracing = True
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        PROFILING.profiler = self.previous
+        self.previous = None
+        if self.started_tracing:
+            tracemalloc.stop()
+            self.started_tracing = False
+        return False
+
+    def run(self, stage, function, *args, **kwargs):
+        """
+        Return the result of the provided function and record its execution
+        as the provided stage.
+        """
+        start_bytes = self.start_tracing()
+        start_wall = time.perf_counter()
+        start_cpu = time.process_time()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            wall_time = time.perf_counter() - start_wall
+            cpu_time = time.process_time() - start_cpu
+            self.record(
+                {
+                    "stage": stage,
+                    "wall_time": wall_time,
+                    "cpu_time": cpu_time,
+                    "bytes": self.stop_tracing(start_bytes),
+                },
+            )
+
+    def start_tracing(self):
+        """
+        Return the number of traced bytes at the start of a stage, after
+        folding the peak of the outer stage into its running peak.
+        """
+        if not tracemalloc.is_tracing():
+            return None
+        current, peak = tracemalloc.get_traced_memory()
+        if self.peaks:
+            self.peaks[-1] = max(self.peaks[-1], peak)
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+            peak = current
+        self.peaks.append(peak)
+        return current
+
+    def stop_tracing(self, start_bytes):
+        """
+        Return the peak number of bytes that were allocated during a stage,
+        which is None if memory tracing was disabled at its start.
+        """
+        if start_bytes is None:
+            return None
+        peak = self.peaks.pop()
+        if tracemalloc.is_tracing():
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+        if self.peaks:
+            self.peaks[-1] = max(self.peaks[-1], peak)
+        return max(peak - start_bytes, 0)
+
+    def record(self, record):
+        """
+        Store the provided record and pass it to the callback.
+        """
+        self.records.append(record)
+        if self.callback is not None:
+            self.callback(record)
+
+    def as_dict(self):
+        """
+        Return a dictionary that maps each stage to its number of calls and
+        its total wall time, CPU time, and peak number of allocated bytes.
+        """
+        totals = {}
+        for record in self.records:
+            total = totals.setdefault(
+                record["stage"],
+                {
+                    "calls": 0,
+                    "wall_time": 0.0,
+                    "cpu_time": 0.0,
+                    "bytes": None,
+                },
+            )
+            total["calls"] += 1
+            total["wall_time"] += record["wall_time"]
+            total["cpu_time"] += record["cpu_time"]
+            if record["bytes"] is not None:
+                total["bytes"] = max(total["bytes"] or 0, record["bytes"])
+        return totals
+
+    def as_json_lines(self):
+        """
+        Return the records in the JSON Lines format.
+        """
+        return "".join(json.dumps(record) + "\n" for record in self.records)
+
+
+def profile_stage(stage):
+    """
+    Return a decorator that records the execution of the decorated function
+    as the provided stage while a profiler is active in the current thread.
+    """
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            profiler = PROFILING.profiler
+            if profiler is None:
+                return function(*args, **kwargs)
+            return profiler.run(stage, function, *args, **kwargs)
+        return wrapper
+    return decorator
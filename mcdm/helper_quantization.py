@@ -0,0 +1,238 @@
+# Copyright (c) 2022 Dimitrios-Georgios Akestoridis
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Helper module for the quantized normalized matrices of the ``mcdm``
+package.
+"""
+
+import numpy as np
+
+from .helper_dtype import current_dtype, float_dtype
+from .helper_registry import get_method
+from .helper_validation import check_scoring_weights, is_normalized_matrix
+
+
+# Number of rows that are dequantized at a time
+BLOCK_ROWS = 65536
+
+# Unsigned integer data types that can store the codes of the values
+CODE_DTYPES = (np.dtype(np.uint8), np.dtype(np.uint16))
+
+
+class QuantizedMatrix:
+    # pylint: disable=too-few-public-methods
+    """
+    Normalized decision matrix whose values are stored as uint8 or uint16
+    codes, with an offset and a scale for each column, so that each value
+    is approximated by ``offsets + codes * scales`` within half of the scale
+    of its column. The offset and the scale of each column are derived from
+    its minimum and maximum values, and the codes are computed in blocks of
+    rows, so that only a block of the matrix is converted at a time.
+    """
+    def __init__(self, z_matrix, code_dtype="uint8"):
+        try:
+            is_code = np.dtype(code_dtype) in CODE_DTYPES
+        except TypeError:
+            is_code = False
+        if not is_code:
+            raise ValueError(
+                "The data type of the codes must be either uint8 or uint16",
+            )
+
+        # Perform sanity checks
+        z_matrix = np.asarray(z_matrix, dtype=float_dtype(z_matrix))
+        if z_matrix.ndim != 2 or z_matrix.shape[0] == 0:
+            raise ValueError(
+                "The decision matrix must be two-dimensional and non-empty",
+            )
+        if not is_normalized_matrix(z_matrix):
+            raise ValueError(
+                "The decision matrix must be normalized in order to be "
+                + "quantized",
+            )
+
+        # Map the range of values of each column to the range of the codes
+        max_code = np.iinfo(code_dtype).max
+        self.offsets = np.amin(z_matrix, axis=0).astype(np.float64)
+        self.scales = (np.amax(z_matrix, axis=0) - self.offsets) / max_code
+        self.error_bounds = self.scales / 2.0
+        inv_scales = np.divide(
+            1.0,
+            self.scales,
+            out=np.zeros_like(self.scales),
+            where=self.scales > 0.0,
+        )
+        self.codes = np.empty(z_matrix.shape, dtype=code_dtype)
+        for start in range(0, z_matrix.shape[0], BLOCK_ROWS):
+            c_block = z_matrix[start:start + BLOCK_ROWS] - self.offsets
+            c_block *= inv_scales
+            np.clip(np.rint(c_block, out=c_block), 0, max_code, out=c_block)
+            self.codes[start:start + BLOCK_ROWS] = c_block
+        self.shape = self.codes.shape
+
+    def dequantize(self, start=0, stop=None):
+        """
+        Return the approximate values of the selected rows, with the
+        floating-point data type of the current thread, clipped to the range
+        of normalized values in case of rounding errors.
+        """
+        z_block = self.codes[start:stop].astype(current_dtype())
+        z_block *= self.scales.astype(current_dtype())
+        z_block += self.offsets.astype(current_dtype())
+        return np.clip(z_block, 0.0, 1.0, out=z_block)
+
+
+def quantized_saw(q_matrix, w_vector, is_benefit_z):
+    """
+    Return the Simple Additive Weighting scores of the provided quantized
+    matrix with the provided weight vector, computed in blocks of rows as
+    ``offsets @ w_vector + codes @ (scales * w_vector)``.
+    """
+    w_vector = np.array(w_vector, dtype=current_dtype())
+    check_scoring_weights(w_vector, is_benefit_z, q_matrix.shape[1], "SAW")
+
+    # Compute the score of each alternative
+    c_vector = (q_matrix.scales * w_vector).astype(current_dtype())
+    s_vector = np.empty(q_matrix.shape[0], dtype=current_dtype())
+    for start in range(0, q_matrix.shape[0], BLOCK_ROWS):
+        s_vector[start:start + BLOCK_ROWS] = (
+            q_matrix.codes[start:start + BLOCK_ROWS].astype(current_dtype())
+            @ c_vector
+        )
+    s_vector += np.dot(q_matrix.offsets, w_vector)
+
+    # The scores are sorted in descending order for benefit criteria
+    return s_vector, all(is_benefit_z)
+
+
+def quantized_topsis(q_matrix, w_vector, is_benefit_z):
+    """
+    Return the Technique for Order Preference by Similarity to Ideal Solution
+    scores of the provided quantized matrix with the provided weight vector,
+    computed in blocks of rows.
+    """
+    w_vector = np.array(w_vector, dtype=current_dtype())
+    check_scoring_weights(
+        w_vector,
+        is_benefit_z,
+        q_matrix.shape[1],
+        "TOPSIS",
+    )
+
+    # The weighted distances of TOPSIS scale each squared difference by the
+    # square of the weight of its criterion
+    return quantized_ideal_scores(
+        q_matrix,
+        w_vector**2,
+        is_benefit_z,
+        "TOPSIS",
+    )
+
+
+def quantized_mtopsis(q_matrix, w_vector, is_benefit_z):
+    """
+    Return the Modified Technique for Order Preference by Similarity to Ideal
+    Solution scores of the provided quantized matrix with the provided weight
+    vector, computed in blocks of rows.
+    """
+    w_vector = np.array(w_vector, dtype=current_dtype())
+    check_scoring_weights(
+        w_vector,
+        is_benefit_z,
+        q_matrix.shape[1],
+        "mTOPSIS",
+    )
+
+    # The weighted distances of mTOPSIS scale each squared difference by the
+    # weight of its criterion
+    return quantized_ideal_scores(
+        q_matrix,
+        w_vector,
+        is_benefit_z,
+        "mTOPSIS",
+    )
+
+
+def quantized_ideal_scores(q_matrix, f_vector, is_benefit_z, s_method):
+    """
+    Return the relative closeness of each alternative of the provided
+    quantized matrix to the positive ideal solution, with distances whose
+    squared differences are scaled by the provided factors, and whether the
+    scores should be sorted in descending order, which is always the case.
+    """
+    # Derive the positive and negative ideal solutions from the codes
+    max_values = (
+        q_matrix.offsets
+        + np.amax(q_matrix.codes, axis=0) * q_matrix.scales
+    )
+    pos_ideal_sol = np.where(
+        is_benefit_z,
+        max_values,
+        q_matrix.offsets,
+    ).astype(current_dtype())
+    neg_ideal_sol = np.where(
+        is_benefit_z,
+        q_matrix.offsets,
+        max_values,
+    ).astype(current_dtype())
+
+    # Compute the score of each alternative
+    s_vector = np.empty(q_matrix.shape[0], dtype=current_dtype())
+    for start in range(0, q_matrix.shape[0], BLOCK_ROWS):
+        z_block = q_matrix.dequantize(start, start + BLOCK_ROWS)
+        pos_ideal_dist = np.sqrt(((pos_ideal_sol - z_block)**2) @ f_vector)
+        neg_ideal_dist = np.sqrt(((z_block - neg_ideal_sol)**2) @ f_vector)
+        denominator = neg_ideal_dist + pos_ideal_dist
+        if np.any(denominator == 0.0):
+            raise ValueError(
+                "The sum of the negative ideal distance and the positive "
+                + "ideal distance must not be equal to zero in order to use "
+                + "the {} method".format(s_method),
+            )
+        s_vector[start:start + BLOCK_ROWS] = neg_ideal_dist / denominator
+
+    return s_vector, True
+
+
+# Scoring kernels for quantized matrices, keyed by the qualified names of
+# the built-in scoring functions, so that they are not imported in advance
+QUANTIZED_KERNELS = {
+    "mcdm.scoring.saw_method.saw": quantized_saw,
+    "mcdm.scoring.topsis_method.topsis": quantized_topsis,
+    "mcdm.scoring.mtopsis_method.mtopsis": quantized_mtopsis,
+}
+
+
+def score_quantized(q_matrix, is_benefit_z, w_vector, s_method):
+    """
+    Return the selected scores of the provided quantized matrix with the
+    provided weight vector.
+    """
+    kernel = QUANTIZED_KERNELS.get(
+        get_method("scoring", s_method).qualified_name,
+    )
+    if kernel is None:
+        raise ValueError(
+            "The {} scoring method does not support ".format(s_method)
+            + "quantized matrices",
+        )
+    return kernel(q_matrix, w_vector, is_benefit_z)
@@ -0,0 +1,289 @@
+# Copyright (c) 2022 Dimitrios-Georgios Akestoridis
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Helper module for the method registry of the ``mcdm`` package.
+"""
+
+import importlib
+
+from .helper_cache import MEMO_CACHE
+
+
+class Method:
+    """
+    Registered implementation of a normalization, weighting, correlation, or
+    scoring method, along with its declared capabilities. The implementation
+    of a built-in method is only imported when it is first used.
+    """
+    def __init__(self, category, name, function, capabilities):
+        self.category = category
+        self.name = name
+        self.capabilities = capabilities
+        self.implementation = function
+
+    @property
+    def function(self):
+        """
+        Return the function that implements the method.
+        """
+        if isinstance(self.implementation, str):
+            module_name, attribute = self.implementation.rsplit(".", 1)
+            self.implementation = getattr(
+                importlib.import_module(module_name),
+                attribute,
+            )
+        return self.implementation
+
+    @property
+    def qualified_name(self):
+        """
+        Return the qualified name of the function that implements the
+        method, without importing it if it is a built-in method that has not
+        been used yet.
+        """
+        if isinstance(self.implementation, str):
+            return self.implementation
+        return "{}.{}".format(
+            self.implementation.__module__,
+            self.implementation.__qualname__,
+        )
+
+
+# Capabilities of each category of methods and their default values
+CAPABILITIES = {
+    "normalization": {
+        # The matrix must not contain any negative numbers
+        "nonnegative_input": False,
+        # The columns of the normalized matrix sum to 1
+        "column_sums_to_one": False,
+        # All criteria are transformed into benefit criteria
+        "benefit_output": False,
+        # The method can write the normalized matrix into an output array
+        "preallocated_arrays": False,
+    },
+    "weighting": {
+        # The decision matrix must be normalized
+        "normalized_input": True,
+        # The columns of the decision matrix must sum to 1
+        "column_sums_to_one": False,
+        # The method uses the selected correlation method
+        "correlation": False,
+        # The correlation coefficients must be between 0 and 1
+        "nonnegative_correlation": False,
+        # The method can use a workspace array for its temporary matrices
+        "preallocated_arrays": False,
+    },
+    "correlation": {
+        # The correlation coefficients are between 0 and 1
+        "nonnegative_output": False,
+    },
+    "scoring": {
+        # The decision matrix must be normalized
+        "normalized_input": True,
+        # The weight vector must be normalized
+        "normalized_weights": True,
+        # The method supports a mixture of benefit and cost criteria, which
+        # is otherwise rejected before the method is applied
+        "mixed_criteria": False,
+        # The score of each alternative only depends on its own values and
+        # does not get worse when any of them gets better
+        "pareto_monotone": False,
+        # The score of each alternative does not change when duplicate
+        # alternatives are removed
+        "duplicate_invariant": False,
+        # The method can write the scores into an output array and use a
+        # workspace array for its temporary matrices
+        "preallocated_arrays": False,
+    },
+}
+
+# Registered methods of each category, keyed by their uppercase names
+METHODS = {category: {} for category in CAPABILITIES}
+
+
+def register_method(category, name, function, **capabilities):
+    """
+    Register the provided function as the implementation of the named
+    normalization, weighting, correlation, or scoring method, replacing any
+    method with the same case-insensitive name. The function must accept the
+    same arguments as the built-in methods of its category and the provided
+    capabilities override the default ones of its category.
+    """
+    if category not in CAPABILITIES:
+        raise ValueError("Unknown method category ({})".format(category))
+    unknown_capabilities = set(capabilities) - set(CAPABILITIES[category])
+    if unknown_capabilities:
+        raise ValueError(
+            "Unknown capabilities of {} methods ({})".format(
+                category,
+                ", ".join(sorted(unknown_capabilities)),
+            ),
+        )
+    # Results that were memoized with a replaced method are no longer valid
+    MEMO_CACHE.clear()
+
+    method_capabilities = dict(CAPABILITIES[category])
+    method_capabilities.update(capabilities)
+    METHODS[category][name.upper()] = Method(
+        category,
+        name,
+        function,
+        method_capabilities,
+    )
+
+
+def get_method(category, name):
+    """
+    Return the registered method of the provided category with the provided
+    case-insensitive name.
+    """
+    try:
+        return METHODS[category][name.upper()]
+    except KeyError:
+        raise ValueError(
+            "Unknown {} method ({})".format(category, name),
+        ) from None
+
+
+def list_methods(category):
+    """
+    Return the names of the registered methods of the provided category, in
+    the order that they were registered.
+    """
+    if category not in METHODS:
+        raise ValueError("Unknown method category ({})".format(category))
+    return [method.name for method in METHODS[category].values()]
+
+
+# Register the built-in normalization methods
+register_method(
+    "normalization",
+    "Linear1",
+    "mcdm.normalization.linear1_method.linear1",
+    nonnegative_input=True,
+    benefit_output=True,
+    preallocated_arrays=True,
+)
+register_method(
+    "normalization",
+    "Linear2",
+    "mcdm.normalization.linear2_method.linear2",
+    benefit_output=True,
+    preallocated_arrays=True,
+)
+register_method(
+    "normalization",
+    "Linear3",
+    "mcdm.normalization.linear3_method.linear3",
+    nonnegative_input=True,
+    column_sums_to_one=True,
+    preallocated_arrays=True,
+)
+register_method(
+    "normalization",
+    "Vector",
+    "mcdm.normalization.vector_method.vector",
+    nonnegative_input=True,
+    preallocated_arrays=True,
+)
+
+# Register the built-in weighting methods
+register_method("weighting", "MW", "mcdm.weighting.mw_method.mw")
+register_method(
+    "weighting",
+    "EM",
+    "mcdm.weighting.em_method.em",
+    column_sums_to_one=True,
+)
+register_method(
+    "weighting",
+    "SD",
+    "mcdm.weighting.sd_method.sd",
+    preallocated_arrays=True,
+)
+register_method(
+    "weighting",
+    "CRITIC",
+    "mcdm.weighting.critic_method.critic",
+    correlation=True,
+    preallocated_arrays=True,
+)
+register_method(
+    "weighting",
+    "VIC",
+    "mcdm.weighting.vic_method.vic",
+    correlation=True,
+    nonnegative_correlation=True,
+)
+
+# Register the built-in correlation methods
+register_method(
+    "correlation",
+    "Pearson",
+    "mcdm.correlation.pearson_method.pearson",
+)
+register_method(
+    "correlation",
+    "AbsPearson",
+    "mcdm.correlation.abspearson_method.abspearson",
+    nonnegative_output=True,
+)
+register_method(
+    "correlation",
+    "dCor",
+    "mcdm.correlation.dcor_method.dcor",
+    nonnegative_output=True,
+)
+
+# Register the built-in scoring methods
+register_method(
+    "scoring",
+    "SAW",
+    "mcdm.scoring.saw_method.saw",
+    pareto_monotone=True,
+    duplicate_invariant=True,
+    preallocated_arrays=True,
+)
+register_method(
+    "scoring",
+    "MEW",
+    "mcdm.scoring.mew_method.mew",
+    pareto_monotone=True,
+    duplicate_invariant=True,
+    preallocated_arrays=True,
+)
+register_method(
+    "scoring",
+    "TOPSIS",
+    "mcdm.scoring.topsis_method.topsis",
+    mixed_criteria=True,
+    duplicate_invariant=True,
+    preallocated_arrays=True,
+)
+register_method(
+    "scoring",
+    "mTOPSIS",
+    "mcdm.scoring.mtopsis_method.mtopsis",
+    mixed_criteria=True,
+    duplicate_invariant=True,
+    preallocated_arrays=True,
+)
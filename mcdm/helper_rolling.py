@@ -0,0 +1,430 @@
+# Copyright (c) 2022 Dimitrios-Georgios Akestoridis
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Helper module for the rolling-window ranking of the ``mcdm`` package.
+"""
+
+from collections import deque
+
+import numpy as np
+
+from .helper_normalization import normalize
+from .helper_registry import get_method
+from .helper_scoring import score
+from .helper_weighting import weigh
+from .main import sort_alternatives
+
+# Qualified name of the built-in weighting function that the maintained
+# statistics of the window replace, so that it is not imported in advance
+SD = "mcdm.weighting.sd_method.sd"
+
+
+class WindowStatistics:
+    # pylint: disable=too-many-instance-attributes
+    """
+    Sliding window over the rows of a decision matrix that incrementally
+    maintains the minimum, maximum, sum, sum of squares, mean, and sum of
+    squared deviations from the mean of each column.
+    """
+    def __init__(self, window, num_columns):
+        if window < 1:
+            raise ValueError(
+                "The size of the window must be a positive integer",
+            )
+
+        self.window = window
+
+        # Each row is stored twice, so that the rows of the window always
+        # form a contiguous slice of the buffer in chronological order
+        self.buffer = np.zeros((2 * window, num_columns), dtype=np.float64)
+        self.labels = [None for _ in range(2 * window)]
+
+        # Total number of rows that have entered the window
+        self.tick = 0
+
+        # Monotonic deques of (tick, value) pairs for each column
+        self.max_deques = [deque() for _ in range(num_columns)]
+        self.min_deques = [deque() for _ in range(num_columns)]
+
+        # Sum and sum of squares of each column
+        self.sums = np.zeros((2, num_columns), dtype=np.float64)
+
+        # Mean and sum of squared deviations from the mean of each column,
+        # which are updated with the method of Welford and West, so that the
+        # variance does not suffer from the cancellation of the sums
+        self.mean = np.zeros(num_columns, dtype=np.float64)
+        self.m2 = np.zeros(num_columns, dtype=np.float64)
+
+    def __len__(self):
+        return min(self.tick, self.window)
+
+    def push(self, x_vector, label):
+        """
+        Insert the provided row into the window, evicting the oldest row if
+        the window is full.
+        """
+        x_vector = np.array(x_vector, dtype=np.float64)
+        if x_vector.shape != (self.buffer.shape[1],):
+            raise ValueError(
+                "The number of values in the row does not match the number "
+                + "of columns in the window",
+            )
+
+        pos = self.tick % self.window
+        if self.tick >= self.window:
+            # Replace the contribution of the row that leaves the window
+            old_vector = self.buffer[pos]
+            self.sums[0] -= old_vector
+            self.sums[1] -= old_vector ** 2
+            delta = x_vector - old_vector
+            mean_vector = self.mean + delta / self.window
+            self.m2 += delta * (
+                (x_vector - mean_vector) + (old_vector - self.mean)
+            )
+            self.mean = mean_vector
+        else:
+            delta = x_vector - self.mean
+            self.mean += delta / (self.tick + 1)
+            self.m2 += delta * (x_vector - self.mean)
+        self.buffer[pos] = x_vector
+        self.buffer[pos + self.window] = x_vector
+        self.labels[pos] = label
+        self.labels[pos + self.window] = label
+        self.sums[0] += x_vector
+        self.sums[1] += x_vector ** 2
+
+        # Update the monotonic deques of each column
+        oldest_tick = self.tick - self.window
+        for j, value in enumerate(x_vector):
+            update_deque(self.max_deques[j], self.tick, value, oldest_tick)
+            update_deque(self.min_deques[j], self.tick, -value, oldest_tick)
+
+        self.tick += 1
+
+        # Periodically recompute the statistics from scratch, in order to
+        # bound the accumulation of floating-point errors
+        if self.tick % self.window == 0:
+            x_matrix = self.matrix()
+            self.sums[0] = np.sum(x_matrix, axis=0)
+            self.sums[1] = np.sum(x_matrix ** 2, axis=0)
+            self.mean = np.mean(x_matrix, axis=0)
+            self.m2 = np.sum((x_matrix - self.mean) ** 2, axis=0)
+
+    def matrix(self):
+        """
+        Return a view of the rows of the window in chronological order.
+        """
+        end = (self.tick - 1) % self.window + self.window + 1
+        return self.buffer[end - len(self):end]
+
+    def row_labels(self):
+        """
+        Return the labels of the rows of the window in chronological order.
+        """
+        end = (self.tick - 1) % self.window + self.window + 1
+        return self.labels[end - len(self):end]
+
+    def maxima(self):
+        """
+        Return the maximum value of each column of the window.
+        """
+        return np.array(
+            [max_deque[0][1] for max_deque in self.max_deques],
+            dtype=np.float64,
+        )
+
+    def minima(self):
+        """
+        Return the minimum value of each column of the window.
+        """
+        return np.array(
+            [-min_deque[0][1] for min_deque in self.min_deques],
+            dtype=np.float64,
+        )
+
+    def std(self):
+        """
+        Return the standard deviation of each column of the window.
+        """
+        return np.sqrt(np.maximum(self.m2 / len(self), 0.0))
+
+
+def update_deque(mono_deque, tick, value, oldest_tick):
+    """
+    Append the provided value to a monotonic deque, whose front holds the
+    maximum value of the window, and discard any expired values.
+    """
+    while mono_deque and mono_deque[-1][1] <= value:
+        mono_deque.pop()
+    mono_deque.append((tick, value))
+    while mono_deque[0][0] <= oldest_tick:
+        mono_deque.popleft()
+
+
+class RollingRanker:
+    # pylint: disable=too-many-instance-attributes
+    """
+    Rank the alternatives of a sliding window over a stream of rows, using
+    the selected methods and incrementally maintained column statistics.
+    """
+    def __init__(
+        self,
+        window,
+        is_benefit_x=None,
+        n_method=None,
+        w_vector=None,
+        c_method=None,
+        w_method="MW",
+        s_method="SAW",
+    ):
+        if window < 1:
+            raise ValueError(
+                "The size of the window must be a positive integer",
+            )
+
+        self.window = window
+        self.stats = None
+        self.is_benefit_x = is_benefit_x
+        self.n_method = n_method
+        self.w_vector = w_vector
+        self.c_method = c_method
+        self.w_method = w_method
+        self.s_method = s_method
+
+    def push(self, x_vector, alt_name=None):
+        """
+        Insert the provided alternative into the window and return the
+        ranking of the alternatives of the window, in descending order.
+        """
+        if self.stats is None:
+            # The number of criteria is determined by the first alternative
+            num_columns = np.shape(x_vector)[0]
+            self.stats = WindowStatistics(self.window, num_columns)
+
+            # If not specified, consider all criteria as benefit criteria
+            if self.is_benefit_x is None:
+                self.is_benefit_x = [True for _ in range(num_columns)]
+
+        if alt_name is None:
+            alt_name = "a" + str(self.stats.tick + 1)
+        self.stats.push(x_vector, alt_name)
+
+        return self.rank()
+
+    def rank(self):
+        """
+        Return the ranking of the alternatives of the window, in descending
+        order, using the selected methods.
+        """
+        x_matrix = self.stats.matrix()
+
+        # Normalize the decision matrix of the window
+        z_matrix, is_benefit_z, a_vector = self.normalize_window(x_matrix)
+
+        # Determine the weight of each criterion
+        w_vector = self.w_vector
+        if w_vector is None:
+            w_name = None
+            if self.w_method is not None:
+                w_name = get_method("weighting", self.w_method).qualified_name
+            if w_name == SD and a_vector is not None:
+                # The standard deviation of a linearly scaled criterion is
+                # derived from the maintained statistics of the window
+                sd_vector = np.absolute(a_vector) * self.stats.std()
+                w_vector = sd_vector / np.sum(sd_vector)
+            else:
+                w_vector = weigh(z_matrix, self.w_method, self.c_method)
+
+        # Score each alternative using the selected method
+        s_vector, desc_order = score(
+            z_matrix,
+            is_benefit_z,
+            w_vector,
+            self.s_method,
+        )
+
+        return sort_alternatives(
+            self.stats.row_labels(),
+            s_vector,
+            desc_order,
+        )
+
+    def normalize_window(self, x_matrix):
+        """
+        Return the normalized decision matrix of the window, the types of its
+        criteria, and the scaling factor of each criterion if all of them
+        were normalized with a linear transformation.
+        """
+        method = None
+        n_name = None
+        if self.n_method is not None:
+            method = get_method("normalization", self.n_method)
+            n_name = method.qualified_name
+        if (
+            len(self.is_benefit_x) == x_matrix.shape[1]
+            and n_name in WINDOW_NORMALIZATIONS
+        ):
+            result = WINDOW_NORMALIZATIONS[n_name](
+                x_matrix,
+                np.array(self.is_benefit_x, dtype=bool),
+                self.stats,
+            )
+            if result is not None:
+                z_matrix, a_vector = result
+                if method is not None and method.capabilities[
+                    "benefit_output"
+                ]:
+                    # All criteria have been transformed into benefit criteria
+                    is_benefit_z = [True for _ in range(x_matrix.shape[1])]
+                else:
+                    is_benefit_z = list(self.is_benefit_x)
+                return z_matrix, is_benefit_z, a_vector
+
+        # Let the normalization function handle the remaining cases, which
+        # includes raising the appropriate exception
+        return normalize(x_matrix, self.is_benefit_x, self.n_method) + (None,)
+
+
+def window_identity(x_matrix, _is_benefit, stats):
+    """
+    Return the window matrix, if it is already normalized, and the scaling
+    factor of each criterion.
+    """
+    if np.any(stats.minima() < 0.0) or np.any(stats.maxima() > 1.0):
+        return None
+    return np.copy(x_matrix), np.ones(x_matrix.shape[1], dtype=np.float64)
+
+
+def window_linear1(x_matrix, is_benefit, stats):
+    """
+    Return the Linear1 normalization of the window matrix and the scaling
+    factor of each criterion, if all of them are benefit criteria.
+    """
+    max_vector = stats.maxima()
+    min_vector = stats.minima()
+    if (
+        np.any(min_vector < 0.0)
+        or not np.all(max_vector[is_benefit])
+        or not np.all(min_vector[~is_benefit])
+    ):
+        return None
+    z_matrix = np.zeros(x_matrix.shape, dtype=np.float64)
+    z_matrix[:, is_benefit] = x_matrix[:, is_benefit] / max_vector[is_benefit]
+    z_matrix[:, ~is_benefit] = (
+        min_vector[~is_benefit] / x_matrix[:, ~is_benefit]
+    )
+    if np.all(is_benefit):
+        return z_matrix, 1.0 / max_vector
+    return z_matrix, None
+
+
+def window_linear2(x_matrix, is_benefit, stats):
+    """
+    Return the Linear2 normalization of the window matrix and the scaling
+    factor of each criterion.
+    """
+    max_vector = stats.maxima()
+    min_vector = stats.minima()
+    denominator = max_vector - min_vector
+    if not np.all(denominator):
+        return None
+    z_matrix = np.zeros(x_matrix.shape, dtype=np.float64)
+    z_matrix[:, is_benefit] = (
+        (x_matrix[:, is_benefit] - min_vector[is_benefit])
+        / denominator[is_benefit]
+    )
+    z_matrix[:, ~is_benefit] = (
+        (max_vector[~is_benefit] - x_matrix[:, ~is_benefit])
+        / denominator[~is_benefit]
+    )
+    return z_matrix, 1.0 / denominator
+
+
+def window_linear3(x_matrix, _is_benefit, stats):
+    """
+    Return the Linear3 normalization of the window matrix and the scaling
+    factor of each criterion.
+    """
+    denominator = stats.sums[0]
+    if np.any(stats.minima() < 0.0) or not np.all(denominator):
+        return None
+    return x_matrix / denominator, 1.0 / denominator
+
+
+def window_vector(x_matrix, _is_benefit, stats):
+    """
+    Return the Vector normalization of the window matrix and the scaling
+    factor of each criterion.
+    """
+    denominator = np.sqrt(stats.sums[1])
+    if np.any(stats.minima() < 0.0) or not np.all(denominator):
+        return None
+    return x_matrix / denominator, 1.0 / denominator
+
+
+# Window normalizations that replace the built-in normalization functions
+# with the provided qualified names
+WINDOW_NORMALIZATIONS = {
+    None: window_identity,
+    "mcdm.normalization.linear1_method.linear1": window_linear1,
+    "mcdm.normalization.linear2_method.linear2": window_linear2,
+    "mcdm.normalization.linear3_method.linear3": window_linear3,
+    "mcdm.normalization.vector_method.vector": window_vector,
+}
+
+
+def rolling_rank(
+    x_matrix,
+    window,
+    alt_names=None,
+    is_benefit_x=None,
+    n_method=None,
+    w_vector=None,
+    c_method=None,
+    w_method="MW",
+    s_method="SAW",
+):
+    """
+    Yield the ranking of the alternatives within a sliding window, in
+    descending order, each time that a row of the provided matrix enters it.
+    """
+    # Perform sanity checks
+    x_matrix = np.array(x_matrix, dtype=np.float64)
+    if alt_names is None:
+        alt_names = ["a" + str(i + 1) for i in range(x_matrix.shape[0])]
+    if len(alt_names) != x_matrix.shape[0]:
+        raise ValueError(
+            "The number of names for the alternatives does not match the "
+            + "number of rows in the decision matrix",
+        )
+
+    ranker = RollingRanker(
+        window,
+        is_benefit_x=is_benefit_x,
+        n_method=n_method,
+        w_vector=w_vector,
+        c_method=c_method,
+        w_method=w_method,
+        s_method=s_method,
+    )
+    for i in range(x_matrix.shape[0]):
+        yield ranker.push(x_matrix[i], alt_names[i])
@@ -23,22 +23,78 @@
 Helper module for the scoring methods of the ``mcdm`` package.
 """
 
-from . import scoring
+import numpy as np
 
+from .helper_dtype import select_dtype
+from .helper_profiling import profile_stage
+from .helper_quantization import QuantizedMatrix, score_quantized
+from .helper_registry import get_method
+from .helper_validation import check_preallocated_array
 
-def score(z_matrix, is_benefit_z, w_vector, s_method):
+
+@profile_stage("score")
+def score(
+    z_matrix,
+    is_benefit_z,
+    w_vector,
+    s_method,
+    dtype=None,
+    out=None,
+    workspace=None,
+):
     """
     Return the selected scores of the provided decision matrix with the
-    provided weight vector.
+    provided weight vector, computed with the selected floating-point data
+    type. The decision matrix may also be a quantized matrix, if the selected
+    scoring method supports it. Otherwise, if an output array is provided,
+    the scores are written into it, and if a workspace array of the same
+    shape as the decision matrix is provided, the selected scoring method
+    may use it for its temporary matrices.
     """
-    # Use the selected scoring method
-    if s_method.upper() == "SAW":
-        return scoring.saw(z_matrix, w_vector, is_benefit_z)
-    elif s_method.upper() == "MEW":
-        return scoring.mew(z_matrix, w_vector, is_benefit_z)
-    elif s_method.upper() == "TOPSIS":
-        return scoring.topsis(z_matrix, w_vector, is_benefit_z)
-    elif s_method.upper() == "MTOPSIS":
-        return scoring.mtopsis(z_matrix, w_vector, is_benefit_z)
-    else:
-        raise ValueError("Unknown scoring method ({})".format(s_method))
+    with select_dtype(dtype) as selected_dtype:
+        if isinstance(z_matrix, QuantizedMatrix):
+            if out is not None or workspace is not None:
+                raise ValueError(
+                    "Preallocated arrays cannot be used to score a quantized "
+                    + "matrix",
+                )
+            return score_quantized(z_matrix, is_benefit_z, w_vector, s_method)
+
+        # Use the selected scoring method
+        method = get_method("scoring", s_method)
+        if out is None and workspace is None:
+            return method.function(z_matrix, w_vector, is_benefit_z)
+        z_matrix = np.asarray(z_matrix, dtype=selected_dtype)
+        if out is not None:
+            check_preallocated_array(
+                out,
+                z_matrix.shape[:1],
+                selected_dtype,
+                "output array",
+                z_matrix,
+            )
+        if workspace is not None:
+            check_preallocated_array(
+                workspace,
+                z_matrix.shape,
+                selected_dtype,
+                "workspace array",
+                z_matrix,
+            )
+        if method.capabilities["preallocated_arrays"]:
+            return method.function(
+                z_matrix,
+                w_vector,
+                is_benefit_z,
+                out=out,
+                workspace=workspace,
+            )
+        s_vector, desc_order = method.function(
+            z_matrix,
+            w_vector,
+            is_benefit_z,
+        )
+        if out is None:
+            return s_vector, desc_order
+        np.copyto(out, s_vector)
+        return out, desc_order
@@ -0,0 +1,194 @@
+# Copyright (c) 2022 Dimitrios-Georgios Akestoridis
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Helper module for the Pareto dominance of the alternatives of the ``mcdm``
+package.
+"""
+
+import numpy as np
+
+from .helper_dtype import float_dtype
+
+
+# Maximum number of pairwise comparisons of values per vectorized block
+BLOCK_ELEMENTS = 2**22
+
+
+def count_dominators(y_matrix, d_matrix):
+    """
+    Return the number of rows of the second matrix that dominate each row of
+    the first matrix, where larger values are preferred.
+    """
+    counts = np.zeros(y_matrix.shape[0], dtype=np.int64)
+    if y_matrix.shape[0] == 0:
+        return counts
+    chunk = max(1, BLOCK_ELEMENTS // (y_matrix.shape[0] * y_matrix.shape[1]))
+    for start in range(0, d_matrix.shape[0], chunk):
+        d_block = d_matrix[start:start + chunk]
+
+        # Find the pairs of rows with weakly better values, and then discard
+        # the pairs of identical rows, which are much less frequent
+        d_indices, y_indices = np.nonzero(
+            np.all(d_block[:, np.newaxis, :] >= y_matrix, axis=2),
+        )
+        strict = np.any(d_block[d_indices] > y_matrix[y_indices], axis=1)
+        counts += np.bincount(
+            y_indices[strict],
+            minlength=y_matrix.shape[0],
+        )
+    return counts
+
+
+def get_block_stop(neg_sums, start, block_size):
+    """
+    Return the end of the block of rows that starts at the provided
+    position, which is extended with the following rows whose sum is equal
+    to the sum of its last row. The negated sums must be sorted in ascending
+    order.
+    """
+    last = min(start + block_size, neg_sums.shape[0]) - 1
+    return int(np.searchsorted(neg_sums, neg_sums[last], side="right"))
+
+
+def dominance_counts(y_matrix, max_count, block_size=1024):
+    """
+    Return the number of rows that dominate each row of the provided matrix,
+    where larger values are preferred, capped at the provided maximum count.
+    The rows are processed in blocks in descending order of their sums,
+    since a row can only be dominated by rows with a greater or, after
+    rounding, equal sum, so rows with equal sums are never split across
+    blocks. Each block is only compared with the rows whose count is below
+    the maximum, since the dominators of a discarded row also dominate the
+    rows that it dominates. The remaining rows are compared with the
+    strongest rows first, so that most of the dominated rows are discarded
+    early.
+    """
+    y_matrix = np.asarray(y_matrix, dtype=float_dtype(y_matrix))
+    counts = np.full(y_matrix.shape[0], max_count, dtype=np.int64)
+    neg_sums = -np.sum(y_matrix, axis=1)
+    order = np.argsort(neg_sums, kind="stable")
+    neg_sums = neg_sums[order]
+    kept = np.empty((block_size, y_matrix.shape[1]), dtype=y_matrix.dtype)
+    num_kept = 0
+    start = 0
+    while start < y_matrix.shape[0]:
+        indices = order[start:get_block_stop(neg_sums, start, block_size)]
+        start += indices.shape[0]
+        y_block = y_matrix[indices]
+        c_block = np.zeros(indices.shape[0], dtype=np.int64)
+
+        # Count the dominators among the kept rows in chunks of increasing
+        # size, starting with the strongest rows
+        k_start = 0
+        k_size = 16
+        while k_start < num_kept and indices.size > 0:
+            c_block += count_dominators(
+                y_block,
+                kept[k_start:min(k_start + k_size, num_kept)],
+            )
+            k_start += k_size
+            k_size = min(2 * k_size, block_size)
+            alive = c_block < max_count
+            indices = indices[alive]
+            y_block = y_block[alive]
+            c_block = c_block[alive]
+
+        # Count the dominators among the rows of the same block
+        c_block += count_dominators(y_block, y_block)
+        alive = c_block < max_count
+        counts[indices[alive]] = c_block[alive]
+
+        # Keep the remaining rows, growing the buffer if needed
+        while num_kept + np.sum(alive) > kept.shape[0]:
+            kept = np.concatenate((kept, np.empty_like(kept)))
+        kept[num_kept:num_kept + np.sum(alive)] = y_block[alive]
+        num_kept += np.sum(alive)
+    return counts
+
+
+def orient_matrix(x_matrix, is_benefit_x):
+    """
+    Return the provided decision matrix with the signs of its cost criteria
+    flipped, so that larger values are preferred for all criteria, after
+    performing sanity checks.
+    """
+    x_matrix = np.array(x_matrix, dtype=np.float64)
+    if x_matrix.ndim != 2:
+        raise ValueError("The decision matrix must be two-dimensional")
+
+    # If not specified, consider all criteria as benefit criteria
+    if is_benefit_x is None:
+        is_benefit_x = [True for _ in range(x_matrix.shape[1])]
+    if len(is_benefit_x) != x_matrix.shape[1]:
+        raise ValueError(
+            "The number of variables in the list that determines whether "
+            + "each criterion is a benefit or a cost criterion does not "
+            + "match the number of columns in the decision matrix",
+        )
+    return np.where(is_benefit_x, x_matrix, -x_matrix)
+
+
+def skyline(x_matrix, is_benefit_x=None):
+    """
+    Return the indices of the alternatives that are not dominated by any
+    other alternative, i.e., the Pareto front of the decision matrix, in
+    ascending order.
+    """
+    y_matrix = orient_matrix(x_matrix, is_benefit_x)
+    return np.flatnonzero(dominance_counts(y_matrix, 1) == 0)
+
+
+def pareto_layers(x_matrix, is_benefit_x=None, max_layers=None):
+    """
+    Return the dominance depth of each alternative, where the alternatives of
+    the Pareto front are in the first layer and the alternatives of each
+    subsequent layer are only dominated by alternatives of earlier layers.
+    If a maximum number of layers is provided, the alternatives of deeper
+    layers are reported as being in layer 0.
+    """
+    if max_layers is not None and max_layers < 1:
+        raise ValueError(
+            "The maximum number of layers must be a positive integer",
+        )
+    y_matrix = orient_matrix(x_matrix, is_benefit_x)
+    layers = np.zeros(y_matrix.shape[0], dtype=np.int64)
+    remaining = np.arange(y_matrix.shape[0])
+    layer = 0
+    while remaining.size > 0 and layer != max_layers:
+        layer += 1
+        front = dominance_counts(y_matrix[remaining], 1) == 0
+        layers[remaining[front]] = layer
+        remaining = remaining[~front]
+    return layers
+
+
+def select_candidates(z_matrix, alt_names, is_benefit_z, top_k):
+    """
+    Return the rows of the normalized decision matrix and the names of the
+    alternatives that are dominated by fewer than the provided number of
+    alternatives. Any other alternative is outranked by at least that many
+    alternatives under every scoring method that is monotone with respect to
+    Pareto dominance, so it cannot be one of the top alternatives.
+    """
+    y_matrix = np.where(is_benefit_z, z_matrix, -z_matrix)
+    rows = np.flatnonzero(dominance_counts(y_matrix, top_k) < top_k)
+    return z_matrix[rows], [alt_names[i] for i in rows]
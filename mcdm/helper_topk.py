@@ -0,0 +1,116 @@
+# Copyright (c) 2022 Dimitrios-Georgios Akestoridis
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Helper module for the top-k queries of the ``mcdm`` package.
+"""
+
+import operator
+
+import numpy as np
+
+from .helper_problem import prepare_problem
+from .helper_skyline import dominance_counts
+from .helper_validation import check_saw_matrix, check_saw_weights
+
+
+class SawIndex:
+    # pylint: disable=too-few-public-methods
+    """
+    Index of a normalized decision matrix that answers top-k queries with
+    the SAW method for arbitrary weight vectors by only scoring candidate
+    alternatives. The candidates of a top-k query are the alternatives that
+    are dominated by fewer than k alternatives, because each dominating
+    alternative scores at least as high with any non-negative weights. These
+    candidates are a subset of the first k Pareto layers. The scores of the
+    returned alternatives are exact, but ties may be broken differently than
+    in a ranking of all alternatives.
+    """
+    def __init__(self, z_matrix, alt_names=None, is_benefit_z=None, max_k=10):
+        if max_k < 1:
+            raise ValueError(
+                "The maximum number of alternatives per query must be a "
+                + "positive integer",
+            )
+
+        # Perform sanity checks
+        self.z_matrix, self.alt_names, is_benefit_z, _ = prepare_problem(
+            z_matrix,
+            alt_names,
+            is_benefit_z,
+            None,
+        )
+        if len(is_benefit_z) != self.z_matrix.shape[1]:
+            raise ValueError(
+                "The number of variables in the list that determines "
+                + "whether each criterion is a benefit or a cost criterion "
+                + "does not match the number of columns in the decision "
+                + "matrix",
+            )
+        check_saw_matrix(self.z_matrix, is_benefit_z)
+        self.desc_order = all(is_benefit_z)
+        self.max_k = max_k
+
+        # Sort the candidates by their number of dominating alternatives
+        counts = dominance_counts(
+            self.z_matrix if self.desc_order else -self.z_matrix,
+            max_k,
+        )
+        order = np.argsort(counts, kind="stable")
+        self.candidate_ends = np.searchsorted(
+            counts[order],
+            np.arange(max_k),
+            side="right",
+        )
+        self.candidates = order[:self.candidate_ends[-1]]
+        self.z_candidates = self.z_matrix[self.candidates]
+
+    def query(self, w_vector, k=1):
+        """
+        Return the k alternatives with the best SAW scores for the provided
+        weight vector and their scores, in ranking order.
+        """
+        k = operator.index(k)
+        if not 1 <= k <= self.z_matrix.shape[0]:
+            raise ValueError(
+                "The number of alternatives must be between 1 and the "
+                + "number of rows in the decision matrix",
+            )
+        w_vector = np.array(w_vector, dtype=np.float64)
+        check_saw_weights(w_vector, self.z_matrix.shape[1])
+
+        # Score the candidates, or all alternatives for large queries
+        if k <= self.max_k:
+            num_candidates = self.candidate_ends[k - 1]
+            rows = self.candidates[:num_candidates]
+            s_vector = self.z_candidates[:num_candidates].dot(w_vector)
+        else:
+            rows = np.arange(self.z_matrix.shape[0])
+            s_vector = self.z_matrix.dot(w_vector)
+
+        # Select and sort the best scores
+        keys = -s_vector if self.desc_order else s_vector
+        if k < keys.shape[0]:
+            top = np.argpartition(keys, k - 1)[:k]
+            top = top[np.argsort(keys[top])]
+        else:
+            top = np.argsort(keys)
+        return [(self.alt_names[rows[i]], s_vector[i]) for i in top]
@@ -25,24 +25,64 @@ Helper module for the validation functions of the ``mcdm`` package.
 
 import numpy as np
 
+from .helper_dtype import float_dtype
+from .helper_registry import get_method
+
+
+def get_tolerance(array):
+    """
+    Return the relative tolerance of the sums of the provided array that
+    must be equal to 1, which is the default tolerance of ``numpy.isclose``,
+    unless the precision of its floating-point data type requires a larger
+    one, as is the case for float32 arrays.
+    """
+    # The machine epsilon is a dynamic attribute of finfo instances, which
+    # pylint cannot infer
+    # pylint: disable-next=no-member
+    return max(1e-05, float(np.sqrt(np.finfo(float_dtype(array)).eps)))
+
 
 def is_normalized_matrix(z_matrix):
     """
     Return a Boolean value to indicate whether the matrix is normalized or not
     """
     return (
-        np.sum(np.less(z_matrix, 0.0)) == 0
-        and np.sum(np.greater(z_matrix, 1.0)) == 0
+        not has_element_below(z_matrix, 0.0)
+        and not has_element_above(z_matrix, 1.0)
     )
 
 
+def has_element_below(array, value):
+    """
+    Return a Boolean value to indicate whether any element of the array is
+    less than the provided value, ignoring missing elements and without
+    allocating an array of the same size
+    """
+    array = np.asarray(array)
+    return array.size > 0 and np.fmin.reduce(array, axis=None) < value
+
+
+def has_element_above(array, value):
+    """
+    Return a Boolean value to indicate whether any element of the array is
+    greater than the provided value, ignoring missing elements and without
+    allocating an array of the same size
+    """
+    array = np.asarray(array)
+    return array.size > 0 and np.fmax.reduce(array, axis=None) > value
+
+
 def is_normalized_vector(w_vector):
     """
     Return a Boolean value to indicate whether the vector is normalized or not
     """
     return (
         np.sum(np.less(w_vector, 0.0)) == 0
-        and np.isclose(np.sum(w_vector), 1.0)
+        and np.isclose(
+            np.sum(w_vector, dtype=np.float64),
+            1.0,
+            rtol=get_tolerance(w_vector),
+        )
     )
 
 
@@ -51,30 +91,115 @@ def check_scoring_input(z_matrix, w_vector, is_benefit_z, s_method):
     Raise an exception if any argument is inappropriate for the corresponding
     scoring method
     """
-    if s_method.upper() in {"SAW", "MEW", "TOPSIS", "MTOPSIS"}:
-        if not is_normalized_matrix(z_matrix):
-            raise ValueError(
-                "The decision matrix must be normalized in order to apply "
-                + "the {} scoring method".format(s_method),
-            )
-        if not is_normalized_vector(w_vector):
-            raise ValueError(
-                "The weight vector must be normalized in order to apply "
-                + "the {} scoring method".format(s_method),
-            )
-        if w_vector.shape != (z_matrix.shape[1],):
-            raise ValueError(
-                "The shape of the weight vector is not appropriate for the "
-                + "number of columns in the decision matrix",
-            )
-        if len(is_benefit_z) != z_matrix.shape[1]:
-            raise ValueError(
-                "The number of variables in the list that determines whether "
-                + "each criterion is a benefit or a cost criterion does not "
-                + "match the number of columns in the decision matrix",
-            )
-    else:
-        raise ValueError("Unknown scoring method ({})".format(s_method))
+    capabilities = get_method("scoring", s_method).capabilities
+    if (
+        capabilities["normalized_input"]
+        and not is_normalized_matrix(z_matrix)
+    ):
+        raise ValueError(
+            "The decision matrix must be normalized in order to apply "
+            + "the {} scoring method".format(s_method),
+        )
+    check_scoring_weights(w_vector, is_benefit_z, z_matrix.shape[1], s_method)
+
+
+def check_scoring_weights(w_vector, is_benefit_z, num_columns, s_method):
+    """
+    Raise an exception if the weight vector or the types of the criteria are
+    inappropriate for the corresponding scoring method with the provided
+    number of criteria
+    """
+    capabilities = get_method("scoring", s_method).capabilities
+    if (
+        capabilities["normalized_weights"]
+        and not is_normalized_vector(w_vector)
+    ):
+        raise ValueError(
+            "The weight vector must be normalized in order to apply "
+            + "the {} scoring method".format(s_method),
+        )
+    if w_vector.shape != (num_columns,):
+        raise ValueError(
+            "The shape of the weight vector is not appropriate for the "
+            + "number of columns in the decision matrix",
+        )
+    if len(is_benefit_z) != num_columns:
+        raise ValueError(
+            "The number of variables in the list that determines whether "
+            + "each criterion is a benefit or a cost criterion does not "
+            + "match the number of columns in the decision matrix",
+        )
+    if (
+        not capabilities["mixed_criteria"]
+        and any(is_benefit_z)
+        and not all(is_benefit_z)
+    ):
+        raise ValueError(
+            "All criteria must be either benefit or cost criteria in order "
+            + "to use the {} method".format(s_method),
+        )
+
+
+def check_saw_matrix(z_matrix, is_benefit_z):
+    """
+    Raise an exception if the decision matrix is inappropriate for repeated
+    applications of the SAW scoring method
+    """
+    if not is_normalized_matrix(z_matrix):
+        raise ValueError(
+            "The decision matrix must be normalized in order to apply the "
+            + "SAW scoring method",
+        )
+    if any(is_benefit_z) and not all(is_benefit_z):
+        raise ValueError(
+            "All criteria must be either benefit or cost criteria in order "
+            + "to use the SAW method",
+        )
+
+
+def check_saw_weights(w_vector, num_columns):
+    """
+    Raise an exception if the weight vector is inappropriate for the SAW
+    scoring method with the provided number of criteria
+    """
+    if w_vector.shape != (num_columns,):
+        raise ValueError(
+            "The shape of the weight vector is not appropriate for the "
+            + "number of columns in the decision matrix",
+        )
+    if not is_normalized_vector(w_vector):
+        raise ValueError(
+            "The weight vector must be normalized in order to apply the SAW "
+            + "scoring method",
+        )
+
+
+def check_ranking_options(top_k, prefilter, dedup, s_method):
+    """
+    Raise an exception if the number of top alternatives is not positive, if
+    the skyline prefilter is enabled without the number of top alternatives
+    or with a scoring method that is not monotone with respect to Pareto
+    dominance, or if the deduplication is enabled with a scoring method whose
+    scores depend on duplicate alternatives.
+    """
+    if top_k is not None and top_k < 1:
+        raise ValueError(
+            "The number of top alternatives must be a positive integer",
+        )
+    if not prefilter and not dedup:
+        return
+    capabilities = get_method("scoring", s_method).capabilities
+    if prefilter and (top_k is None or not capabilities["pareto_monotone"]):
+        raise ValueError(
+            "The skyline prefilter requires the number of top alternatives "
+            + "and a scoring method that is monotone with respect to Pareto "
+            + "dominance",
+        )
+    if dedup and not capabilities["duplicate_invariant"]:
+        raise ValueError(
+            "The deduplication requires a scoring method whose scores do not "
+            + "depend on duplicate alternatives",
+        )
 
 
 def check_weighting_input(z_matrix, c_method, w_method):
@@ -82,44 +207,57 @@ def check_weighting_input(z_matrix, c_method, w_method):
     Raise an exception if any argument is inappropriate for the corresponding
     weighting method
     """
-    if w_method.upper() in {"MW", "EM", "SD", "CRITIC", "VIC"}:
-        if not is_normalized_matrix(z_matrix):
-            raise ValueError(
-                "The decision matrix must be normalized in order to apply "
-                + "the {} weighting method".format(w_method),
+    capabilities = get_method("weighting", w_method).capabilities
+    if (
+        capabilities["normalized_input"]
+        and not is_normalized_matrix(z_matrix)
+    ):
+        raise ValueError(
+            "The decision matrix must be normalized in order to apply "
+            + "the {} weighting method".format(w_method),
+        )
+    if (
+        capabilities["column_sums_to_one"]
+        and not np.all(
+            np.isclose(
+                np.sum(z_matrix, axis=0, dtype=np.float64),
+                np.ones(z_matrix.shape[1]),
+                rtol=get_tolerance(z_matrix),
+            )
+        )
+    ):
+        raise ValueError(
+            "The columns of the decision matrix must sum to 1 in "
+            + "order to apply the {} weighting method".format(w_method),
+        )
+    if capabilities["correlation"]:
+        check_correlation_compatibility(c_method, w_method, capabilities)
+
+
+def check_correlation_compatibility(c_method, w_method, capabilities):
+    """
+    Raise an exception if the correlation method is not compatible with the
+    weighting method
+    """
+    try:
+        c_capabilities = get_method("correlation", c_method).capabilities
+    except ValueError:
+        raise ValueError(
+            "Unknown compatibility of the {} weighting method ".format(
+                w_method,
+            )
+            + "with the {} correlation method".format(c_method),
+        ) from None
+    if (
+        capabilities["nonnegative_correlation"]
+        and not c_capabilities["nonnegative_output"]
+    ):
+        raise ValueError(
+            "The {} weighting method is not compatible with the ".format(
+                w_method,
             )
-        if w_method.upper() == "EM":
-            if (
-                not np.all(
-                    np.isclose(
-                        np.sum(z_matrix, axis=0),
-                        np.ones(z_matrix.shape[1]),
-                    )
-                )
-            ):
-                raise ValueError(
-                    "The columns of the decision matrix must sum to 1 in "
-                    + "order to apply the EM weighting method",
-                )
-        elif w_method.upper() == "CRITIC":
-            if c_method.upper() not in {"PEARSON", "ABSPEARSON", "DCOR"}:
-                raise ValueError(
-                    "Unknown compatibility of the CRITIC weighting method "
-                    + "with the {} correlation method".format(c_method)
-                )
-        elif w_method.upper() == "VIC":
-            if c_method.upper() in {"PEARSON"}:
-                raise ValueError(
-                    "The VIC weighting method is not compatible with the "
-                    + "{} correlation method".format(c_method),
-                )
-            if c_method.upper() not in {"ABSPEARSON", "DCOR"}:
-                raise ValueError(
-                    "Unknown compatibility of the VIC weighting method with "
-                    + "the {} correlation method".format(c_method),
-                )
-    else:
-        raise ValueError("Unknown weighting method ({})".format(w_method))
+            + "{} correlation method".format(c_method),
+        )
 
 
 def check_normalization_input(x_matrix, is_benefit_x, n_method):
@@ -127,28 +265,51 @@ def check_normalization_input(x_matrix, is_benefit_x, n_method):
     Raise an exception if any argument is inappropriate for the corresponding
     normalization method
     """
-    if (
-        n_method is None
-        or n_method.upper() in {"LINEAR1", "LINEAR2", "LINEAR3", "VECTOR"}
-    ):
-        if len(is_benefit_x) != x_matrix.shape[1]:
+    capabilities = {}
+    if n_method is not None:
+        capabilities = get_method("normalization", n_method).capabilities
+    if len(is_benefit_x) != x_matrix.shape[1]:
+        raise ValueError(
+            "The number of variables in the list that determines whether "
+            + "each criterion is a benefit or a cost criterion does not "
+            + "match the number of columns in the matrix",
+        )
+    if n_method is None:
+        if not is_normalized_matrix(x_matrix):
+            raise ValueError(
+                "The matrix is not normalized such that each element is "
+                + "between 0 and 1",
+            )
+    elif capabilities["nonnegative_input"]:
+        if has_element_below(x_matrix, 0.0):
             raise ValueError(
-                "The number of variables in the list that determines whether "
-                + "each criterion is a benefit or a cost criterion does not "
-                + "match the number of columns in the matrix",
+                "The matrix must not contain any "
+                + "negative numbers in order to apply the "
+                + "{} normalization method".format(n_method),
             )
-        if n_method is None:
-            if not is_normalized_matrix(x_matrix):
-                raise ValueError(
-                    "The matrix is not normalized such that each element is "
-                    + "between 0 and 1",
-                )
-        elif n_method.upper() in {"LINEAR1", "LINEAR3", "VECTOR"}:
-            if np.sum(np.less(x_matrix, 0.0)) > 0:
-                raise ValueError(
-                    "The matrix must not contain any "
-                    + "negative numbers in order to apply the "
-                    + "{} normalization method".format(n_method),
-                )
-    else:
-        raise ValueError("Unknown normalization method ({})".format(n_method))
+
+
+def check_preallocated_array(array, shape, dtype, name, matrix=None):
+    """
+    Raise an exception if the provided preallocated array cannot be used to
+    store an array with the provided shape and data type, or if it shares
+    memory with the provided matrix, which it would overwrite
+    """
+    if not isinstance(array, np.ndarray):
+        raise ValueError("The {} must be a NumPy array".format(name))
+    if array.shape != tuple(shape) or array.dtype != dtype:
+        raise ValueError(
+            "The {} must be an array of shape {} and data type {}".format(
+                name,
+                tuple(shape),
+                np.dtype(dtype).name,
+            ),
+        )
+    if not array.flags.writeable:
+        raise ValueError("The {} must be writeable".format(name))
+    if matrix is not None and np.shares_memory(array, matrix):
+        raise ValueError(
+            "The {} must not share memory with the provided matrix".format(
+                name,
+            ),
+        )
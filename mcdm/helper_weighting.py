@@ -23,24 +23,59 @@
 Helper module for the weighting methods of the ``mcdm`` package.
 """
 
-from . import weighting
+import numpy as np
 
+from .helper_cache import memoize
+from .helper_dtype import select_dtype
+from .helper_profiling import profile_stage
+from .helper_registry import get_method
+from .helper_validation import check_preallocated_array
 
-def weigh(z_matrix, w_method, c_method=None):
+
+@profile_stage("weigh")
+def weigh(z_matrix, w_method, c_method=None, dtype=None, workspace=None):
+    """
+    Return the weight vector of the provided decision matrix using the
+    selected weighting method, computed with the selected floating-point
+    data type. If a workspace array of the same shape as the decision matrix
+    is provided, the selected weighting method may use it for its temporary
+    matrices, in which case the weight vector is not memoized.
+    """
+    if workspace is None:
+        return weigh_matrix(z_matrix, w_method, c_method, dtype=dtype)
+    with select_dtype(dtype) as selected_dtype:
+        z_matrix = np.asarray(z_matrix, dtype=selected_dtype)
+        check_preallocated_array(
+            workspace,
+            z_matrix.shape,
+            selected_dtype,
+            "workspace array",
+            z_matrix,
+        )
+        return apply_weighting(z_matrix, w_method, c_method, workspace)
+
+
+@memoize
+def weigh_matrix(z_matrix, w_method, c_method=None, dtype=None):
+    """
+    Return the weight vector of the provided decision matrix using the
+    selected weighting method, computed with the selected floating-point
+    data type.
+    """
+    with select_dtype(dtype):
+        return apply_weighting(z_matrix, w_method, c_method)
+
+
+def apply_weighting(z_matrix, w_method, c_method, workspace=None):
     """
     Return the weight vector of the provided decision matrix using the
-    selected weighting method.
+    selected weighting method, which is provided with the workspace array
+    only if it has the ``preallocated_arrays`` capability.
     """
-    # Use the selected weighting method
-    if w_method.upper() == "MW":
-        return weighting.mw(z_matrix)
-    elif w_method.upper() == "EM":
-        return weighting.em(z_matrix)
-    elif w_method.upper() == "SD":
-        return weighting.sd(z_matrix)
-    elif w_method.upper() == "CRITIC":
-        return weighting.critic(z_matrix, c_method)
-    elif w_method.upper() == "VIC":
-        return weighting.vic(z_matrix, c_method)
-    else:
-        raise ValueError("Unknown weighting method ({})".format(w_method))
+    method = get_method("weighting", w_method)
+    kwargs = {}
+    if workspace is not None and method.capabilities["preallocated_arrays"]:
+        kwargs["workspace"] = workspace
+    if method.capabilities["correlation"]:
+        return method.function(z_matrix, c_method, **kwargs)
+    return method.function(z_matrix, **kwargs)
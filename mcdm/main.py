@@ -23,11 +23,31 @@
 Main module for the ``mcdm`` package.
 """
 
-import csv
 import numpy as np
 
+from .helper_binary import (
+    is_binary_file,
+    read_binary,
+    write_binary,
+)
+from .helper_dedup import score_unique
+from .helper_dtype import get_dtype
+from .helper_fusion import fused_saw, is_fusable
+from .helper_loading import (
+    detect_compression,
+    open_text,
+    read_header,
+    read_labeled_chunks,
+    read_unlabeled_chunks,
+    stack_chunks,
+)
 from .helper_normalization import normalize
+from .helper_parallel import load_parallel
+from .helper_problem import DecisionProblem, prepare_problem
+from .helper_profiling import profile_stage
 from .helper_scoring import score
+from .helper_skyline import select_candidates
+from .helper_validation import check_ranking_options
 from .helper_weighting import weigh
 
 
@@ -40,96 +60,246 @@ def rank(
     c_method=None,
     w_method="MW",
     s_method="SAW",
+    top_k=None,
+    prefilter=False,
+    dedup=False,
+    dtype=None,
 ):
     """
     Return the ranking of the alternatives, in descending order, using the
-    selected methods.
+    selected methods. The decision matrix may also be provided as a decision
+    problem, whose names, criterion types, and weights are used unless they
+    are explicitly provided. If the number of top alternatives is provided,
+    only that many alternatives are returned, and the skyline prefilter can
+    be enabled to score only the alternatives that are dominated by fewer
+    than that many alternatives, in which case tied alternatives may be
+    returned in a different order. The deduplication can be enabled to score
+    each distinct alternative only once. All the stages are computed with
+    the selected floating-point data type, which is float64 by default.
     """
-    # Perform sanity checks
-    x_matrix = np.array(x_matrix, dtype=np.float64)
-    if alt_names is None:
-        alt_names = ["a" + str(i + 1) for i in range(x_matrix.shape[0])]
-    if len(alt_names) != x_matrix.shape[0]:
-        raise ValueError(
-            "The number of names for the alternatives does not match the "
-            + "number of rows in the decision matrix",
-        )
+    x_matrix, alt_names, is_benefit_x, w_vector = prepare_problem(
+        x_matrix,
+        alt_names,
+        is_benefit_x,
+        w_vector,
+        dtype=dtype,
+    )
+    check_ranking_options(top_k, prefilter, dedup, s_method)
 
-    # If not specified, consider all criteria as benefit criteria
-    if is_benefit_x is None:
-        is_benefit_x = [True for _ in range(x_matrix.shape[1])]
+    # Fold scale-only normalizations into the SAW weights if possible
+    if is_fusable(is_benefit_x, n_method, w_vector, w_method, s_method):
+        fused = fused_saw(x_matrix, is_benefit_x, n_method, w_vector)
+        if fused is not None:
+            return sort_alternatives(alt_names, *fused, top_k=top_k)
 
     # Normalize the decision matrix using the selected method
-    z_matrix, is_benefit_z = normalize(x_matrix, is_benefit_x, n_method)
+    z_matrix, is_benefit_z = normalize(
+        x_matrix,
+        is_benefit_x,
+        n_method,
+        dtype=dtype,
+    )
 
     # Determine the weight of each criterion
     if w_vector is None:
         # Weigh each criterion using the selected methods
-        w_vector = weigh(z_matrix, w_method, c_method)
+        w_vector = weigh(z_matrix, w_method, c_method, dtype=dtype)
+
+    # Discard the alternatives that are dominated by too many alternatives
+    if prefilter:
+        z_matrix, alt_names = select_candidates(
+            z_matrix,
+            alt_names,
+            is_benefit_z,
+            top_k,
+        )
 
     # Score each alternative using the selected method
-    s_vector, desc_order = score(z_matrix, is_benefit_z, w_vector, s_method)
+    return sort_alternatives(
+        alt_names,
+        *(score_unique if dedup else score)(
+            z_matrix,
+            is_benefit_z,
+            w_vector,
+            s_method,
+            dtype=dtype,
+        ),
+        top_k=top_k,
+    )
+
+
+def sort_alternatives(alt_names, s_vector, desc_order, top_k=None):
+    """
+    Return a list of tuples that includes the names of the alternatives and
+    their corresponding scores, sorted according to the provided order and
+    truncated to the provided number of top alternatives.
+    """
+    r_indices = sort_scores(s_vector, desc_order)
+    return build_ranking(alt_names, s_vector, r_indices[:top_k])
+
 
-    # Get the indices of the sorted scores
+@profile_stage("sort")
+def sort_scores(s_vector, desc_order):
+    """
+    Return the indices of the sorted scores, where tied scores are sorted by
+    the indices of their alternatives.
+    """
     if desc_order:
-        r_indices = np.argsort(-s_vector)
-    else:
-        r_indices = np.argsort(s_vector)
+        return np.argsort(-s_vector, kind="stable")
+    return np.argsort(s_vector, kind="stable")
+
 
-    # Create a list of tuples that includes the names of the alternatives and
-    # their corresponding scores in descending order
+@profile_stage("build")
+def build_ranking(alt_names, s_vector, r_indices):
+    """
+    Return a list of tuples that includes the names of the alternatives and
+    their corresponding scores in the order of the provided indices.
+    """
     ranking = []
-    for i in range(len(alt_names)):
-        ranking.append((alt_names[r_indices[i]], s_vector[r_indices[i]]))
+    for r_index in r_indices:
+        ranking.append((alt_names[r_index], s_vector[r_index]))
 
     return ranking
 
 
-def load(filepath, delimiter=",", skiprows=0, labeled_rows=False):
+def load(
+    filepath,
+    delimiter=",",
+    skiprows=0,
+    labeled_rows=False,
+    mmap_mode="r",
+    workers=None,
+    header=None,
+    dtype=None,
+):
     """
-    Return a matrix, and potentially row labels, from a text file.
+    Return a matrix, and potentially row labels, from a text file, which may
+    be compressed with gzip, bzip2, xz, or Zstandard, or from a binary file
+    that was created with the ``save`` function. The matrix of a binary file
+    is memory-mapped as read-only ("r") or copy-on-write ("c"), unless the
+    mapping mode is None, and its stored row labels are returned if the rows
+    are labeled. If more than one worker is selected, an uncompressed text
+    file is parsed in parallel by a pool of processes, which requires each
+    row to be on a single line. If the kinds of the header rows that follow
+    the skipped rows are provided, in order, as any of "names", "types", and
+    "weights", a decision problem is returned instead, with the criterion
+    names, the criterion types ("benefit" or "cost"), and the weights that
+    were parsed from those header rows. The matrix is returned with the
+    selected floating-point data type, which is float64 by default, so a
+    binary file is only memory-mapped if float64 is selected.
     """
-    matrix = None
-    row_labels = None
-    if labeled_rows:
-        # Separate the row labels from the matrix data
-        row_labels = []
-        matrix_data = []
-        num_columns = None
-        with open(filepath, mode="r", encoding="utf-8") as fp:
-            rows = csv.reader(fp, delimiter=delimiter)
-            for i, row in enumerate(rows, start=1):
-                # Skip the selected number of rows
-                if i <= skiprows:
-                    continue
-
-                # Determine the expected number of columns
-                if num_columns is None:
-                    num_columns = len(row) - 1
-
-                # Perform sanity checks
-                if len(row) <= 1:
-                    raise ValueError(
-                        "The matrix should have at least 1 column with data",
-                    )
-                if len(row) - 1 != num_columns:
-                    raise ValueError(
-                        "Wrong number of columns at line {}".format(i),
-                    )
-
-                # The row labels are expected to be
-                # in the first column of the text file
-                row_labels.append(row[0])
-                matrix_data.append(row[1:])
-        # Convert the matrix data into a float64 NumPy array
-        matrix = np.array(matrix_data, dtype=np.float64)
-    else:
-        # Load the matrix from the text file as a float64 NumPy array
-        matrix = np.loadtxt(
+    dtype = get_dtype(dtype)
+    header_values = {}
+    if is_binary_file(filepath):
+        # The delimiter and the other text options do not apply to binary
+        # files, which also store their row labels if they have any
+        matrix, row_labels, header_values["types"] = read_binary(
+            filepath,
+            mmap_mode,
+        )
+        if not labeled_rows:
+            row_labels = None
+        elif row_labels is None:
+            raise ValueError("The binary file does not contain row labels")
+    elif (
+        workers is not None
+        and workers > 1
+        and detect_compression(filepath) is None
+    ):
+        # Only the header rows are read before the byte ranges of the
+        # uncompressed text file are parsed in parallel
+        if header is not None:
+            with open_text(filepath) as fp:
+                header_values = read_header(
+                    fp,
+                    delimiter,
+                    skiprows,
+                    header,
+                    labeled_rows,
+                )
+            skiprows += len(header)
+        matrix, row_labels = load_parallel(
             filepath,
-            dtype=np.float64,
-            delimiter=delimiter,
-            skiprows=skiprows,
+            delimiter,
+            skiprows,
+            labeled_rows,
+            workers,
+            dtype=dtype,
         )
+    else:
+        with open_text(filepath) as fp:
+            # Parse the header rows in the same pass as the matrix data
+            header_values = read_header(
+                fp,
+                delimiter,
+                skiprows,
+                header or [],
+                labeled_rows,
+            )
+            first_line = skiprows + len(header_values) + 1
+            if labeled_rows:
+                # Separate the row labels from the matrix data, which are
+                # parsed in chunks directly into a NumPy array
+                matrix, row_labels = stack_chunks(
+                    read_labeled_chunks(
+                        fp,
+                        delimiter,
+                        0,
+                        first_line=first_line,
+                    ),
+                    dtype=dtype,
+                )
+            else:
+                # Load the matrix from the text file as a NumPy array
+                matrix = np.loadtxt(fp, dtype=dtype, delimiter=delimiter)
+                row_labels = None
+
+    # Convert the matrix if it was not parsed with the selected data type
+    matrix = matrix.astype(dtype, copy=False)
+
+    if header is None:
+        return matrix, row_labels
+    return DecisionProblem(
+        matrix,
+        alt_names=row_labels,
+        criteria_names=header_values.get("names"),
+        is_benefit_x=header_values.get("types"),
+        w_vector=header_values.get("weights"),
+    )
+
+
+def save(filepath, x_matrix, alt_names=None, is_benefit_x=None):
+    """
+    Save a matrix, and potentially the names of its alternatives and the
+    types of its criteria, to a binary file that can be memory-mapped by the
+    ``load`` function.
+    """
+    write_binary(filepath, x_matrix, alt_names, is_benefit_x)
+
+
+def load_chunks(
+    filepath,
+    delimiter=",",
+    skiprows=0,
+    labeled_rows=False,
+    chunk_rows=65536,
+):
+    """
+    Yield consecutive chunks of a matrix, and potentially of its row labels,
+    from a text file, which may be compressed with gzip, bzip2, xz, or
+    Zstandard, with at most the selected number of rows per chunk.
+    """
+    if chunk_rows < 1:
+        raise ValueError("The number of rows per chunk must be positive")
 
-    return matrix, row_labels
+    with open_text(filepath) as fp:
+        if labeled_rows:
+            chunks = read_labeled_chunks(fp, delimiter, skiprows, chunk_rows)
+        else:
+            chunks = read_unlabeled_chunks(
+                fp,
+                delimiter,
+                skiprows,
+                chunk_rows,
+            )
+        yield from chunks
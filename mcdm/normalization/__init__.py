@@ -23,10 +23,31 @@
 Python implementation of normalization methods.
 """
 
-from .linear1_method import linear1
-from .linear2_method import linear2
-from .linear3_method import linear3
-from .vector_method import vector
+from typing import TYPE_CHECKING
 
+from ..helper_lazy import load_attribute
+
+if TYPE_CHECKING:
+    from .linear1_method import linear1
+    from .linear2_method import linear2
+    from .linear3_method import linear3
+    from .vector_method import vector
+
+
+# Each method module is imported only when its function is first accessed
+_METHOD_MODULES = {
+    "linear1": ".linear1_method",
+    "linear2": ".linear2_method",
+    "linear3": ".linear3_method",
+    "vector": ".vector_method",
+}
 
 __all__ = ["linear1", "linear2", "linear3", "vector"]
+
+
+def __getattr__(name):
+    return load_attribute(globals(), _METHOD_MODULES, name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -36,20 +36,24 @@ information, see the following publications:
 
 import numpy as np
 
+from ..helper_dtype import current_dtype
 from ..helper_validation import check_normalization_input
 
 
-def linear1(x_matrix, is_benefit_x):
+def linear1(x_matrix, is_benefit_x, out=None):
     """
     Return the normalized version of the provided matrix using the Linear
-    Normalization (1) method.
+    Normalization (1) method. If an output array is provided, the
+    normalized matrix is written into it, which may also be the provided
+    matrix itself.
     """
     # Perform sanity checks
-    x_matrix = np.array(x_matrix, dtype=np.float64)
+    x_matrix = np.asarray(x_matrix, dtype=current_dtype())
     check_normalization_input(x_matrix, is_benefit_x, "Linear1")
 
-    # Construct the normalized matrix
-    z_matrix = np.zeros(x_matrix.shape, dtype=np.float64)
+    # Check the scale of every criterion before writing any column, so that
+    # a failed normalization leaves the output array unchanged
+    scales = []
     for j in range(x_matrix.shape[1]):
         if is_benefit_x[j]:
             max_value = np.amax(x_matrix[:, j])
@@ -59,7 +63,7 @@ def linear1(x_matrix, is_benefit_x):
                     + "zero in order to apply the Linear1 normalization "
                     + "method",
                 )
-            z_matrix[:, j] = x_matrix[:, j] / max_value
+            scales.append(max_value)
         else:
             min_value = np.amin(x_matrix[:, j])
             if min_value == 0.0:
@@ -67,7 +71,17 @@ def linear1(x_matrix, is_benefit_x):
                     "The minimum value of a cost criterion must not be zero "
                     + "in order to apply the Linear1 normalization method",
                 )
-            z_matrix[:, j] = min_value / x_matrix[:, j]
+            scales.append(min_value)
+
+    # Construct the normalized matrix
+    z_matrix = out
+    if z_matrix is None:
+        z_matrix = np.zeros(x_matrix.shape, dtype=x_matrix.dtype)
+    for j, scale in enumerate(scales):
+        if is_benefit_x[j]:
+            np.divide(x_matrix[:, j], scale, out=z_matrix[:, j])
+        else:
+            np.divide(scale, x_matrix[:, j], out=z_matrix[:, j])
 
     # All criteria have been transformed into benefit criteria
     is_benefit_z = [True for _ in range(x_matrix.shape[1])]
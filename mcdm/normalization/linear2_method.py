@@ -36,36 +36,46 @@ information, see the following publications:
 
 import numpy as np
 
+from ..helper_dtype import current_dtype
 from ..helper_validation import check_normalization_input
 
 
-def linear2(x_matrix, is_benefit_x):
+def linear2(x_matrix, is_benefit_x, out=None):
     """
     Return the normalized version of the provided matrix using the Linear
-    Normalization (2) method.
+    Normalization (2) method. If an output array is provided, the
+    normalized matrix is written into it, which may also be the provided
+    matrix itself.
     """
     # Perform sanity checks
-    x_matrix = np.array(x_matrix, dtype=np.float64)
+    x_matrix = np.asarray(x_matrix, dtype=current_dtype())
     check_normalization_input(x_matrix, is_benefit_x, "Linear2")
 
-    # Construct the normalized matrix
-    z_matrix = np.zeros(x_matrix.shape, dtype=np.float64)
+    # Check the range of every criterion before writing any column, so that
+    # a failed normalization leaves the output array unchanged
+    ranges = []
     for j in range(x_matrix.shape[1]):
-        denominator = np.amax(x_matrix[:, j]) - np.amin(x_matrix[:, j])
-        if denominator == 0.0:
+        max_value = np.amax(x_matrix[:, j])
+        min_value = np.amin(x_matrix[:, j])
+        if max_value - min_value == 0.0:
             raise ValueError(
                 "The maximum value of a criterion must not be equal to its "
                 + "minimum value in order to apply the Linear2 normalization "
                 + "method",
             )
+        ranges.append((min_value, max_value))
+
+    # Construct the normalized matrix
+    z_matrix = out
+    if z_matrix is None:
+        z_matrix = np.zeros(x_matrix.shape, dtype=x_matrix.dtype)
+    for j, (min_value, max_value) in enumerate(ranges):
+        denominator = max_value - min_value
         if is_benefit_x[j]:
-            z_matrix[:, j] = (
-                (x_matrix[:, j] - np.amin(x_matrix[:, j])) / denominator
-            )
+            np.subtract(x_matrix[:, j], min_value, out=z_matrix[:, j])
         else:
-            z_matrix[:, j] = (
-                (np.amax(x_matrix[:, j]) - x_matrix[:, j]) / denominator
-            )
+            np.subtract(max_value, x_matrix[:, j], out=z_matrix[:, j])
+        np.divide(z_matrix[:, j], denominator, out=z_matrix[:, j])
 
     # All criteria have been transformed into benefit criteria
     is_benefit_z = [True for _ in range(x_matrix.shape[1])]
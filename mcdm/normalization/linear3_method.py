@@ -36,28 +36,41 @@ information, see the following publications:
 
 import numpy as np
 
+from ..helper_dtype import current_dtype
 from ..helper_validation import check_normalization_input
 
 
-def linear3(x_matrix, is_benefit_x):
+def linear3(x_matrix, is_benefit_x, out=None):
     """
     Return the normalized version of the provided matrix using the Linear
-    Normalization (3) method.
+    Normalization (3) method. If an output array is provided, the
+    normalized matrix is written into it, which may also be the provided
+    matrix itself.
     """
     # Perform sanity checks
-    x_matrix = np.array(x_matrix, dtype=np.float64)
+    x_matrix = np.asarray(x_matrix, dtype=current_dtype())
     check_normalization_input(x_matrix, is_benefit_x, "Linear3")
 
-    # Construct the normalized matrix
-    z_matrix = np.zeros(x_matrix.shape, dtype=np.float64)
+    # Check the denominator of every criterion before writing any column, so
+    # that a failed normalization leaves the output array unchanged
+    denominators = []
     for j in range(x_matrix.shape[1]):
-        denominator = np.sum(x_matrix[:, j])
+        denominator = x_matrix.dtype.type(
+            np.sum(x_matrix[:, j], dtype=np.float64),
+        )
         if denominator == 0.0:
             raise ValueError(
                 "The sum of a criterion's values must not be equal to zero "
                 + "in order to apply the Linear3 normalization method",
             )
-        z_matrix[:, j] = x_matrix[:, j] / denominator
+        denominators.append(denominator)
+
+    # Construct the normalized matrix
+    z_matrix = out
+    if z_matrix is None:
+        z_matrix = np.zeros(x_matrix.shape, dtype=x_matrix.dtype)
+    for j, denominator in enumerate(denominators):
+        np.divide(x_matrix[:, j], denominator, out=z_matrix[:, j])
 
     # The criteria have not been transformed into benefit or cost criteria
     is_benefit_z = is_benefit_x.copy()
@@ -36,29 +36,48 @@ information, see the following publications:
 
 import numpy as np
 
+from ..helper_dtype import current_dtype
 from ..helper_validation import check_normalization_input
 
 
-def vector(x_matrix, is_benefit_x):
+def vector(x_matrix, is_benefit_x, out=None):
     """
     Return the normalized version of the provided matrix using the Vector
-    Normalization method.
+    Normalization method. If an output array is provided, the normalized
+    matrix is written into it, which may also be the provided matrix itself.
     """
     # Perform sanity checks
-    x_matrix = np.array(x_matrix, dtype=np.float64)
+    x_matrix = np.asarray(x_matrix, dtype=current_dtype())
     check_normalization_input(x_matrix, is_benefit_x, "Vector")
 
-    # Construct the normalized matrix
-    z_matrix = np.zeros(x_matrix.shape, dtype=np.float64)
+    # Check the norm of every criterion before writing any column, so that a
+    # failed normalization leaves the output array unchanged
+    norms = []
     for j in range(x_matrix.shape[1]):
-        denominator = np.sqrt(np.sum(x_matrix[:, j] ** 2))
+        denominator = x_matrix.dtype.type(
+            np.sqrt(
+                np.einsum(
+                    "i,i->",
+                    x_matrix[:, j],
+                    x_matrix[:, j],
+                    dtype=np.float64,
+                ),
+            ),
+        )
         if denominator == 0.0:
             raise ValueError(
                 "The square root of a criterion's sum of squared values must "
                 + "not be equal to zero in order to apply the Vector "
                 + "normalization method",
             )
-        z_matrix[:, j] = x_matrix[:, j] / denominator
+        norms.append(denominator)
+
+    # Construct the normalized matrix
+    z_matrix = out
+    if z_matrix is None:
+        z_matrix = np.zeros(x_matrix.shape, dtype=x_matrix.dtype)
+    for j, denominator in enumerate(norms):
+        np.divide(x_matrix[:, j], denominator, out=z_matrix[:, j])
 
     # The criteria have not been transformed into benefit or cost criteria
     is_benefit_z = is_benefit_x.copy()
@@ -23,10 +23,31 @@
 Python implementation of scoring methods.
 """
 
-from .mew_method import mew
-from .mtopsis_method import mtopsis
-from .saw_method import saw
-from .topsis_method import topsis
+from typing import TYPE_CHECKING
 
+from ..helper_lazy import load_attribute
+
+if TYPE_CHECKING:
+    from .mew_method import mew
+    from .mtopsis_method import mtopsis
+    from .saw_method import saw
+    from .topsis_method import topsis
+
+
+# Each method module is imported only when its function is first accessed
+_METHOD_MODULES = {
+    "mew": ".mew_method",
+    "mtopsis": ".mtopsis_method",
+    "saw": ".saw_method",
+    "topsis": ".topsis_method",
+}
 
 __all__ = ["saw", "mew", "topsis", "mtopsis"]
+
+
+def __getattr__(name):
+    return load_attribute(globals(), _METHOD_MODULES, name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -33,32 +33,32 @@ following publication:
 
 import numpy as np
 
+from ..helper_dtype import current_dtype
 from ..helper_validation import check_scoring_input
 
 
-def mew(z_matrix, w_vector, is_benefit_z):
+def mew(z_matrix, w_vector, is_benefit_z, out=None, workspace=None):
     """
     Return the Multiplicative Exponential Weighting scores of the provided
-    decision matrix with the provided weight vector.
+    decision matrix with the provided weight vector. If an output array is
+    provided, the scores are written into it, whereas the workspace array is
+    not needed.
     """
+    # pylint: disable=unused-argument
     # Perform sanity checks
-    z_matrix = np.array(z_matrix, dtype=np.float64)
-    w_vector = np.array(w_vector, dtype=np.float64)
+    z_matrix = np.asarray(z_matrix, dtype=current_dtype())
+    w_vector = np.array(w_vector, dtype=z_matrix.dtype)
     check_scoring_input(z_matrix, w_vector, is_benefit_z, "MEW")
 
-    # Determine whether the scores should be sorted in descending order
-    if sum(is_benefit_z) == len(is_benefit_z):
-        desc_order = True
-    elif sum(is_benefit_z) == 0:
-        desc_order = False
-    else:
-        raise ValueError(
-            "All criteria must be either benefit or cost criteria in order "
-            + "to use the MEW method",
-        )
+    # Determine whether the scores should be sorted in descending order,
+    # given that all criteria are either benefit or cost criteria
+    desc_order = sum(is_benefit_z) == len(is_benefit_z)
 
     # Compute the score of each alternative
-    s_vector = np.ones(z_matrix.shape[0], dtype=np.float64)
+    s_vector = out
+    if s_vector is None:
+        s_vector = np.empty(z_matrix.shape[0], dtype=z_matrix.dtype)
+    s_vector.fill(1.0)
     for i in range(z_matrix.shape[0]):
         for j in range(z_matrix.shape[1]):
             s_vector[i] *= z_matrix[i, j] ** w_vector[j]
@@ -32,26 +32,29 @@ the following publication:
 
 import numpy as np
 
+from ..helper_dtype import current_dtype
 from ..helper_validation import check_scoring_input
 
 
-def mtopsis(z_matrix, w_vector, is_benefit_z):
+def mtopsis(z_matrix, w_vector, is_benefit_z, out=None, workspace=None):
     """
     Return the Modified Technique for Order Preference by Similarity to Ideal
     Solution scores of the provided decision matrix with the provided weight
-    vector.
+    vector. If an output array is provided, the scores are written into it,
+    whereas the workspace array is not needed.
     """
+    # pylint: disable=unused-argument
     # Perform sanity checks
-    z_matrix = np.array(z_matrix, dtype=np.float64)
-    w_vector = np.array(w_vector, dtype=np.float64)
+    z_matrix = np.asarray(z_matrix, dtype=current_dtype())
+    w_vector = np.array(w_vector, dtype=z_matrix.dtype)
     check_scoring_input(z_matrix, w_vector, is_benefit_z, "mTOPSIS")
 
     # mTOPSIS scores should always be sorted in descending order
     desc_order = True
 
     # Derive the positive and negative ideal solutions
-    pos_ideal_sol = np.zeros(z_matrix.shape[1], dtype=np.float64)
-    neg_ideal_sol = np.zeros(z_matrix.shape[1], dtype=np.float64)
+    pos_ideal_sol = np.zeros(z_matrix.shape[1], dtype=z_matrix.dtype)
+    neg_ideal_sol = np.zeros(z_matrix.shape[1], dtype=z_matrix.dtype)
     for j in range(z_matrix.shape[1]):
         if is_benefit_z[j]:
             pos_ideal_sol[j] = np.amax(z_matrix[:, j])
@@ -61,7 +64,9 @@ def mtopsis(z_matrix, w_vector, is_benefit_z):
             neg_ideal_sol[j] = np.amax(z_matrix[:, j])
 
     # Compute the score of each alternative
-    s_vector = np.zeros(z_matrix.shape[0], dtype=np.float64)
+    s_vector = out
+    if s_vector is None:
+        s_vector = np.zeros(z_matrix.shape[0], dtype=z_matrix.dtype)
     for i in range(z_matrix.shape[0]):
         pos_ideal_dist = 0.0
         neg_ideal_dist = 0.0
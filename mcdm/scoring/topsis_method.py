@@ -31,28 +31,32 @@ the following publication:
 
 import numpy as np
 
+from ..helper_dtype import current_dtype
 from ..helper_validation import check_scoring_input
 
 
-def topsis(z_matrix, w_vector, is_benefit_z):
+def topsis(z_matrix, w_vector, is_benefit_z, out=None, workspace=None):
     """
     Return the Technique for Order Preference by Similarity to Ideal Solution
     scores of the provided decision matrix with the provided weight vector.
+    If an output array is provided, the scores are written into it, and if
+    a workspace array is provided, the weighted normalized decision matrix
+    is constructed in it.
     """
     # Perform sanity checks
-    z_matrix = np.array(z_matrix, dtype=np.float64)
-    w_vector = np.array(w_vector, dtype=np.float64)
+    z_matrix = np.asarray(z_matrix, dtype=current_dtype())
+    w_vector = np.array(w_vector, dtype=z_matrix.dtype)
     check_scoring_input(z_matrix, w_vector, is_benefit_z, "TOPSIS")
 
     # TOPSIS scores should always be sorted in descending order
     desc_order = True
 
     # Construct the weighted normalized decision matrix
-    t_matrix = np.multiply(z_matrix, w_vector)
+    t_matrix = np.multiply(z_matrix, w_vector, out=workspace)
 
     # Derive the positive and negative ideal solutions
-    pos_ideal_sol = np.zeros(t_matrix.shape[1], dtype=np.float64)
-    neg_ideal_sol = np.zeros(t_matrix.shape[1], dtype=np.float64)
+    pos_ideal_sol = np.zeros(t_matrix.shape[1], dtype=z_matrix.dtype)
+    neg_ideal_sol = np.zeros(t_matrix.shape[1], dtype=z_matrix.dtype)
     for j in range(t_matrix.shape[1]):
         if is_benefit_z[j]:
             pos_ideal_sol[j] = np.amax(t_matrix[:, j])
@@ -62,7 +66,9 @@ def topsis(z_matrix, w_vector, is_benefit_z):
             neg_ideal_sol[j] = np.amax(t_matrix[:, j])
 
     # Compute the score of each alternative
-    s_vector = np.zeros(t_matrix.shape[0], dtype=np.float64)
+    s_vector = out
+    if s_vector is None:
+        s_vector = np.zeros(t_matrix.shape[0], dtype=z_matrix.dtype)
     for i in range(t_matrix.shape[0]):
         pos_ideal_dist = np.linalg.norm(pos_ideal_sol - t_matrix[i, :])
         neg_ideal_dist = np.linalg.norm(t_matrix[i, :] - neg_ideal_sol)
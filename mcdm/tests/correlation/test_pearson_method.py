@@ -30,6 +30,7 @@ import unittest
 
 import numpy as np
 from mcdm.correlation import pearson
+from mcdm.correlation.pearson_method import pearson_sums
 
 from ..helper_testing import (
     ExtendedTestCase,
@@ -89,5 +90,42 @@ class TestPearson(ExtendedTestCase):
         self.assertRaises(ValueError, pearson, get_matrix11())
 
 
+class TestPearsonSums(ExtendedTestCase):
+    """
+    Test class for the ``pearson_sums`` function of the
+    ``mcdm.correlation.pearson_method`` module.
+    """
+    def test_linear(self):
+        """
+        Test the sums of the Pearson correlation coefficients with a linear
+        association.
+        """
+        self.assertAlmostEqualArrays(
+            pearson_sums(np.array(get_matrix01(), dtype=np.float64)),
+            np.sum(np.array(get_matrix34(), dtype=np.float64), axis=1),
+        )
+
+    def test_nonlinear(self):
+        """
+        Test the sums of the Pearson correlation coefficients with a
+        non-linear association.
+        """
+        self.assertAlmostEqualArrays(
+            pearson_sums(get_matrix02()),
+            np.sum(np.array(get_matrix35(), dtype=np.float64), axis=1),
+        )
+
+    def test_random(self):
+        """
+        Test the sums of the Pearson correlation coefficients with a random
+        matrix.
+        """
+        z_matrix = np.random.default_rng(0).random((50, 30))
+        self.assertAlmostEqualArrays(
+            pearson_sums(z_matrix),
+            np.sum(pearson(z_matrix), axis=1),
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -848,6 +848,18 @@ def get_matrix49():
     ]
 
 
+def get_matrix50():
+    """
+    Return the matrix with ID 50.
+    """
+    return [
+        [10.0, 0.5, 0.9],
+        [20.0, 0.9, 0.95],
+        [15.0, 0.7, 0.6],
+        [12.0, 0.4, 0.8],
+    ]
+
+
 def get_ranking01():
     """
     Return the ranking with ID 01.
@@ -1233,6 +1245,18 @@ def get_ranking24():
     ]
 
 
+def get_ranking25():
+    """
+    Return the ranking with ID 25.
+    """
+    return [
+        ("a1", 0.8757309941520468),
+        ("a2", 0.75),
+        ("a4", 0.7383040935672515),
+        ("a3", 0.685672514619883),
+    ]
+
+
 def get_vector01():
     """
     Return the vector with ID 01.
@@ -0,0 +1,167 @@
+# Copyright (c) 2022 Dimitrios-Georgios Akestoridis
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Test script for the ``helper_binary.py`` file of the ``mcdm`` package.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+from mcdm.helper_binary import (
+    ALIGNMENT,
+    is_binary_file,
+    read_binary,
+    write_binary,
+)
+
+from .helper_testing import (
+    ExtendedTestCase,
+    get_labels03,
+    get_matrix08,
+)
+
+
+DIR_PATH = os.path.dirname(os.path.abspath(__file__))
+
+
+class TestBinary(ExtendedTestCase):
+    """
+    Test class for the binary file format of the ``mcdm`` package.
+    """
+    def setUp(self):
+        self.tmp_dirpath = tempfile.mkdtemp()
+        self.filepath = os.path.join(self.tmp_dirpath, "matrix.bin")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dirpath)
+
+    def test_round_trip(self):
+        """
+        Test the writing and memory-mapped reading of a binary file.
+        """
+        write_binary(
+            self.filepath,
+            get_matrix08(),
+            get_labels03(),
+            [True, False, True],
+        )
+        self.assertTrue(is_binary_file(self.filepath))
+        obtained_matrix, obtained_row_labels, obtained_is_benefit = (
+            read_binary(self.filepath)
+        )
+        self.assertIsInstance(obtained_matrix, np.memmap)
+        self.assertEqual(obtained_matrix.offset % ALIGNMENT, 0)
+        self.assertFalse(obtained_matrix.flags.writeable)
+        self.assertAlmostEqualArrays(
+            np.asarray(obtained_matrix),
+            np.array(get_matrix08(), dtype=np.float64),
+        )
+        self.assertEqual(obtained_row_labels, get_labels03())
+        self.assertEqual(obtained_is_benefit, [True, False, True])
+        del obtained_matrix
+
+    def test_no_mmap(self):
+        """
+        Test the reading of a binary file without memory mapping.
+        """
+        write_binary(self.filepath, get_matrix08())
+        obtained_matrix, obtained_row_labels, obtained_is_benefit = (
+            read_binary(self.filepath, mmap_mode=None)
+        )
+        self.assertNotIsInstance(obtained_matrix, np.memmap)
+        self.assertAlmostEqualArrays(
+            obtained_matrix,
+            np.array(get_matrix08(), dtype=np.float64),
+        )
+        self.assertEqual(obtained_row_labels, None)
+        self.assertEqual(obtained_is_benefit, None)
+
+    def test_empty(self):
+        """
+        Test the writing and reading of a matrix without any rows.
+        """
+        write_binary(self.filepath, np.zeros((0, 3)), [])
+        obtained_matrix, obtained_row_labels, _ = read_binary(self.filepath)
+        self.assertEqual(obtained_matrix.shape, (0, 3))
+        self.assertEqual(obtained_row_labels, [])
+
+    def test_text_file(self):
+        """
+        Test the detection and reading of a text file.
+        """
+        filepath = os.path.join(DIR_PATH, "data", "example01.csv")
+        self.assertFalse(is_binary_file(filepath))
+        self.assertRaises(ValueError, read_binary, filepath)
+
+    def test_mmap_mode_exception(self):
+        """
+        Test that mapping modes that would modify the file are rejected
+        before the file is opened.
+        """
+        write_binary(self.filepath, get_matrix08())
+        size = os.path.getsize(self.filepath)
+        self.assertRaises(ValueError, read_binary, self.filepath, "w+")
+        self.assertRaises(ValueError, read_binary, self.filepath, "r+")
+        self.assertEqual(os.path.getsize(self.filepath), size)
+
+    def test_shape_exception(self):
+        """
+        Test the writing of a one-dimensional array.
+        """
+        self.assertRaises(
+            ValueError,
+            write_binary,
+            self.filepath,
+            [1.0, 2.0],
+        )
+
+    def test_row_labels_exception(self):
+        """
+        Test the writing of the wrong number of row labels.
+        """
+        self.assertRaises(
+            ValueError,
+            write_binary,
+            self.filepath,
+            get_matrix08(),
+            ["A", "B"],
+        )
+
+    def test_is_benefit_x_exception(self):
+        """
+        Test the writing of the wrong number of criteria types.
+        """
+        self.assertRaises(
+            ValueError,
+            write_binary,
+            self.filepath,
+            get_matrix08(),
+            None,
+            [True, True],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
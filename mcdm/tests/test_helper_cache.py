@@ -0,0 +1,230 @@
+# Copyright (c) 2022 Dimitrios-Georgios Akestoridis
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Test script for the ``helper_cache.py`` file of the ``mcdm`` package.
+"""
+
+import unittest
+
+import numpy as np
+from mcdm import (
+    cache_info,
+    correlate,
+    disable_cache,
+    enable_cache,
+    normalize,
+    rank,
+    register_method,
+    weigh,
+)
+from mcdm.helper_cache import (
+    MemoCache,
+    copy_value,
+    count_bytes,
+    memoize,
+)
+from mcdm.helper_registry import METHODS
+
+from .helper_testing import (
+    ExtendedTestCase,
+    get_matrix01,
+    get_matrix03,
+    get_ranking01,
+)
+
+
+class TestMemoCache(unittest.TestCase):
+    """
+    Test class for the ``MemoCache`` class of the ``mcdm`` package.
+    """
+    def test_eviction(self):
+        """
+        Test the eviction of the least recently used values.
+        """
+        cache = MemoCache(max_bytes=160)
+        cache.put("a", np.zeros(10))
+        cache.put("b", np.zeros(10))
+        self.assertIsNotNone(cache.get("a"))
+        cache.put("c", np.zeros(10))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNotNone(cache.get("c"))
+        self.assertEqual(cache.num_bytes, 160)
+        self.assertEqual((cache.hits, cache.misses), (3, 1))
+
+    def test_replacement(self):
+        """
+        Test the replacement of a cached value.
+        """
+        cache = MemoCache(max_bytes=160)
+        cache.put("a", np.zeros(10))
+        cache.put("a", np.zeros(5))
+        self.assertEqual(cache.num_bytes, 40)
+        self.assertEqual(len(cache.entries), 1)
+
+    def test_oversized(self):
+        """
+        Test the insertion of a value that exceeds the byte budget.
+        """
+        cache = MemoCache(max_bytes=40)
+        cache.put("a", np.zeros(10))
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.num_bytes, 0)
+
+
+class TestMemoize(ExtendedTestCase):
+    """
+    Test class for the memoization of the ``normalize``, ``weigh``, and
+    ``correlate`` functions of the ``mcdm`` package.
+    """
+    def setUp(self):
+        enable_cache()
+
+    def tearDown(self):
+        disable_cache()
+        METHODS["weighting"].pop("COUNTED", None)
+
+    def test_hits(self):
+        """
+        Test that repeated calls with the same matrix and case-insensitive
+        method names are served from the cache.
+        """
+        for s_method in ["SAW", "MEW", "TOPSIS", "mTOPSIS"]:
+            rank(
+                get_matrix01(),
+                n_method="Linear1",
+                w_method="VIC",
+                c_method="dCor" if s_method != "MEW" else "DCOR",
+                s_method=s_method,
+            )
+        info = cache_info()
+        self.assertEqual(info["misses"], 3)
+        self.assertEqual(info["hits"], 6)
+        self.assertEqual(info["entries"], 3)
+        self.assertGreater(info["bytes"], 0)
+
+    def test_copies(self):
+        """
+        Test that the cached values cannot be modified by the callers.
+        """
+        z_matrix, is_benefit_z = normalize(
+            get_matrix01(),
+            [True, True, True],
+            "Linear2",
+        )
+        z_matrix[0, 0] = -1.0
+        is_benefit_z[0] = False
+        obtained_matrix, obtained_is_benefit = normalize(
+            get_matrix01(),
+            [True, True, True],
+            "Linear2",
+        )
+        self.assertGreaterEqual(obtained_matrix[0, 0], 0.0)
+        self.assertEqual(obtained_is_benefit, [True, True, True])
+        c_matrix = correlate(get_matrix01(), "Pearson")
+        c_matrix[:] = 0.0
+        self.assertAlmostEqualArrays(
+            np.diag(correlate(get_matrix01(), "Pearson")),
+            np.ones(3, dtype=np.float64),
+        )
+
+    def test_disabled(self):
+        """
+        Test that the cache is not used while it is disabled.
+        """
+        disable_cache()
+        self.assertAlmostEqualRankings(rank(get_matrix03()), get_ranking01())
+        self.assertEqual(cache_info()["entries"], 0)
+        self.assertEqual(cache_info()["max_bytes"], 0)
+
+    def test_register_method(self):
+        """
+        Test that registering a method invalidates the cache.
+        """
+        weigh(get_matrix01(), "MW")
+        register_method(
+            "weighting",
+            "Counted",
+            lambda z_matrix: np.full(z_matrix.shape[1], 1.0 / 3.0),
+        )
+        self.assertEqual(cache_info()["entries"], 0)
+
+    def test_shrink(self):
+        """
+        Test the eviction of cached values when the byte budget is reduced.
+        """
+        weigh(get_matrix01(), "MW")
+        weigh(get_matrix01(), "SD")
+        enable_cache(max_bytes=24)
+        self.assertEqual(cache_info()["entries"], 1)
+
+    def test_budget_exception(self):
+        """
+        Test the enabling of the cache with an invalid byte budget.
+        """
+        self.assertRaises(ValueError, enable_cache, 0)
+
+    def test_keyword_arguments(self):
+        """
+        Test the memoization of a function with keyword arguments.
+        """
+        calls = []
+
+        @memoize
+        def scale(matrix, factor=1.0):
+            calls.append(factor)
+            return matrix * factor
+
+        scale(get_matrix01(), factor=2.0)
+        scale(get_matrix01(), factor=2.0)
+        self.assertEqual(calls, [2.0])
+
+
+class TestCountBytes(unittest.TestCase):
+    """
+    Test class for the ``count_bytes`` function of the ``mcdm`` package.
+    """
+    def test_values(self):
+        """
+        Test the number of bytes of various results.
+        """
+        self.assertEqual(count_bytes((np.zeros(4), [True, False])), 48)
+        self.assertEqual(count_bytes(True), 8)
+
+
+class TestCopyValue(unittest.TestCase):
+    """
+    Test class for the ``copy_value`` function of the ``mcdm`` package.
+    """
+    def test_values(self):
+        """
+        Test the copying of various results.
+        """
+        value = (np.zeros(2), [True], True)
+        obtained_value = copy_value(value)
+        self.assertIsNot(obtained_value[0], value[0])
+        self.assertIsNot(obtained_value[1], value[1])
+        self.assertIs(obtained_value[2], True)
+
+
+if __name__ == "__main__":
+    unittest.main()
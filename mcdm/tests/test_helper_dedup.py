@@ -0,0 +1,137 @@
+# Copyright (c) 2022 Dimitrios-Georgios Akestoridis
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Test script for the ``helper_dedup.py`` file of the ``mcdm`` package.
+"""
+
+import unittest
+from unittest import mock
+
+import numpy as np
+from mcdm import rank, register_method
+from mcdm.helper_dedup import unique_rows
+from mcdm.helper_registry import METHODS
+
+
+def get_duplicated_matrix(seed):
+    """
+    Return a random matrix with many duplicate rows and negative zeros.
+    """
+    rng = np.random.default_rng(seed)
+    x_matrix = rng.random((50, 4))[rng.integers(0, 50, 1000)]
+    x_matrix[::7, 0] = 0.0
+    x_matrix[::14, 0] = -0.0
+    return x_matrix
+
+
+class TestUniqueRows(unittest.TestCase):
+    """
+    Test class for the ``unique_rows`` function of the ``mcdm`` package.
+    """
+    def assertUniqueRows(self, x_matrix):
+        # pylint: disable=invalid-name
+        """
+        Assert that the distinct rows are found in the order of their first
+        occurrence.
+        """
+        u_indices, positions = unique_rows(x_matrix)
+        self.assertTrue(
+            np.array_equal(x_matrix[u_indices][positions], x_matrix),
+        )
+        _, expected = np.unique(x_matrix, return_index=True, axis=0)
+        self.assertEqual(u_indices.tolist(), sorted(expected.tolist()))
+
+    def test_random(self):
+        """
+        Test the distinct rows of a matrix with many duplicate rows.
+        """
+        self.assertUniqueRows(get_duplicated_matrix(0))
+
+    def test_collisions(self):
+        """
+        Test the distinct rows when all the hashes collide.
+        """
+        with mock.patch("mcdm.helper_dedup.HASH_MULTIPLIER", np.uint64(0)):
+            self.assertUniqueRows(get_duplicated_matrix(1))
+
+    def test_empty(self):
+        """
+        Test the distinct rows of a matrix without any rows.
+        """
+        u_indices, positions = unique_rows(np.zeros((0, 3)))
+        self.assertEqual(u_indices.shape, (0,))
+        self.assertEqual(positions.shape, (0,))
+
+
+class TestRankDedup(unittest.TestCase):
+    """
+    Test class for the deduplication of the ``rank`` function of the
+    ``mcdm`` package.
+    """
+    def test_identical(self):
+        """
+        Test that the deduplication does not change the ranking.
+        """
+        x_matrix = get_duplicated_matrix(2)
+        for kwargs in [
+            {"n_method": "Linear2", "w_method": "SD", "s_method": "SAW"},
+            {"n_method": "Linear1", "s_method": "MEW"},
+            {"n_method": "Linear3", "w_method": "EM", "s_method": "TOPSIS"},
+            {"n_method": "Vector", "w_method": "SD", "s_method": "mTOPSIS"},
+            {"is_benefit_x": [False] * 4, "s_method": "SAW"},
+        ]:
+            self.assertEqual(
+                rank(x_matrix, dedup=True, **kwargs),
+                rank(x_matrix, **kwargs),
+            )
+        self.assertEqual(
+            rank(x_matrix, top_k=5, prefilter=True, dedup=True),
+            rank(x_matrix, top_k=5, prefilter=True),
+        )
+
+    def test_exception(self):
+        """
+        Test the deduplication with a scoring method whose scores depend on
+        duplicate alternatives.
+        """
+        register_method(
+            "scoring",
+            "Counted",
+            lambda z_matrix, w_vector, is_benefit_z: (
+                np.dot(z_matrix, w_vector) / z_matrix.shape[0],
+                True,
+            ),
+        )
+        try:
+            self.assertRaises(
+                ValueError,
+                rank,
+                get_duplicated_matrix(3),
+                s_method="Counted",
+                dedup=True,
+            )
+        finally:
+            METHODS["scoring"].pop("COUNTED")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,222 @@
+# Copyright (c) 2022 Dimitrios-Georgios Akestoridis
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Test script for the ``helper_diskcache.py`` file of the ``mcdm`` package.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+from mcdm import (
+    correlate,
+    disable_disk_cache,
+    enable_disk_cache,
+    rank,
+    weigh,
+)
+from mcdm.helper_diskcache import DISK_CACHE, call_with_disk_cache
+
+from .helper_testing import (
+    ExtendedTestCase,
+    get_matrix01,
+    get_matrix03,
+    get_ranking01,
+)
+
+
+def list_entries(dirpath):
+    """
+    Return the sorted names of the entries in the provided directory.
+    """
+    return sorted(os.listdir(dirpath))
+
+
+class TestDiskCache(ExtendedTestCase):
+    """
+    Test class for the on-disk cache of the ``mcdm`` package.
+    """
+    def setUp(self):
+        self.dirpath = tempfile.mkdtemp()
+        enable_disk_cache(self.dirpath)
+
+    def tearDown(self):
+        disable_disk_cache()
+        shutil.rmtree(self.dirpath)
+
+    def test_correlate(self):
+        """
+        Test the caching of correlation matrices.
+        """
+        expected = correlate(get_matrix01(), "Pearson")
+        self.assertEqual(len(list_entries(self.dirpath)), 1)
+        filepath = os.path.join(self.dirpath, list_entries(self.dirpath)[0])
+        self.assertTrue(filepath.endswith(".npy"))
+        self.assertTrue(os.path.basename(filepath).startswith("pearson-"))
+        obtained = correlate(get_matrix01(), "Pearson")
+        self.assertIsInstance(obtained, np.memmap)
+        self.assertAlmostEqualArrays(obtained, expected)
+        self.assertEqual(len(list_entries(self.dirpath)), 1)
+        obtained[0, 0] = -1.0
+        self.assertAlmostEqualArrays(
+            correlate(get_matrix01(), "Pearson"),
+            expected,
+        )
+        correlate(get_matrix01(), "AbsPearson")
+        correlate(get_matrix03(), "Pearson")
+        self.assertEqual(len(list_entries(self.dirpath)), 3)
+
+    def test_weigh(self):
+        """
+        Test the caching of the correlation matrices of CRITIC and VIC.
+        """
+        expected = weigh(get_matrix01(), "CRITIC", "dCor")
+        self.assertEqual(len(list_entries(self.dirpath)), 1)
+        with mock.patch.object(
+            DISK_CACHE,
+            "store",
+            side_effect=AssertionError,
+        ):
+            self.assertAlmostEqualArrays(
+                weigh(get_matrix01(), "CRITIC", "dCor"),
+                expected,
+            )
+        weigh(get_matrix01(), "VIC", "dCor")
+        self.assertEqual(len(list_entries(self.dirpath)), 1)
+        self.assertAlmostEqualRankings(
+            rank(get_matrix03(), s_method="TOPSIS"),
+            get_ranking01(),
+        )
+
+    def test_eviction(self):
+        """
+        Test the eviction of the least recently used entries.
+        """
+        correlate(get_matrix01(), "Pearson")
+        correlate(get_matrix03(), "Pearson")
+        sizes = [
+            os.path.getsize(os.path.join(self.dirpath, name))
+            for name in list_entries(self.dirpath)
+        ]
+        self.assertEqual(len(sizes), 2)
+        for i, name in enumerate(list_entries(self.dirpath)):
+            os.utime(os.path.join(self.dirpath, name), (i, i))
+        enable_disk_cache(self.dirpath, max_bytes=max(sizes))
+        self.assertEqual(len(list_entries(self.dirpath)), 1)
+        for name in ["partial.tmp", "stale.tmp"]:
+            with open(os.path.join(self.dirpath, name), "wb"):
+                pass
+        os.utime(os.path.join(self.dirpath, "stale.tmp"), (0, 0))
+        enable_disk_cache(self.dirpath, max_bytes=1)
+        self.assertEqual(list_entries(self.dirpath), ["partial.tmp"])
+
+    def test_vanished_entries(self):
+        """
+        Test the handling of entries that other processes remove.
+        """
+        correlate(get_matrix01(), "Pearson")
+        DISK_CACHE.max_bytes = 1
+        with mock.patch("os.remove", side_effect=FileNotFoundError):
+            DISK_CACHE.evict()
+        self.assertEqual(len(list_entries(self.dirpath)), 1)
+        entry = mock.Mock()
+        entry.name = "vanished.npy"
+        entry.stat.side_effect = FileNotFoundError
+        with mock.patch("os.scandir", return_value=[entry]):
+            DISK_CACHE.evict()
+        self.assertIsNone(
+            DISK_CACHE.load(os.path.join(self.dirpath, "missing.npy")),
+        )
+
+    def test_failed_write(self):
+        """
+        Test that failed writes are ignored and do not leave temporary files
+        behind.
+        """
+        expected = correlate(get_matrix03(), "Pearson")
+        shutil.rmtree(self.dirpath)
+        os.makedirs(self.dirpath)
+        for target in ["numpy.save", "os.replace", "tempfile.mkstemp"]:
+            with mock.patch(target, side_effect=OSError):
+                self.assertAlmostEqualArrays(
+                    correlate(get_matrix03(), "Pearson"),
+                    expected,
+                )
+            self.assertEqual(list_entries(self.dirpath), [])
+        with mock.patch("numpy.save", side_effect=KeyboardInterrupt):
+            self.assertRaises(
+                KeyboardInterrupt,
+                correlate,
+                get_matrix03(),
+                "Pearson",
+            )
+        self.assertEqual(list_entries(self.dirpath), [])
+
+    def test_function_keys(self):
+        """
+        Test that redefined functions and lambda functions do not share
+        entries.
+        """
+        namespace = {}
+        for source, expected in [
+            ("def f(x):\n    return x + 1.0\n", 2.0),
+            ("def f(x):\n    return x + 2.0\n", 3.0),
+        ]:
+            exec(source, namespace)  # nosec
+            namespace["f"].__module__ = __name__
+            self.assertAlmostEqualArrays(
+                call_with_disk_cache(namespace["f"], np.ones(2)),
+                np.full(2, expected),
+            )
+        self.assertEqual(len(list_entries(self.dirpath)), 2)
+        for offset in [1.0, 2.0]:
+            self.assertAlmostEqualArrays(
+                call_with_disk_cache(
+                    lambda x, offset=offset: x + offset,
+                    np.ones(2),
+                ),
+                np.full(2, 1.0 + offset),
+            )
+        self.assertEqual(len(list_entries(self.dirpath)), 2)
+
+    def test_disabled(self):
+        """
+        Test that no entries are written while the cache is disabled.
+        """
+        disable_disk_cache()
+        self.assertIsNone(DISK_CACHE.dirpath)
+        obtained = call_with_disk_cache(np.negative, get_matrix03())
+        self.assertNotIsInstance(obtained, np.memmap)
+        self.assertEqual(list_entries(self.dirpath), [])
+
+    def test_invalid_budget(self):
+        """
+        Test the rejection of non-positive byte budgets.
+        """
+        self.assertRaises(ValueError, enable_disk_cache, self.dirpath, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,179 @@
+# Copyright (c) 2022 Dimitrios-Georgios Akestoridis
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Test script for the ``helper_dtype.py`` file of the ``mcdm`` package.
+"""
+
+import threading
+import unittest
+
+import numpy as np
+from mcdm import (
+    correlate,
+    disable_cache,
+    enable_cache,
+    normalize,
+    score,
+    weigh,
+)
+from mcdm.helper_dtype import (
+    current_dtype,
+    float_dtype,
+    get_dtype,
+    select_dtype,
+)
+from mcdm.helper_validation import check_weighting_input
+
+from .helper_testing import ExtendedTestCase, get_matrix01
+
+
+class TestDtype(ExtendedTestCase):
+    """
+    Test class for the floating-point data types of the ``mcdm`` package.
+    """
+    def test_get_dtype(self):
+        """
+        Test the selection of floating-point data types.
+        """
+        self.assertEqual(get_dtype(None), np.float64)
+        self.assertEqual(get_dtype("float32"), np.float32)
+        self.assertEqual(get_dtype(np.float64), np.float64)
+        self.assertRaises(ValueError, get_dtype, np.int32)
+        self.assertRaises(ValueError, get_dtype, "X")
+        self.assertEqual(float_dtype([1, 2]), np.float64)
+        self.assertEqual(
+            float_dtype(np.ones(2, dtype=np.float32)),
+            np.float32,
+        )
+
+    def test_select_dtype(self):
+        """
+        Test the thread-local selection of floating-point data types.
+        """
+        dtypes = []
+        with select_dtype(np.float32) as dtype:
+            self.assertEqual(dtype, np.float32)
+            with select_dtype(None):
+                dtypes.append(current_dtype())
+            thread = threading.Thread(
+                target=lambda: dtypes.append(current_dtype()),
+            )
+            thread.start()
+            thread.join()
+            with self.assertRaises(ValueError):
+                with select_dtype(np.float64):
+                    raise ValueError
+            dtypes.append(current_dtype())
+        dtypes.append(current_dtype())
+        self.assertEqual(
+            dtypes,
+            [np.float32, np.float64, np.float32, np.float64],
+        )
+
+    def test_stages(self):
+        """
+        Test the stages with float32 computations.
+        """
+        z_matrix, _ = normalize(
+            get_matrix01(),
+            [True, True, True],
+            "Linear2",
+            dtype=np.float32,
+        )
+        self.assertEqual(z_matrix.dtype, np.float32)
+        self.assertEqual(
+            correlate(z_matrix, "dCor", dtype=np.float32).dtype,
+            np.float32,
+        )
+        w_vector = weigh(z_matrix, "CRITIC", "Pearson", dtype=np.float32)
+        self.assertEqual(w_vector.dtype, np.float32)
+        s_vector, _ = score(
+            z_matrix,
+            [True, True, True],
+            w_vector,
+            "TOPSIS",
+            dtype=np.float32,
+        )
+        self.assertEqual(s_vector.dtype, np.float32)
+        self.assertEqual(weigh(z_matrix, "SD").dtype, np.float64)
+        self.assertAlmostEqualArrays(
+            normalize(z_matrix, [True, True, True], None)[0],
+            np.array(z_matrix, dtype=np.float64),
+        )
+
+    def test_cache(self):
+        """
+        Test that the memoization cache distinguishes the data types.
+        """
+        enable_cache()
+        try:
+            for dtype in [np.float32, np.float64, np.float32]:
+                self.assertEqual(
+                    weigh(get_matrix01(), "MW", dtype=dtype).dtype,
+                    dtype,
+                )
+        finally:
+            disable_cache()
+
+    def test_tolerance(self):
+        """
+        Test the tolerance of the column sums of float32 matrices.
+        """
+        z_matrix = np.full((10, 2), 0.1, dtype=np.float32)
+        z_matrix[0] += 1e-4
+        check_weighting_input(z_matrix, None, "EM")
+        self.assertRaises(
+            ValueError,
+            check_weighting_input,
+            np.array(z_matrix, dtype=np.float64),
+            None,
+            "EM",
+        )
+
+    def test_large_matrix(self):
+        """
+        Test that the column reductions of a large float32 matrix are
+        accumulated in float64.
+        """
+        rng = np.random.default_rng(0)
+        z_matrix = np.column_stack([
+            rng.uniform(0.9, 0.901, 2000000),
+            rng.uniform(0.0, 1.0, 2000000),
+            rng.uniform(0.5, 0.55, 2000000),
+        ])
+        for w_method in ["SD", "CRITIC"]:
+            np.testing.assert_allclose(
+                weigh(z_matrix, w_method, dtype=np.float32),
+                weigh(z_matrix, w_method),
+                rtol=1e-4,
+            )
+        z_matrix, _ = normalize(
+            1.0 + z_matrix,
+            [True, True, True],
+            "Linear3",
+            dtype=np.float32,
+        )
+        check_weighting_input(z_matrix, None, "EM")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+# Copyright (c) 2022 Dimitrios-Georgios Akestoridis
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Test script for the ``helper_fusion.py`` file of the ``mcdm`` package.
+"""
+
+import unittest
+
+import numpy as np
+from mcdm import Profiler, normalize, rank, score, weigh
+from mcdm.helper_fusion import fused_saw, is_fusable
+
+from .helper_testing import ExtendedTestCase
+
+
+def rank_unfused(x_matrix, is_benefit_x, n_method, w_vector):
+    """
+    Return the ranking of the alternatives with the SAW scores of the
+    normalized matrix, without the fused kernel.
+    """
+    z_matrix, is_benefit_z = normalize(x_matrix, is_benefit_x, n_method)
+    if w_vector is None:
+        w_vector = weigh(z_matrix, "MW")
+    s_vector, desc_order = score(z_matrix, is_benefit_z, w_vector, "SAW")
+    order = np.argsort(-s_vector if desc_order else s_vector, kind="stable")
+    return [("a" + str(i + 1), s_vector[i]) for i in order]
+
+
+class TestFusion(ExtendedTestCase):
+    """
+    Test class for the fused kernels of the ``mcdm`` package.
+    """
+    def setUp(self):
+        self.x_matrix = np.random.default_rng(0).uniform(
+            1.0,
+            10.0,
+            (30, 4),
+        )
+        self.x_matrix[7] = self.x_matrix[3]
+
+    def test_rank(self):
+        """
+        Test that fused rankings match the rankings of the general path.
+        """
+        for n_method, is_benefit_x in [
+            ("Linear1", [True, True, True, True]),
+            ("Linear3", [True, True, True, True]),
+            ("Linear3", [False, False, False, False]),
+            ("Vector", [True, True, True, True]),
+            ("Vector", [False, False, False, False]),
+        ]:
+            for w_vector in [None, [0.1, 0.2, 0.3, 0.4]]:
+                with Profiler() as profiler:
+                    obtained = rank(
+                        self.x_matrix,
+                        is_benefit_x=is_benefit_x,
+                        n_method=n_method,
+                        w_vector=w_vector,
+                    )
+                self.assertEqual(
+                    [record["stage"] for record in profiler.records],
+                    ["fused", "sort", "build"],
+                )
+                self.assertAlmostEqualRankings(
+                    obtained,
+                    rank_unfused(
+                        self.x_matrix,
+                        is_benefit_x,
+                        n_method,
+                        w_vector,
+                    ),
+                )
+
+    def test_is_fusable(self):
+        """
+        Test the detection of the combinations that can be fused.
+        """
+        self.assertTrue(is_fusable([True], "linear1", None, "MW", "saw"))
+        self.assertTrue(is_fusable([False], "Vector", [1.0], None, "SAW"))
+        self.assertFalse(is_fusable([True], None, None, "MW", "SAW"))
+        self.assertFalse(is_fusable([True], "Linear1", None, "MW", None))
+        self.assertFalse(is_fusable([True], "Linear1", None, "MW", "MEW"))
+        self.assertFalse(is_fusable([True], "Linear1", None, "SD", "SAW"))
+        self.assertFalse(is_fusable([True], "Linear1", None, None, "SAW"))
+        self.assertFalse(is_fusable([True], "Linear2", None, "MW", "SAW"))
+        self.assertFalse(is_fusable([False], "Linear1", None, "MW", "SAW"))
+        self.assertFalse(
+            is_fusable([True, False], "Vector", None, "MW", "SAW"),
+        )
+
+    def test_fallback(self):
+        """
+        Test that invalid arguments are reported by the general path.
+        """
+        x_matrix = np.copy(self.x_matrix)
+        self.assertIsNone(
+            fused_saw(x_matrix, [True] * 4, "Linear1", [0.5, 0.5, 0.5, 0.5]),
+        )
+        self.assertIsNone(
+            fused_saw(x_matrix, [True] * 4, "Linear1", [0.5, 0.5]),
+        )
+        self.assertRaises(
+            ValueError,
+            rank,
+            x_matrix,
+            n_method="Linear1",
+            w_vector=[0.5, 0.5, 0.5, 0.5],
+        )
+        x_matrix[:, 2] = 0.0
+        self.assertIsNone(fused_saw(x_matrix, [True] * 4, "Linear1", None))
+        self.assertRaises(ValueError, rank, x_matrix, n_method="Linear1")
+        x_matrix[0, 0] = -1.0
+        self.assertRaises(ValueError, rank, x_matrix, n_method="Linear3")
+
+
+if __name__ == "__main__":
+    unittest.main()
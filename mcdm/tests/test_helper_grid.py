@@ -0,0 +1,199 @@
+# Copyright (c) 2022 Dimitrios-Georgios Akestoridis
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Test script for the ``helper_grid.py`` file of the ``mcdm`` package.
+"""
+
+import unittest
+
+from mcdm import (
+    DecisionProblem,
+    rank,
+    rank_all,
+)
+
+from .helper_testing import (
+    ExtendedTestCase,
+    get_matrix01,
+    get_matrix50,
+    get_ranking25,
+)
+
+
+class TestRankAll(ExtendedTestCase):
+    """
+    Test class for the ``rank_all`` function of the ``mcdm`` package.
+    """
+    def assertRankings(self, rankings, x_matrix, **kwargs):
+        # pylint: disable=invalid-name
+        """
+        Assert that each ranking is equal to the one of the ``rank``
+        function with the same methods.
+        """
+        for (n_method, w_method, c_method, s_method), ranking in (
+            rankings.items()
+        ):
+            self.assertAlmostEqualRankings(
+                ranking,
+                rank(
+                    x_matrix,
+                    n_method=n_method,
+                    w_method=w_method,
+                    c_method=c_method,
+                    s_method=s_method,
+                    **kwargs,
+                ),
+            )
+
+    def test_all(self):
+        """
+        Test the ranking with all the combinations of the registered methods,
+        with and without a pool of threads.
+        """
+        for workers in [None, 2]:
+            obtained_rankings = rank_all(get_matrix01(), workers=workers)
+            self.assertEqual(len(obtained_rankings), 116)
+            self.assertRankings(obtained_rankings, get_matrix01())
+
+        # The EM weighting method is only compatible with Linear3 and the
+        # VIC weighting method is not compatible with Pearson
+        self.assertEqual(
+            {key[0] for key in obtained_rankings if key[1] == "EM"},
+            {"Linear3"},
+        )
+        self.assertNotIn(
+            ("Linear1", "VIC", "Pearson", "SAW"),
+            obtained_rankings,
+        )
+        self.assertIn(
+            ("Linear1", "MW", None, "SAW"),
+            obtained_rankings,
+        )
+
+    def test_selected(self):
+        """
+        Test the ranking with selected methods and cost criteria.
+        """
+        obtained_rankings = rank_all(
+            get_matrix50(),
+            alt_names=["a1", "a2", "a3", "a4"],
+            is_benefit_x=[False, True, True],
+            n_methods=["Linear1", "Linear2"],
+            w_methods=["SD", "CRITIC"],
+            c_methods=["dCor"],
+            s_methods=["SAW", "TOPSIS"],
+        )
+        self.assertEqual(
+            sorted(obtained_rankings),
+            [
+                ("Linear1", "CRITIC", "dCor", "SAW"),
+                ("Linear1", "CRITIC", "dCor", "TOPSIS"),
+                ("Linear1", "SD", None, "SAW"),
+                ("Linear1", "SD", None, "TOPSIS"),
+                ("Linear2", "CRITIC", "dCor", "SAW"),
+                ("Linear2", "CRITIC", "dCor", "TOPSIS"),
+                ("Linear2", "SD", None, "SAW"),
+                ("Linear2", "SD", None, "TOPSIS"),
+            ],
+        )
+        self.assertRankings(
+            obtained_rankings,
+            get_matrix50(),
+            alt_names=["a1", "a2", "a3", "a4"],
+            is_benefit_x=[False, True, True],
+        )
+
+    def test_problem(self):
+        """
+        Test the ranking of a decision problem with preset weights.
+        """
+        obtained_rankings = rank_all(
+            DecisionProblem(
+                get_matrix50(),
+                is_benefit_x=[False, True, True],
+                w_vector=[0.5, 0.25, 0.25],
+            ),
+            n_methods=["Linear1"],
+            s_methods=["SAW"],
+        )
+        self.assertEqual(
+            list(obtained_rankings),
+            [("Linear1", None, None, "SAW")],
+        )
+        self.assertAlmostEqualRankings(
+            obtained_rankings[("Linear1", None, None, "SAW")],
+            get_ranking25(),
+        )
+
+    def test_no_normalization(self):
+        """
+        Test the ranking of a normalized matrix without normalization.
+        """
+        obtained_rankings = rank_all(
+            get_matrix01(),
+            n_methods=[None],
+            w_methods=["MW"],
+            s_methods=["MEW"],
+        )
+        self.assertRankings(obtained_rankings, get_matrix01())
+        self.assertEqual(len(obtained_rankings), 1)
+
+    def test_invalid_exception(self):
+        """
+        Test the ranking with incompatible methods that should raise an
+        exception.
+        """
+        self.assertRaises(
+            ValueError,
+            rank_all,
+            get_matrix01(),
+            n_methods=["Linear1"],
+            w_methods=["EM"],
+            skip_invalid=False,
+        )
+
+    def test_unknown_exception(self):
+        """
+        Test the ranking with an unknown method.
+        """
+        self.assertRaises(
+            ValueError,
+            rank_all,
+            get_matrix01(),
+            s_methods=["Unknown"],
+        )
+
+    def test_names_exception(self):
+        """
+        Test the ranking with the wrong number of names for the
+        alternatives.
+        """
+        self.assertRaises(
+            ValueError,
+            rank_all,
+            get_matrix01(),
+            alt_names=["a1"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,378 @@
+# Copyright (c) 2022 Dimitrios-Georgios Akestoridis
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Test script for the ``helper_incremental.py`` file of the ``mcdm`` package.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+from mcdm import (
+    DecisionProblem,
+    IncrementalRanker,
+    disable_cache,
+    disable_disk_cache,
+    enable_cache,
+    enable_disk_cache,
+    rank,
+    register_method,
+)
+from mcdm.helper_cache import MEMO_CACHE
+from mcdm.helper_registry import METHODS
+
+from .helper_testing import (
+    ExtendedTestCase,
+    get_matrix01,
+    get_matrix03,
+    get_ranking01,
+)
+
+
+class TestIncrementalRanker(ExtendedTestCase):
+    """
+    Test class for the ``IncrementalRanker`` class of the ``mcdm`` package.
+    """
+    def setUp(self):
+        # Normalization methods that do not normalize each column
+        # independently, which divide all values by the overall maximum or
+        # by the maximum of the first column
+        register_method(
+            "normalization",
+            "Rescaled",
+            lambda x_matrix, is_benefit_x: (
+                np.array(x_matrix) / np.amax(x_matrix),
+                [True for _ in is_benefit_x],
+            ),
+        )
+        register_method(
+            "normalization",
+            "FirstRescaled",
+            lambda x_matrix, is_benefit_x: (
+                np.array(x_matrix) / np.amax(np.array(x_matrix)[:, 0]),
+                [True for _ in is_benefit_x],
+            ),
+        )
+
+    def tearDown(self):
+        METHODS["normalization"].pop("RESCALED")
+        METHODS["normalization"].pop("FIRSTRESCALED")
+
+    def test_delta_updates(self):
+        """
+        Test that delta updates match the rankings of the ``rank`` function.
+        """
+        rng = np.random.default_rng(0)
+        x_matrix = rng.uniform(1.0, 10.0, (200, 6))
+        is_benefit_x = [True, False, True, False, True, False]
+        ranker = IncrementalRanker(
+            x_matrix,
+            is_benefit_x=is_benefit_x,
+            n_method="Linear1",
+            refresh_interval=5,
+        )
+        w_vector = np.full(6, 1.0 / 6.0)
+        for i in range(20):
+            if i % 7 == 6:
+                # Change most of the weights at once
+                w_vector = rng.dirichlet(np.ones(6))
+            elif i % 3 > 0:
+                # Move some weight from one criterion to another
+                j, k = rng.choice(6, 2, replace=False)
+                delta = 0.5 * rng.random() * w_vector[j]
+                w_vector[j] -= delta
+                w_vector[k] += delta
+            self.assertAlmostEqualRankings(
+                ranker.rank(w_vector),
+                rank(
+                    x_matrix,
+                    is_benefit_x=is_benefit_x,
+                    n_method="Linear1",
+                    w_vector=w_vector,
+                ),
+            )
+            self.assertLessEqual(ranker.num_updates, 5)
+        self.assertTrue(np.array_equal(ranker.w_vector, w_vector))
+
+    def test_tied_scores(self):
+        """
+        Test that tied scores are sorted as in the ``rank`` function.
+        """
+        rng = np.random.default_rng(2)
+        x_matrix = np.tile(rng.uniform(1.0, 10.0, (10, 3)), (10, 1))
+        x_matrix = x_matrix[rng.permutation(100)]
+        ranker = IncrementalRanker(
+            x_matrix,
+            n_method="Linear1",
+            refresh_interval=100,
+        )
+        for _ in range(10):
+            w_vector = rng.dirichlet(np.ones(3))
+            self.assertAlmostEqualRankings(
+                ranker.rank(w_vector),
+                rank(x_matrix, n_method="Linear1", w_vector=w_vector),
+            )
+
+    def test_new_tied_scores(self):
+        """
+        Test that scores that become tied after column updates are sorted as
+        in the ``rank`` function.
+        """
+        # The values are multiples of a power of two, so that the updated
+        # scores of the duplicate rows are exactly equal
+        rng = np.random.default_rng(3)
+        x_matrix = np.column_stack(
+            [rng.permutation(20) / 32.0, rng.permutation(20) / 32.0],
+        )
+        w_vector = [0.5, 0.5]
+        ranker = IncrementalRanker(x_matrix, refresh_interval=100)
+        ranker.rank(w_vector)
+        for j_col in range(2):
+            x_matrix[:, j_col] = np.tile(rng.permutation(10) / 16.0, 2)
+            ranker.update_column(j_col, x_matrix[:, j_col])
+            self.assertAlmostEqualRankings(
+                ranker.rank(w_vector),
+                rank(x_matrix, w_vector=w_vector),
+            )
+
+    def test_default_weights(self):
+        """
+        Test the default weights and the weights of decision problems.
+        """
+        ranker = IncrementalRanker(get_matrix03())
+        self.assertAlmostEqualRankings(ranker.rank(), rank(get_matrix03()))
+        self.assertAlmostEqualRankings(ranker.rank(), rank(get_matrix03()))
+        problem = DecisionProblem(
+            get_matrix03(),
+            is_benefit_x=[False, False],
+            w_vector=[0.7, 0.3],
+        )
+        self.assertAlmostEqualRankings(
+            IncrementalRanker(problem).rank(),
+            rank(problem),
+        )
+
+    def test_cost_criteria(self):
+        """
+        Test rankings in ascending order for cost criteria.
+        """
+        ranker = IncrementalRanker(
+            get_matrix01(),
+            is_benefit_x=[False, False, False],
+        )
+        for w_vector in [[0.2, 0.3, 0.5], [0.2, 0.5, 0.3], [0.6, 0.1, 0.3]]:
+            self.assertAlmostEqualRankings(
+                ranker.rank(w_vector),
+                rank(
+                    get_matrix01(),
+                    is_benefit_x=[False, False, False],
+                    w_vector=w_vector,
+                ),
+            )
+
+    def test_ranking(self):
+        """
+        Test the ranking of a normalized matrix with equal weights.
+        """
+        self.assertAlmostEqualRankings(
+            IncrementalRanker(get_matrix03()).rank([0.5, 0.5]),
+            get_ranking01(),
+        )
+
+    def test_exceptions(self):
+        """
+        Test the exceptions of the ``IncrementalRanker`` class.
+        """
+        self.assertRaises(
+            ValueError,
+            IncrementalRanker,
+            get_matrix03(),
+            refresh_interval=0,
+        )
+        self.assertRaises(
+            ValueError,
+            IncrementalRanker,
+            get_matrix03(),
+            is_benefit_x=[True, False],
+        )
+        self.assertRaises(
+            ValueError,
+            IncrementalRanker,
+            get_matrix03(),
+            is_benefit_x=[True, False],
+            n_method="Linear3",
+        )
+        register_method(
+            "normalization",
+            "Double",
+            lambda x_matrix, is_benefit_x: (2.0 * x_matrix, is_benefit_x),
+        )
+        try:
+            self.assertRaises(
+                ValueError,
+                IncrementalRanker,
+                get_matrix03(),
+                n_method="Double",
+            )
+        finally:
+            METHODS["normalization"].pop("DOUBLE")
+        ranker = IncrementalRanker(get_matrix03())
+        self.assertRaises(ValueError, ranker.rank, [0.5, 0.25, 0.25])
+        self.assertRaises(ValueError, ranker.rank, [0.5, 0.6])
+
+    def test_update_column(self):
+        """
+        Test that column updates match the rankings of the ``rank``
+        function.
+        """
+        rng = np.random.default_rng(1)
+        x_matrix = rng.uniform(1.0, 10.0, (40, 5))
+        is_benefit_x = [True, False, True, True, False]
+        for n_method, w_method, c_method in [
+            ("Linear1", "MW", None),
+            ("Linear2", "SD", None),
+            ("Linear1", "CRITIC", None),
+            ("Linear2", "CRITIC", "AbsPearson"),
+            ("Linear1", "VIC", "AbsPearson"),
+            ("Linear1", "VIC", "dCor"),
+            ("Rescaled", "SD", None),
+        ]:
+            expected = np.copy(x_matrix)
+            ranker = IncrementalRanker(
+                expected,
+                is_benefit_x=is_benefit_x,
+                n_method=n_method,
+                c_method=c_method,
+                w_method=w_method,
+                refresh_interval=3,
+            )
+            for i in range(6):
+                if i % 2 == 0:
+                    ranker.rank()
+                j_col = int(rng.integers(5))
+                expected[:, j_col] = rng.uniform(1.0, 10.0, 40)
+                ranker.update_column(j_col, expected[:, j_col])
+                self.assertAlmostEqualRankings(
+                    ranker.rank(),
+                    rank(
+                        expected,
+                        is_benefit_x=is_benefit_x,
+                        n_method=n_method,
+                        c_method=c_method,
+                        w_method=w_method,
+                    ),
+                )
+            self.assertTrue(np.array_equal(ranker.x_matrix, expected))
+
+    def test_update_column_caches(self):
+        """
+        Test that column updates with pairwise correlation coefficients do
+        not fill the memoization and on-disk caches.
+        """
+        dirpath = tempfile.mkdtemp()
+        enable_cache()
+        enable_disk_cache(dirpath)
+        try:
+            ranker = IncrementalRanker(
+                get_matrix01(),
+                n_method="Linear1",
+                c_method="dCor",
+                w_method="VIC",
+            )
+            ranker.rank()
+            num_entries = len(MEMO_CACHE.entries)
+            self.assertEqual(len(os.listdir(dirpath)), 1)
+            ranker.update_column(1, [0.5, 0.1, 0.9, 0.3, 0.7, 0.2, 0.4])
+            ranker.rank()
+            self.assertEqual(len(MEMO_CACHE.entries), num_entries)
+            self.assertEqual(len(os.listdir(dirpath)), 1)
+        finally:
+            disable_disk_cache()
+            disable_cache()
+            shutil.rmtree(dirpath)
+
+    def test_update_column_fixed_weights(self):
+        """
+        Test column updates with weights that were explicitly provided.
+        """
+        x_matrix = np.array(get_matrix01(), dtype=np.float64)
+        ranker = IncrementalRanker(x_matrix, w_method="CRITIC")
+        ranker.rank([0.2, 0.3, 0.5])
+        x_matrix[:, 1] = x_matrix[::-1, 1]
+        ranker.update_column(np.int64(1), x_matrix[:, 1])
+        self.assertAlmostEqualRankings(
+            ranker.rank(),
+            rank(x_matrix, w_vector=[0.2, 0.3, 0.5]),
+        )
+        problem = DecisionProblem(
+            get_matrix01(),
+            w_vector=[0.6, 0.3, 0.1],
+        )
+        ranker = IncrementalRanker(problem)
+        ranker.update_column(2, x_matrix[:, 1])
+        x_matrix = np.array(get_matrix01(), dtype=np.float64)
+        x_matrix[:, 2] = x_matrix[::-1, 1]
+        self.assertAlmostEqualRankings(
+            ranker.rank(),
+            rank(x_matrix, w_vector=[0.6, 0.3, 0.1]),
+        )
+        ranker = IncrementalRanker(x_matrix, n_method="Rescaled")
+        ranker.rank([0.6, 0.3, 0.1])
+        x_matrix[:, 0] = np.linspace(0.5, 2.0, 7)
+        ranker.update_column(0, x_matrix[:, 0])
+        self.assertAlmostEqualRankings(
+            ranker.rank(),
+            rank(x_matrix, n_method="Rescaled", w_vector=[0.6, 0.3, 0.1]),
+        )
+
+    def test_update_column_exceptions(self):
+        """
+        Test the exceptions of the ``update_column`` method.
+        """
+        ranker = IncrementalRanker(get_matrix03(), n_method="Linear1")
+        self.assertRaises(ValueError, ranker.update_column, 2, [1.0] * 5)
+        self.assertRaises(ValueError, ranker.update_column, -1, [1.0] * 5)
+        self.assertRaises(ValueError, ranker.update_column, 0, [1.0] * 4)
+        self.assertRaises(
+            ValueError,
+            ranker.update_column,
+            0,
+            [1.0, -1.0, 1.0, 1.0, 1.0],
+        )
+        self.assertRaises(TypeError, ranker.update_column, 0.5, [1.0] * 5)
+        self.assertAlmostEqualArrays(
+            ranker.x_matrix,
+            np.array(get_matrix03(), dtype=np.float64),
+        )
+        ranker = IncrementalRanker(get_matrix03(), n_method="FirstRescaled")
+        self.assertRaises(
+            ValueError,
+            ranker.update_column,
+            1,
+            [2.0, 0.0, 0.0, 0.0, 0.0],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
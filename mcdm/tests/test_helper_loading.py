@@ -0,0 +1,468 @@
+# Copyright (c) 2022 Dimitrios-Georgios Akestoridis
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Test script for the ``helper_loading.py`` file of the ``mcdm`` package.
+"""
+
+import bz2
+import gzip
+import importlib.util
+import io
+import lzma
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+from mcdm.helper_loading import (
+    detect_compression,
+    open_text,
+    read_header,
+    read_labeled_chunks,
+    read_unlabeled_chunks,
+    split_labeled_line,
+    stack_chunks,
+)
+
+from .helper_testing import (
+    ExtendedTestCase,
+    get_labels04,
+    get_matrix09,
+)
+
+
+DIR_PATH = os.path.dirname(os.path.abspath(__file__))
+
+
+class TestOpenText(unittest.TestCase):
+    """
+    Test class for the ``open_text`` function of the ``mcdm`` package.
+    """
+    content = "a1,0.0,1.0\na2,2.0,3.0\n"
+
+    def setUp(self):
+        self.dirpath = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dirpath)
+
+    def write_file(self, filename, data):
+        """
+        Write the provided bytes to a temporary file and return its path.
+        """
+        filepath = os.path.join(self.dirpath, filename)
+        with open(filepath, mode="wb") as fp:
+            fp.write(data)
+        return filepath
+
+    def assertOpenText(self, filepath, expected_compression):
+        # pylint: disable=invalid-name
+        """
+        Assert that the provided file is detected and decompressed properly.
+        """
+        self.assertEqual(detect_compression(filepath), expected_compression)
+        with open_text(filepath) as fp:
+            self.assertEqual(fp.read(), self.content)
+
+    def test_plain(self):
+        """
+        Test the opening of an uncompressed file.
+        """
+        filepath = self.write_file("matrix.csv", self.content.encode())
+        self.assertOpenText(filepath, None)
+
+    def test_gzip(self):
+        """
+        Test the opening of a gzip-compressed file.
+        """
+        filepath = self.write_file(
+            "matrix.csv.gz",
+            gzip.compress(self.content.encode()),
+        )
+        self.assertOpenText(filepath, "gzip")
+
+    def test_bz2(self):
+        """
+        Test the opening of a bzip2-compressed file.
+        """
+        filepath = self.write_file(
+            "matrix.csv.bz2",
+            bz2.compress(self.content.encode()),
+        )
+        self.assertOpenText(filepath, "bz2")
+
+    def test_xz(self):
+        """
+        Test the opening of an xz-compressed file.
+        """
+        filepath = self.write_file(
+            "matrix.csv.xz",
+            lzma.compress(self.content.encode()),
+        )
+        self.assertOpenText(filepath, "xz")
+
+    @unittest.skipUnless(
+        importlib.util.find_spec("zstandard"),
+        "the zstandard package is not installed",
+    )
+    def test_zstd(self):
+        """
+        Test the opening of a Zstandard-compressed file.
+        """
+        zstandard = __import__("zstandard")
+        filepath = self.write_file(
+            "matrix.csv.zst",
+            zstandard.ZstdCompressor().compress(self.content.encode()),
+        )
+        self.assertOpenText(filepath, "zstd")
+
+    def test_zstd_missing(self):
+        """
+        Test the opening of a Zstandard-compressed file without the
+        ``zstandard`` package.
+        """
+        filepath = self.write_file(
+            "matrix.csv.zst",
+            b"\x28\xb5\x2f\xfd" + bytes(6),
+        )
+        with mock.patch.dict(sys.modules, {"zstandard": None}):
+            self.assertRaises(ImportError, open_text, filepath)
+
+    def test_short(self):
+        """
+        Test the detection of the compression format of a short file.
+        """
+        filepath = self.write_file("matrix.csv", b"BZh")
+        self.assertIsNone(detect_compression(filepath))
+
+
+class TestReadHeader(ExtendedTestCase):
+    """
+    Test class for the ``read_header`` function of the ``mcdm`` package.
+    """
+    def test_labeled(self):
+        """
+        Test the parsing of header rows with quoted fields, followed by
+        labeled rows.
+        """
+        fp = io.StringIO(
+            "# Comment\n"
+            + 'Name,"C1, %",C2\n'
+            + "Type,Cost,BENEFIT\n"
+            + "Weight,0.75,0.25\n"
+            + "a1,1.0,2.0\n",
+        )
+        header_values = read_header(
+            fp,
+            ",",
+            1,
+            ["names", "types", "weights"],
+            True,
+        )
+        self.assertEqual(header_values["names"], ["C1, %", "C2"])
+        self.assertEqual(header_values["types"], [False, True])
+        self.assertAlmostEqualArrays(
+            header_values["weights"],
+            np.array([0.75, 0.25], dtype=np.float64),
+        )
+        self.assertEqual(fp.readline(), "a1,1.0,2.0\n")
+
+    def test_whitespace(self):
+        """
+        Test the parsing of header rows using whitespace as the delimiter.
+        """
+        fp = io.StringIO("0.5 0.5\nC1  C2\n1.0 2.0\n")
+        self.assertEqual(
+            read_header(fp, None, 0, ["weights", "names"], False)["names"],
+            ["C1", "C2"],
+        )
+
+    def test_exceptions(self):
+        """
+        Test the parsing of inappropriate header rows.
+        """
+        for content, header in [
+            ("C1,C2\n", ["labels"]),
+            ("C1,C2\nC3,C4\n", ["names", "names"]),
+            ("C1,C2\ncost\n", ["names", "types"]),
+            ("cost,gain\n", ["types"]),
+            ("0.5,high\n", ["weights"]),
+        ]:
+            self.assertRaises(
+                ValueError,
+                read_header,
+                io.StringIO(content),
+                ",",
+                0,
+                header,
+                False,
+            )
+
+
+class TestReadLabeledChunks(ExtendedTestCase):
+    """
+    Test class for the ``read_labeled_chunks`` function of the ``mcdm``
+    package.
+    """
+    def test_example09(self):
+        """
+        Test the reading of a large TSV file in chunks.
+        """
+        with open(
+            os.path.join(DIR_PATH, "data", "example09.tsv"),
+            mode="r",
+            encoding="utf-8",
+        ) as fp:
+            chunks = list(read_labeled_chunks(fp, "\t", 1, chunk_rows=16))
+        self.assertEqual([len(labels) for _, labels in chunks], [16, 16, 6])
+        self.assertEqual(
+            [data.shape for data, _ in chunks],
+            [(16, 3), (16, 3), (6, 3)],
+        )
+        obtained_matrix, obtained_row_labels = stack_chunks(chunks)
+        self.assertAlmostEqualArrays(
+            obtained_matrix,
+            np.array(get_matrix09(), dtype=np.float64),
+        )
+        self.assertEqual(obtained_row_labels, get_labels04())
+
+    def test_full_chunks(self):
+        """
+        Test the reading of rows whose number is a multiple of the chunk
+        size.
+        """
+        chunks = list(
+            read_labeled_chunks(
+                io.StringIO("c1,c2\na1,1\na2,2\na3,3\na4,4\n"),
+                ",",
+                1,
+                chunk_rows=2,
+            ),
+        )
+        self.assertEqual(
+            [labels for _, labels in chunks],
+            [["a1", "a2"], ["a3", "a4"]],
+        )
+        self.assertAlmostEqualArrays(
+            chunks[1][0],
+            np.array([[3.0], [4.0]], dtype=np.float64),
+        )
+
+    def test_multiline_label(self):
+        """
+        Test the reading of a quoted label that spans multiple lines.
+        """
+        chunks = list(
+            read_labeled_chunks(
+                io.StringIO('a1,1,2\n"a\n2",3,4\n"a""3",5,6\n'),
+                ",",
+                0,
+            ),
+        )
+        self.assertEqual(chunks[0][1], ["a1", "a\n2", 'a"3'])
+        self.assertAlmostEqualArrays(
+            chunks[0][0],
+            np.array([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]], dtype=np.float64),
+        )
+        with self.assertRaisesRegex(ValueError, "line 4$"):
+            list(
+                read_labeled_chunks(
+                    io.StringIO('a1,1\n"a\n2",2\na3,x\n'),
+                    ",",
+                    0,
+                ),
+            )
+
+    def test_quoted_delimiter_exception(self):
+        """
+        Test the reading of a quoted value that contains the delimiter.
+        """
+        chunks = list(
+            read_labeled_chunks(io.StringIO('a1,1,2\na2,"3",4\n'), ",", 0),
+        )
+        self.assertAlmostEqualArrays(
+            chunks[0][0],
+            np.array([[1.0, 2.0], [3.0, 4.0]], dtype=np.float64),
+        )
+        with self.assertRaisesRegex(ValueError, "line 2$"):
+            list(
+                read_labeled_chunks(
+                    io.StringIO('a1,1,2\na2,"1,5",2\n'),
+                    ",",
+                    0,
+                ),
+            )
+        with self.assertRaisesRegex(ValueError, "line 1$"):
+            list(
+                read_labeled_chunks(io.StringIO('a,"1,5",2\n'), ",", 0),
+            )
+
+    def test_split_fields(self):
+        """
+        Test the reading of rows without the C parser of np.loadtxt.
+        """
+        with mock.patch("mcdm.helper_loading.FAST_LOADTXT", False):
+            chunks = list(
+                read_labeled_chunks(
+                    io.StringIO("a1,1,2\r\na2, 3,4\n"),
+                    ",",
+                    0,
+                ),
+            )
+            self.assertAlmostEqualArrays(
+                chunks[0][0],
+                np.array([[1.0, 2.0], [3.0, 4.0]], dtype=np.float64),
+            )
+            with self.assertRaisesRegex(ValueError, "line 2$"):
+                list(
+                    read_unlabeled_chunks(
+                        io.StringIO("1 2\n3 x\n"),
+                        None,
+                        0,
+                    ),
+                )
+
+    def test_missing_value_exception(self):
+        """
+        Test the reading of a row that contains an empty value.
+        """
+        self.assertRaises(
+            ValueError,
+            list,
+            read_labeled_chunks(io.StringIO("a1,1\na2,\n"), ",", 0),
+        )
+
+    def test_invalid_value_exception(self):
+        """
+        Test the reading of an invalid value after an empty line and a
+        comment.
+        """
+        with self.assertRaisesRegex(ValueError, "line 5$"):
+            list(
+                read_unlabeled_chunks(
+                    io.StringIO("1,2\n\n# Comment\n3,4\n5,x\n"),
+                    ",",
+                    0,
+                ),
+            )
+
+    def test_empty_line_exception(self):
+        """
+        Test the reading of an empty line.
+        """
+        self.assertRaises(
+            ValueError,
+            list,
+            read_labeled_chunks(io.StringIO("a1,1\n\na2,2\n"), ",", 0),
+        )
+
+
+class TestSplitLabeledLine(unittest.TestCase):
+    """
+    Test class for the ``split_labeled_line`` function of the ``mcdm``
+    package.
+    """
+    def test_unquoted(self):
+        """
+        Test the splitting of a line without any quoted fields.
+        """
+        self.assertEqual(
+            split_labeled_line("a1,1,2\n", ","),
+            ("a1", "1,2\n", 3),
+        )
+
+    def test_quoted_label(self):
+        """
+        Test the splitting of a line with a quoted label.
+        """
+        self.assertEqual(
+            split_labeled_line('"a,1"\t1\t2\n', "\t"),
+            ("a,1", "1\t2\n", 3),
+        )
+
+    def test_quoted_values(self):
+        """
+        Test the splitting of a line with quoted values.
+        """
+        self.assertEqual(
+            split_labeled_line('"a""1",1,"2"\n', ","),
+            ('a"1', ["1", "2"], 3),
+        )
+        self.assertEqual(
+            split_labeled_line('a,"1,5",2\n', ","),
+            ("a", ["1,5", "2"], 3),
+        )
+
+    def test_no_data(self):
+        """
+        Test the splitting of lines without any data.
+        """
+        self.assertEqual(split_labeled_line("a1\n", ","), ("a1", "", 1))
+        self.assertEqual(split_labeled_line('"a1"\n', ","), ("a1", "", 1))
+        self.assertEqual(split_labeled_line("\n", ","), ("", "", 0))
+
+
+class TestStackChunks(ExtendedTestCase):
+    """
+    Test class for the ``stack_chunks`` function of the ``mcdm`` package.
+    """
+    def test_growth(self):
+        """
+        Test the concatenation of chunks that exceed the initial capacity of
+        the buffer.
+        """
+        chunks = [
+            (np.array([[1.0, 2.0]], dtype=np.float64), ["a1"]),
+            (np.array([[3.0, 4.0], [5.0, 6.0]]), ["a2", "a3"]),
+            (np.array([[7.0, 8.0]], dtype=np.float64), ["a4"]),
+            (np.array([[9.0, 0.0]], dtype=np.float64), ["a5"]),
+        ]
+        obtained_matrix, obtained_row_labels = stack_chunks(chunks)
+        self.assertAlmostEqualArrays(
+            obtained_matrix,
+            np.array(
+                [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0], [7.0, 8.0], [9.0, 0.0]],
+                dtype=np.float64,
+            ),
+        )
+        self.assertEqual(
+            obtained_row_labels,
+            ["a1", "a2", "a3", "a4", "a5"],
+        )
+
+    def test_empty(self):
+        """
+        Test the concatenation of zero chunks.
+        """
+        obtained_matrix, obtained_row_labels = stack_chunks([])
+        self.assertAlmostEqualArrays(
+            obtained_matrix,
+            np.array([], dtype=np.float64),
+        )
+        self.assertEqual(obtained_row_labels, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
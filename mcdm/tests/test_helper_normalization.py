@@ -28,7 +28,9 @@ Test script for the ``helper_normalization.py`` file of the ``mcdm`` package.
 import unittest
 
 import numpy as np
-from mcdm import normalize
+from mcdm import normalize, register_method
+from mcdm.helper_registry import METHODS
+from mcdm.normalization import linear2
 
 from .helper_testing import (
     ExtendedTestCase,
@@ -39,6 +41,14 @@ from .helper_testing import (
 )
 
 
+def get_matrix():
+    """
+    Return a decision matrix that all built-in normalization methods can
+    normalize.
+    """
+    return np.array(get_matrix01(), dtype=np.float64) + 1.0
+
+
 class TestNormalize(ExtendedTestCase):
     """
     Test class for the ``normalize`` function of the ``mcdm`` package.
@@ -151,5 +161,179 @@ class TestNormalize(ExtendedTestCase):
         )
 
 
+class TestNormalizeInto(ExtendedTestCase):
+    """
+    Test class for the normalization of a matrix into a preallocated output
+    array with the ``normalize`` function of the ``mcdm`` package.
+    """
+    def tearDown(self):
+        METHODS["normalization"].pop("CUSTOM", None)
+
+    def test_out(self):
+        """
+        Test the normalization into an output array with each method.
+        """
+        for n_method in [None, "Linear1", "Linear2", "Linear3", "Vector"]:
+            x_matrix = get_matrix()
+            if n_method is None:
+                x_matrix /= 2.0
+            expected = normalize(x_matrix, [True, False, True], n_method)
+            out = np.zeros(x_matrix.shape, dtype=np.float64)
+            obtained = normalize(
+                x_matrix,
+                [True, False, True],
+                n_method,
+                out=out,
+            )
+            self.assertIs(obtained[0], out)
+            self.assertAlmostEqualArrays(obtained[0], expected[0])
+            self.assertEqual(obtained[1], expected[1])
+
+    def test_inplace(self):
+        """
+        Test the normalization of a matrix in place with each method.
+        """
+        for n_method in ["Linear1", "Linear2", "Linear3", "Vector"]:
+            expected = normalize(get_matrix(), [True, False, True], n_method)
+            x_matrix = get_matrix()
+            obtained = normalize(
+                x_matrix,
+                [True, False, True],
+                n_method,
+                inplace=True,
+            )
+            self.assertIs(obtained[0], x_matrix)
+            self.assertAlmostEqualArrays(x_matrix, expected[0])
+            self.assertEqual(obtained[1], expected[1])
+
+    def test_inplace_float32(self):
+        """
+        Test the normalization of a float32 matrix in place.
+        """
+        x_matrix = get_matrix().astype(np.float32)
+        normalize(
+            x_matrix,
+            [True, False, True],
+            "Linear2",
+            dtype=np.float32,
+            inplace=True,
+        )
+        self.assertAlmostEqualArrays(
+            x_matrix,
+            normalize(
+                get_matrix(),
+                [True, False, True],
+                "Linear2",
+                dtype=np.float32,
+            )[0],
+        )
+
+    def test_inplace_exception(self):
+        """
+        Test the normalization of a matrix in place that cannot be normalized
+        by each method, which must leave the matrix unchanged.
+        """
+        for n_method in ["Linear1", "Linear2", "Linear3", "Vector"]:
+            x_matrix = get_matrix()
+            x_matrix[:, 2] = 0.0
+            expected = x_matrix.copy()
+            self.assertRaises(
+                ValueError,
+                normalize,
+                x_matrix,
+                [True, False, True],
+                n_method,
+                inplace=True,
+            )
+            self.assertAlmostEqualArrays(x_matrix, expected)
+
+    def test_custom_out(self):
+        """
+        Test the normalization into an output array with a registered method
+        that cannot use it.
+        """
+        register_method("normalization", "Custom", linear2)
+        out = np.zeros((7, 3), dtype=np.float64)
+        obtained = normalize(
+            get_matrix(),
+            [True, False, True],
+            "Custom",
+            out=out,
+        )
+        self.assertIs(obtained[0], out)
+        self.assertAlmostEqualArrays(
+            out,
+            normalize(get_matrix(), [True, False, True], "Linear2")[0],
+        )
+
+    def test_out_shape_exception(self):
+        """
+        Test the normalization into an output array of a different shape.
+        """
+        self.assertRaises(
+            ValueError,
+            normalize,
+            get_matrix(),
+            [True, False, True],
+            "Linear1",
+            out=np.zeros((7, 2), dtype=np.float64),
+        )
+
+    def test_out_dtype_exception(self):
+        """
+        Test the normalization into an output array of a different data type.
+        """
+        self.assertRaises(
+            ValueError,
+            normalize,
+            get_matrix(),
+            [True, False, True],
+            "Linear1",
+            out=np.zeros((7, 3), dtype=np.float32),
+        )
+
+    def test_out_aliased_exception(self):
+        """
+        Test the normalization into an output array that is the provided
+        matrix itself, without normalizing it in place.
+        """
+        x_matrix = get_matrix()
+        self.assertRaises(
+            ValueError,
+            normalize,
+            x_matrix,
+            [True, False, True],
+            "Linear1",
+            out=x_matrix,
+        )
+
+    def test_inplace_nested_list_exception(self):
+        """
+        Test the normalization of a nested list in place.
+        """
+        self.assertRaises(
+            ValueError,
+            normalize,
+            get_matrix().tolist(),
+            [True, False, True],
+            "Linear1",
+            inplace=True,
+        )
+
+    def test_inplace_out_exception(self):
+        """
+        Test the normalization of a matrix in place into an output array.
+        """
+        self.assertRaises(
+            ValueError,
+            normalize,
+            get_matrix(),
+            [True, False, True],
+            "Linear1",
+            out=np.zeros((7, 3), dtype=np.float64),
+            inplace=True,
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
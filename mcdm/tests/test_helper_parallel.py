@@ -0,0 +1,268 @@
+# Copyright (c) 2022 Dimitrios-Georgios Akestoridis
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Test script for the ``helper_parallel.py`` file of the ``mcdm`` package.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+from mcdm import load
+from mcdm.helper_parallel import (
+    load_parallel,
+    parse_range,
+    split_file,
+)
+
+from .helper_testing import (
+    ExtendedTestCase,
+    get_labels04,
+    get_matrix04,
+    get_matrix09,
+)
+
+
+DIR_PATH = os.path.dirname(os.path.abspath(__file__))
+
+
+class TestLoadParallel(ExtendedTestCase):
+    """
+    Test class for the ``load_parallel`` function of the ``mcdm`` package.
+    """
+    def test_examples(self):
+        """
+        Test the parallel loading of matrices from text files, split into
+        various numbers of byte ranges.
+        """
+        for filename, delimiter, skiprows, labeled_rows in [
+            ("example01.csv", ",", 0, False),
+            ("example02.csv", ",", 1, True),
+            ("example04.tsv", "\t", 1, False),
+            ("example05.csv", ",", 0, True),
+            ("example07.csv", ",", 0, False),
+            ("example08.tsv", "\t", 0, True),
+            ("example09.tsv", "\t", 1, True),
+        ]:
+            filepath = os.path.join(DIR_PATH, "data", filename)
+            expected_matrix, expected_row_labels = load(
+                filepath,
+                delimiter=delimiter,
+                skiprows=skiprows,
+                labeled_rows=labeled_rows,
+            )
+            for num_parts in [1, 3, 7]:
+                obtained_matrix, obtained_row_labels = load_parallel(
+                    filepath,
+                    delimiter,
+                    skiprows,
+                    labeled_rows,
+                    2,
+                    num_parts=num_parts,
+                )
+                self.assertAlmostEqualArrays(obtained_matrix, expected_matrix)
+                self.assertEqual(obtained_row_labels, expected_row_labels)
+
+    def test_single_row(self):
+        """
+        Test the parallel loading of a matrix with a single row.
+        """
+        tmp_dirpath = tempfile.mkdtemp()
+        try:
+            filepath = os.path.join(tmp_dirpath, "single.csv")
+            with open(filepath, mode="w", encoding="utf-8") as fp:
+                fp.write("c1,c2,c3\n0.1,0.2,0.3\n")
+            obtained_matrix, obtained_row_labels = load_parallel(
+                filepath,
+                ",",
+                1,
+                False,
+                2,
+            )
+            self.assertAlmostEqualArrays(
+                obtained_matrix,
+                np.array([0.1, 0.2, 0.3], dtype=np.float64),
+            )
+            self.assertEqual(obtained_row_labels, None)
+        finally:
+            shutil.rmtree(tmp_dirpath)
+
+    def test_no_rows(self):
+        """
+        Test the parallel loading of a file without any rows.
+        """
+        filepath = os.path.join(DIR_PATH, "data", "example07.csv")
+        obtained_matrix, obtained_row_labels = load_parallel(
+            filepath,
+            ",",
+            100,
+            True,
+            2,
+        )
+        self.assertEqual(obtained_matrix.shape, (0,))
+        self.assertEqual(obtained_row_labels, [])
+
+    def test_wrong_columns_exception(self):
+        """
+        Test the parallel loading of a matrix from a TSV file that contains
+        the wrong number of columns.
+        """
+        with self.assertRaisesRegex(ValueError, "line 3$"):
+            load_parallel(
+                os.path.join(DIR_PATH, "data", "failure01.tsv"),
+                "\t",
+                0,
+                True,
+                2,
+                num_parts=3,
+            )
+
+    def test_wrong_type_exception(self):
+        """
+        Test the parallel loading of a matrix from a CSV file that contains a
+        wrong value type.
+        """
+        with self.assertRaisesRegex(ValueError, "line 3$"):
+            load_parallel(
+                os.path.join(DIR_PATH, "data", "failure03.csv"),
+                ",",
+                1,
+                True,
+                2,
+                num_parts=3,
+            )
+
+
+class TestParseRange(ExtendedTestCase):
+    """
+    Test class for the ``parse_range`` function of the ``mcdm`` package.
+    """
+    def test_example09(self):
+        """
+        Test the parsing of the byte ranges of a large TSV file.
+        """
+        filepath = os.path.join(DIR_PATH, "data", "example09.tsv")
+        chunks = [
+            parse_range(filepath, byte_range, "\t", True, 3)
+            for byte_range in split_file(filepath, 1, 3)
+        ]
+        self.assertAlmostEqualArrays(
+            np.concatenate([chunk_data for chunk_data, _ in chunks]),
+            np.array(get_matrix09(), dtype=np.float64),
+        )
+        self.assertEqual(
+            [label for _, chunk_labels in chunks for label in chunk_labels],
+            get_labels04(),
+        )
+
+    def test_example04(self):
+        """
+        Test the parsing of the byte ranges of a TSV file without labels.
+        """
+        filepath = os.path.join(DIR_PATH, "data", "example04.tsv")
+        chunks = [
+            parse_range(filepath, byte_range, "\t", False, 4)
+            for byte_range in split_file(filepath, 1, 2)
+        ]
+        self.assertAlmostEqualArrays(
+            np.concatenate([chunk_data for chunk_data, _ in chunks]),
+            np.array(get_matrix04(), dtype=np.float64),
+        )
+        self.assertEqual(
+            [chunk_labels for _, chunk_labels in chunks],
+            [[], []],
+        )
+
+    def test_empty_range(self):
+        """
+        Test the parsing of a byte range that only contains comments.
+        """
+        filepath = os.path.join(DIR_PATH, "data", "example07.csv")
+        obtained_matrix, obtained_row_labels = parse_range(
+            filepath,
+            (0, 5, 1),
+            ",",
+            False,
+            5,
+        )
+        self.assertEqual(obtained_matrix.shape, (0, 5))
+        self.assertEqual(obtained_row_labels, [])
+
+    def test_wrong_columns_exception(self):
+        """
+        Test the parsing of a byte range whose rows do not match the expected
+        number of columns.
+        """
+        filepath = os.path.join(DIR_PATH, "data", "example08.tsv")
+        with self.assertRaisesRegex(ValueError, "line 7$"):
+            parse_range(filepath, (0, 10, 7), "\t", True, 2)
+
+
+class TestSplitFile(unittest.TestCase):
+    """
+    Test class for the ``split_file`` function of the ``mcdm`` package.
+    """
+    def test_example09(self):
+        """
+        Test the splitting of a large TSV file at line boundaries.
+        """
+        filepath = os.path.join(DIR_PATH, "data", "example09.tsv")
+        byte_ranges = split_file(filepath, 1, 4)
+        self.assertEqual(len(byte_ranges), 4)
+        self.assertEqual(byte_ranges[0][2], 2)
+        self.assertEqual(byte_ranges[-1][1], os.path.getsize(filepath))
+        with open(filepath, mode="rb") as fp:
+            data = fp.read()
+        for i, (start, end, first_line) in enumerate(byte_ranges):
+            self.assertEqual(data[start - 1:start], b"\n")
+            self.assertEqual(data[:start].count(b"\n") + 1, first_line)
+            if i + 1 < len(byte_ranges):
+                self.assertEqual(end, byte_ranges[i + 1][0])
+
+
+class TestLoad(ExtendedTestCase):
+    """
+    Test class for the parallel mode of the ``load`` function of the
+    ``mcdm`` package.
+    """
+    def test_example09(self):
+        """
+        Test the parallel loading of a matrix from a large TSV file.
+        """
+        obtained_matrix, obtained_row_labels = load(
+            os.path.join(DIR_PATH, "data", "example09.tsv"),
+            delimiter="\t",
+            skiprows=1,
+            labeled_rows=True,
+            workers=2,
+        )
+        self.assertAlmostEqualArrays(
+            obtained_matrix,
+            np.array(get_matrix09(), dtype=np.float64),
+        )
+        self.assertEqual(obtained_row_labels, get_labels04())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+# Copyright (c) 2022 Dimitrios-Georgios Akestoridis
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Test script for the ``helper_problem.py`` file of the ``mcdm`` package.
+"""
+
+import unittest
+
+import numpy as np
+from mcdm.helper_problem import (
+    DecisionProblem,
+    unpack_problem,
+)
+
+from .helper_testing import (
+    ExtendedTestCase,
+    get_matrix50,
+)
+
+
+class TestDecisionProblem(ExtendedTestCase):
+    """
+    Test class for the ``DecisionProblem`` class of the ``mcdm`` package.
+    """
+    def test_attributes(self):
+        """
+        Test the attributes and the representation of a decision problem.
+        """
+        problem = DecisionProblem(
+            np.array(get_matrix50(), dtype=np.float64),
+            criteria_names=["C1", "C2", "C3"],
+            is_benefit_x=[False, True, True],
+        )
+        self.assertEqual(problem.alt_names, None)
+        self.assertEqual(problem.w_vector, None)
+        self.assertEqual(
+            repr(problem),
+            "DecisionProblem(shape=(4, 3), "
+            + "criteria_names=['C1', 'C2', 'C3'], "
+            + "is_benefit_x=[False, True, True])",
+        )
+
+    def test_columns_exception(self):
+        """
+        Test the creation of decision problems with the wrong number of
+        criterion names, criterion types, or weights.
+        """
+        x_matrix = np.array(get_matrix50(), dtype=np.float64)
+        for kwargs in [
+            {"criteria_names": ["C1", "C2"]},
+            {"is_benefit_x": [True]},
+            {"w_vector": [0.25, 0.25, 0.25, 0.25]},
+        ]:
+            self.assertRaises(ValueError, DecisionProblem, x_matrix, **kwargs)
+
+
+class TestUnpackProblem(ExtendedTestCase):
+    """
+    Test class for the ``unpack_problem`` function of the ``mcdm`` package.
+    """
+    def test_matrix(self):
+        """
+        Test the unpacking of a decision matrix that is not a decision
+        problem.
+        """
+        self.assertEqual(
+            unpack_problem(get_matrix50(), None, [True], None),
+            (get_matrix50(), None, [True], None),
+        )
+
+    def test_override(self):
+        """
+        Test the unpacking of a decision problem with explicitly provided
+        values.
+        """
+        problem = DecisionProblem(
+            get_matrix50(),
+            alt_names=["a1", "a2", "a3", "a4"],
+            is_benefit_x=[False, True, True],
+            w_vector=[0.5, 0.25, 0.25],
+        )
+        self.assertEqual(
+            unpack_problem(problem, None, None, None),
+            (
+                get_matrix50(),
+                ["a1", "a2", "a3", "a4"],
+                [False, True, True],
+                [0.5, 0.25, 0.25],
+            ),
+        )
+        self.assertEqual(
+            unpack_problem(problem, ["b1"], [True], [1.0]),
+            (get_matrix50(), ["b1"], [True], [1.0]),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
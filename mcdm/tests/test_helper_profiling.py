@@ -0,0 +1,179 @@
+# Copyright (c) 2022 Dimitrios-Georgios Akestoridis
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Test script for the ``helper_profiling.py`` file of the ``mcdm`` package.
+"""
+
+import json
+import threading
+import tracemalloc
+import unittest
+from unittest import mock
+
+from mcdm import Profiler, rank
+from mcdm.helper_profiling import PROFILING, profile_stage
+
+from .helper_testing import (
+    ExtendedTestCase,
+    get_matrix03,
+)
+
+
+class TestProfiler(ExtendedTestCase):
+    """
+    Test class for the ``Profiler`` class of the ``mcdm`` package.
+    """
+    def test_rank(self):
+        """
+        Test the profiling of the stages of the ``rank`` function.
+        """
+        expected = rank(
+            get_matrix03(),
+            w_method="VIC",
+            c_method="AbsPearson",
+            s_method="TOPSIS",
+        )
+        records = []
+        with Profiler(
+            callback=records.append,
+            trace_memory=True,
+        ) as profiler:
+            self.assertAlmostEqualRankings(
+                rank(
+                    get_matrix03(),
+                    w_method="VIC",
+                    c_method="AbsPearson",
+                    s_method="TOPSIS",
+                ),
+                expected,
+            )
+        self.assertIsNone(PROFILING.profiler)
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertEqual(records, profiler.records)
+        self.assertEqual(
+            [record["stage"] for record in records],
+            ["normalize", "correlate", "weigh", "score", "sort", "build"],
+        )
+        for record in records:
+            self.assertGreaterEqual(record["wall_time"], 0.0)
+            self.assertGreaterEqual(record["cpu_time"], 0.0)
+            self.assertGreaterEqual(record["bytes"], 0)
+        self.assertGreaterEqual(records[2]["bytes"], records[1]["bytes"])
+        self.assertGreater(records[2]["wall_time"], records[1]["wall_time"])
+        totals = profiler.as_dict()
+        self.assertEqual(
+            list(totals),
+            [record["stage"] for record in records],
+        )
+        self.assertEqual(totals["weigh"]["calls"], 1)
+        self.assertEqual(totals["weigh"]["bytes"], records[2]["bytes"])
+        self.assertEqual(
+            [
+                json.loads(line)
+                for line in profiler.as_json_lines().splitlines()
+            ],
+            records,
+        )
+
+    def test_accumulation(self):
+        """
+        Test the accumulation of the records of repeated stages.
+        """
+        with Profiler() as profiler:
+            rank(get_matrix03())
+            rank(get_matrix03())
+        self.assertEqual(len(profiler.records), 10)
+        totals = profiler.as_dict()
+        self.assertEqual(
+            list(totals),
+            ["normalize", "weigh", "score", "sort", "build"],
+        )
+        for total in totals.values():
+            self.assertEqual(total["calls"], 2)
+            self.assertIsNone(total["bytes"])
+
+    def test_nesting(self):
+        """
+        Test nested profilers and memory tracing that was already enabled.
+        """
+        tracemalloc.start()
+        try:
+            with Profiler() as outer:
+                with Profiler() as inner:
+                    rank(get_matrix03())
+                self.assertIs(PROFILING.profiler, outer)
+                rank(get_matrix03())
+            self.assertTrue(tracemalloc.is_tracing())
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(len(inner.records), 5)
+        self.assertEqual(len(outer.records), 5)
+
+    def test_exceptions(self):
+        """
+        Test the recording of stages that raise exceptions.
+        """
+        with Profiler() as profiler:
+            self.assertRaises(ValueError, rank, get_matrix03(), s_method="X")
+        self.assertEqual(
+            [record["stage"] for record in profiler.records],
+            ["normalize", "weigh", "score"],
+        )
+
+    def test_threads(self):
+        """
+        Test that profilers only record the stages of their own thread.
+        """
+        with Profiler() as profiler:
+            thread = threading.Thread(target=rank, args=(get_matrix03(),))
+            thread.start()
+            thread.join()
+        self.assertEqual(profiler.records, [])
+
+    def test_without_reset_peak(self):
+        """
+        Test memory tracing without the ``reset_peak`` function.
+        """
+        with mock.patch.object(tracemalloc, "reset_peak", create=True):
+            del tracemalloc.reset_peak
+            with Profiler(trace_memory=True) as profiler:
+                rank(get_matrix03())
+        self.assertTrue(hasattr(tracemalloc, "reset_peak"))
+        for record in profiler.records:
+            self.assertGreaterEqual(record["bytes"], 0)
+
+    def test_stopped_tracing(self):
+        """
+        Test stages during which memory tracing is stopped.
+        """
+        @profile_stage("stop")
+        def stop():
+            tracemalloc.stop()
+
+        with Profiler(trace_memory=True) as profiler:
+            stop()
+        self.assertEqual(profiler.records[0]["stage"], "stop")
+        self.assertEqual(profiler.records[0]["bytes"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
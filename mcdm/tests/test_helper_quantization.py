@@ -0,0 +1,176 @@
+# Copyright (c) 2022 Dimitrios-Georgios Akestoridis
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Test script for the ``helper_quantization.py`` file of the ``mcdm`` package.
+"""
+
+import unittest
+
+import numpy as np
+from mcdm import QuantizedMatrix, normalize, score
+
+from .helper_testing import ExtendedTestCase, get_matrix01
+
+
+class TestQuantizedMatrix(ExtendedTestCase):
+    """
+    Test class for the ``QuantizedMatrix`` class of the ``mcdm`` package.
+    """
+    def test_error_bounds(self):
+        """
+        Test that the quantized values are within the error bounds.
+        """
+        x_matrix = np.random.default_rng(0).random((1000, 4))
+        for code_dtype in ["uint8", np.uint16]:
+            z_matrix, _ = normalize(
+                x_matrix,
+                [True, False, True, True],
+                "Linear2",
+            )
+            q_matrix, _ = normalize(
+                x_matrix,
+                [True, False, True, True],
+                "Linear2",
+                quantize=code_dtype,
+            )
+            self.assertEqual(q_matrix.codes.dtype, code_dtype)
+            self.assertEqual(q_matrix.shape, (1000, 4))
+            self.assertTrue(
+                np.all(
+                    np.abs(q_matrix.dequantize() - z_matrix)
+                    <= q_matrix.error_bounds + 1e-12,
+                ),
+            )
+            self.assertAlmostEqualArrays(
+                q_matrix.dequantize(10, 20),
+                q_matrix.dequantize()[10:20],
+            )
+
+    def test_constant_column(self):
+        """
+        Test the quantization of a matrix with a constant column.
+        """
+        q_matrix = QuantizedMatrix([[0.5, 0.0], [0.5, 1.0], [0.5, 0.2]])
+        self.assertEqual(q_matrix.codes.tolist(), [[0, 0], [0, 255], [0, 51]])
+        self.assertAlmostEqualArrays(
+            q_matrix.dequantize(),
+            np.array([[0.5, 0.0], [0.5, 1.0], [0.5, 0.2]]),
+        )
+
+    def test_exceptions(self):
+        """
+        Test the quantization with invalid arguments.
+        """
+        self.assertRaises(ValueError, QuantizedMatrix, [[0.5]], "int8")
+        self.assertRaises(ValueError, QuantizedMatrix, [[0.5]], "X")
+        self.assertRaises(ValueError, QuantizedMatrix, [0.5, 0.2])
+        self.assertRaises(ValueError, QuantizedMatrix, np.zeros((0, 2)))
+        self.assertRaises(ValueError, QuantizedMatrix, [[1.5, 0.2]])
+
+
+class TestQuantizedScoring(ExtendedTestCase):
+    """
+    Test class for the scoring of quantized matrices of the ``mcdm`` package.
+    """
+    def test_dequantized(self):
+        """
+        Test that the scores of a quantized matrix are equal to the scores of
+        its dequantized values.
+        """
+        x_matrix = np.random.default_rng(1).random((500, 3)) + 0.1
+        w_vector = [0.5, 0.3, 0.2]
+        for is_benefit_x, s_methods in [
+            ([True, True, True], ["SAW", "TOPSIS", "mTOPSIS"]),
+            ([False, False, False], ["SAW", "TOPSIS"]),
+            ([True, False, True], ["TOPSIS", "mTOPSIS"]),
+        ]:
+            q_matrix, is_benefit_z = normalize(
+                x_matrix,
+                is_benefit_x,
+                "Vector",
+                quantize="uint16",
+            )
+            for s_method in s_methods:
+                for dtype in [None, np.float32]:
+                    obtained = score(
+                        q_matrix,
+                        is_benefit_z,
+                        w_vector,
+                        s_method,
+                        dtype=dtype,
+                    )
+                    expected = score(
+                        q_matrix.dequantize(),
+                        is_benefit_z,
+                        w_vector,
+                        s_method,
+                        dtype=dtype,
+                    )
+                    self.assertEqual(obtained[1], expected[1])
+                    np.testing.assert_allclose(
+                        obtained[0],
+                        expected[0],
+                        rtol=1e-5,
+                    )
+                    self.assertEqual(obtained[0].dtype, expected[0].dtype)
+
+    def test_exceptions(self):
+        """
+        Test the scoring of quantized matrices with invalid arguments.
+        """
+        q_matrix = QuantizedMatrix(get_matrix01())
+        self.assertRaises(
+            ValueError,
+            score,
+            q_matrix,
+            [True, True, True],
+            [0.5, 0.3, 0.2],
+            "MEW",
+        )
+        self.assertRaises(
+            ValueError,
+            score,
+            q_matrix,
+            [True, False, True],
+            [0.5, 0.3, 0.2],
+            "SAW",
+        )
+        self.assertRaises(
+            ValueError,
+            score,
+            q_matrix,
+            [True, True, True],
+            [0.5, 0.5],
+            "TOPSIS",
+        )
+        self.assertRaises(
+            ValueError,
+            score,
+            QuantizedMatrix([[0.5, 0.5], [0.5, 0.5]]),
+            [True, True],
+            [0.5, 0.5],
+            "mTOPSIS",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
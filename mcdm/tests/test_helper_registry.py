@@ -0,0 +1,206 @@
+# Copyright (c) 2022 Dimitrios-Georgios Akestoridis
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Test script for the ``helper_registry.py`` file of the ``mcdm`` package.
+"""
+
+import unittest
+
+import numpy as np
+from mcdm import (
+    rank,
+    register_method,
+    weigh,
+)
+from mcdm.helper_registry import (
+    METHODS,
+    get_method,
+    list_methods,
+)
+from mcdm.helper_validation import check_scoring_input
+
+from .helper_testing import (
+    ExtendedTestCase,
+    get_matrix01,
+)
+
+
+def absolute_pearson(z_matrix):
+    """
+    Return the absolute Pearson correlation coefficients of the provided
+    matrix, which are declared to be between 0 and 1.
+    """
+    return np.absolute(np.corrcoef(z_matrix, rowvar=False))
+
+
+class TestRegisterMethod(ExtendedTestCase):
+    """
+    Test class for the ``register_method`` function of the ``mcdm`` package.
+    """
+    def tearDown(self):
+        METHODS["scoring"].pop("KERNEL", None)
+        METHODS["correlation"].pop("CUSTOM", None)
+
+    def test_scoring(self):
+        """
+        Test the ranking with a registered scoring method.
+        """
+        register_method(
+            "scoring",
+            "Kernel",
+            lambda z_matrix, w_vector, _: (z_matrix.dot(w_vector), True),
+        )
+        self.assertAlmostEqualRankings(
+            rank(get_matrix01(), s_method="kernel"),
+            rank(get_matrix01(), s_method="SAW"),
+        )
+        self.assertEqual(
+            get_method("scoring", "KERNEL").capabilities["normalized_input"],
+            True,
+        )
+
+    def test_mixed_criteria(self):
+        """
+        Test that the validation of a registered scoring method rejects a
+        mixture of benefit and cost criteria, unless the method declares
+        that it supports them.
+        """
+        def kernel(z_matrix, w_vector, is_benefit_z):
+            z_matrix = np.asarray(z_matrix, dtype=np.float64)
+            w_vector = np.asarray(w_vector, dtype=np.float64)
+            check_scoring_input(z_matrix, w_vector, is_benefit_z, "Kernel")
+            return z_matrix.dot(w_vector), True
+
+        register_method("scoring", "Kernel", kernel)
+        self.assertRaises(
+            ValueError,
+            rank,
+            get_matrix01(),
+            is_benefit_x=[True, False, True],
+            s_method="Kernel",
+        )
+        register_method("scoring", "Kernel", kernel, mixed_criteria=True)
+        self.assertEqual(
+            len(
+                rank(
+                    get_matrix01(),
+                    is_benefit_x=[True, False, True],
+                    s_method="Kernel",
+                ),
+            ),
+            7,
+        )
+
+    def test_correlation(self):
+        """
+        Test the weighting with a registered correlation method, whose
+        declared capabilities determine its compatibility.
+        """
+        register_method(
+            "correlation",
+            "Custom",
+            absolute_pearson,
+            nonnegative_output=True,
+        )
+        self.assertAlmostEqualArrays(
+            weigh(get_matrix01(), "VIC", "Custom"),
+            weigh(get_matrix01(), "VIC", "AbsPearson"),
+        )
+
+    def test_category_exception(self):
+        """
+        Test the registration of a method with an unknown category.
+        """
+        self.assertRaises(
+            ValueError,
+            register_method,
+            "ranking",
+            "Kernel",
+            absolute_pearson,
+        )
+
+    def test_capability_exception(self):
+        """
+        Test the registration of a method with an unknown capability.
+        """
+        self.assertRaises(
+            ValueError,
+            register_method,
+            "correlation",
+            "Custom",
+            absolute_pearson,
+            mixed_criteria=True,
+        )
+
+
+class TestGetMethod(ExtendedTestCase):
+    """
+    Test class for the ``get_method`` function of the ``mcdm`` package.
+    """
+    def test_builtin(self):
+        """
+        Test the retrieval of a built-in method, whose implementation is
+        imported on first use.
+        """
+        method = get_method("scoring", "mew")
+        self.assertEqual(method.name, "MEW")
+        self.assertEqual(method.category, "scoring")
+        self.assertIs(method.function, method.function)
+        self.assertEqual(
+            method.qualified_name,
+            "mcdm.scoring.mew_method.mew",
+        )
+        self.assertTrue(
+            get_method("normalization", "linear3").capabilities[
+                "column_sums_to_one"
+            ],
+        )
+
+    def test_unknown_exception(self):
+        """
+        Test the retrieval of an unknown method.
+        """
+        self.assertRaises(ValueError, get_method, "weighting", "Unknown")
+
+
+class TestListMethods(unittest.TestCase):
+    """
+    Test class for the ``list_methods`` function of the ``mcdm`` package.
+    """
+    def test_builtin(self):
+        """
+        Test the listing of the built-in scoring methods.
+        """
+        self.assertEqual(
+            list_methods("scoring"),
+            ["SAW", "MEW", "TOPSIS", "mTOPSIS"],
+        )
+
+    def test_category_exception(self):
+        """
+        Test the listing of the methods of an unknown category.
+        """
+        self.assertRaises(ValueError, list_methods, "ranking")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,385 @@
+# Copyright (c) 2022 Dimitrios-Georgios Akestoridis
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Test script for the ``helper_rolling.py`` file of the ``mcdm`` package.
+"""
+
+import unittest
+
+import numpy as np
+from mcdm import (
+    RollingRanker,
+    rank,
+    register_method,
+    rolling_rank,
+)
+from mcdm.helper_cache import MEMO_CACHE
+from mcdm.helper_registry import METHODS
+from mcdm.helper_rolling import WindowStatistics
+from mcdm.normalization import linear2
+from mcdm.weighting import mw
+
+from .helper_testing import (
+    ExtendedTestCase,
+    get_labels04,
+    get_matrix03,
+    get_matrix04,
+    get_matrix05,
+    get_matrix09,
+    get_ranking02,
+    get_vector01,
+)
+
+
+class TestRollingRank(ExtendedTestCase):
+    """
+    Test class for the ``rolling_rank`` function of the ``mcdm`` package.
+    """
+    def assertWindowRankings(self, window, **kwargs):
+        # pylint: disable=invalid-name
+        """
+        Assert that the rolling rankings of the matrix with ID 09 are almost
+        equal to the rankings of each full window.
+        """
+        x_matrix = get_matrix09()
+        alt_names = get_labels04()
+        ranker = RollingRanker(window, **kwargs)
+        for i, x_vector in enumerate(x_matrix):
+            if i + 1 < window:
+                # The first windows may contain too few alternatives
+                with np.errstate(all="ignore"):
+                    try:
+                        ranker.push(x_vector, alt_names[i])
+                    except ValueError:
+                        pass
+                continue
+            self.assertAlmostEqualRankings(
+                ranker.push(x_vector, alt_names[i]),
+                rank(
+                    x_matrix[i + 1 - window:i + 1],
+                    alt_names=alt_names[i + 1 - window:i + 1],
+                    **kwargs,
+                ),
+            )
+
+    def test_default(self):
+        """
+        Test the rolling ranking of alternatives with the default selections.
+        """
+        self.assertWindowRankings(5)
+
+    def test_full_window(self):
+        """
+        Test the rolling ranking of alternatives with a window that contains
+        all the alternatives.
+        """
+        obtained_rankings = list(
+            rolling_rank(get_matrix03(), 5, w_vector=get_vector01()),
+        )
+        self.assertEqual(len(obtained_rankings), 5)
+        self.assertAlmostEqualRankings(obtained_rankings[-1], get_ranking02())
+
+    def test_saw_sd_linear1(self):
+        """
+        Test the rolling ranking of alternatives with the SAW scoring method,
+        the SD weighting method, and the Linear1 normalization method.
+        """
+        self.assertWindowRankings(
+            4,
+            n_method="Linear1",
+            w_method="SD",
+            s_method="SAW",
+        )
+
+    def test_topsis_sd_linear1(self):
+        """
+        Test the rolling ranking of alternatives with the TOPSIS scoring
+        method, the SD weighting method, the Linear1 normalization method,
+        and a mixture of benefit and cost criteria.
+        """
+        self.assertWindowRankings(
+            6,
+            is_benefit_x=[True, True, False],
+            n_method="Linear1",
+            w_method="SD",
+            s_method="TOPSIS",
+        )
+
+    def test_mtopsis_critic_linear2(self):
+        """
+        Test the rolling ranking of alternatives with the mTOPSIS scoring
+        method, the CRITIC weighting method, the Linear2 normalization method,
+        and a mixture of benefit and cost criteria.
+        """
+        self.assertWindowRankings(
+            8,
+            is_benefit_x=[True, False, True],
+            n_method="Linear2",
+            w_method="CRITIC",
+            s_method="mTOPSIS",
+        )
+
+    def test_mew_em_linear3(self):
+        """
+        Test the rolling ranking of alternatives with the MEW scoring method,
+        the EM weighting method, and the Linear3 normalization method.
+        """
+        self.assertWindowRankings(
+            7,
+            n_method="Linear3",
+            w_method="EM",
+            s_method="MEW",
+        )
+
+    def test_topsis_sd_vector(self):
+        """
+        Test the rolling ranking of alternatives with the TOPSIS scoring
+        method, the SD weighting method, and the Vector normalization method.
+        """
+        self.assertWindowRankings(
+            3,
+            n_method="Vector",
+            w_method="SD",
+            s_method="TOPSIS",
+        )
+
+    def test_overridden_methods(self):
+        """
+        Test the rolling ranking of alternatives with registered methods that
+        replace the built-in methods whose results are derived from the
+        maintained statistics of the window.
+        """
+        sd_method = METHODS["weighting"]["SD"]
+        linear1_method = METHODS["normalization"]["LINEAR1"]
+        register_method("weighting", "SD", mw)
+        register_method(
+            "normalization",
+            "Linear1",
+            linear2,
+            benefit_output=True,
+        )
+        try:
+            self.assertWindowRankings(
+                4,
+                n_method="Linear1",
+                w_method="SD",
+                s_method="SAW",
+            )
+        finally:
+            METHODS["weighting"]["SD"] = sd_method
+            METHODS["normalization"]["LINEAR1"] = linear1_method
+            MEMO_CACHE.clear()
+
+    def test_window_exception(self):
+        """
+        Test the rolling ranking of alternatives with an invalid window size.
+        """
+        self.assertRaises(
+            ValueError,
+            list,
+            rolling_rank(get_matrix03(), 0),
+        )
+
+    def test_alt_names_exception(self):
+        """
+        Test the rolling ranking of alternatives with the wrong number of
+        names for the alternatives.
+        """
+        self.assertRaises(
+            ValueError,
+            list,
+            rolling_rank(get_matrix03(), 2, alt_names=["a1", "a2"]),
+        )
+
+    def test_normalization_exception(self):
+        """
+        Test the rolling ranking of alternatives that are not normalized.
+        """
+        self.assertRaises(
+            ValueError,
+            list,
+            rolling_rank(get_matrix04(), 3),
+        )
+
+    def test_linear1_exception(self):
+        """
+        Test the rolling ranking of alternatives with the Linear1
+        normalization method and a cost criterion whose minimum value is zero.
+        """
+        self.assertRaises(
+            ValueError,
+            list,
+            rolling_rank(
+                get_matrix04(),
+                3,
+                is_benefit_x=[False, True, True, True],
+                n_method="Linear1",
+            ),
+        )
+
+    def test_linear2_exception(self):
+        """
+        Test the rolling ranking of alternatives with the Linear2
+        normalization method and a window with constant criteria.
+        """
+        self.assertRaises(
+            ValueError,
+            list,
+            rolling_rank(get_matrix04(), 3, n_method="Linear2"),
+        )
+
+    def test_linear3_exception(self):
+        """
+        Test the rolling ranking of alternatives with the Linear3
+        normalization method and negative values.
+        """
+        self.assertRaises(
+            ValueError,
+            list,
+            rolling_rank(get_matrix05(), 3, n_method="Linear3"),
+        )
+
+    def test_vector_exception(self):
+        """
+        Test the rolling ranking of alternatives with the Vector normalization
+        method and negative values.
+        """
+        self.assertRaises(
+            ValueError,
+            list,
+            rolling_rank(get_matrix05(), 3, n_method="Vector"),
+        )
+
+    def test_unknown_normalization_exception(self):
+        """
+        Test the rolling ranking of alternatives with an unknown normalization
+        method.
+        """
+        self.assertRaises(
+            ValueError,
+            list,
+            rolling_rank(get_matrix03(), 3, n_method="Unknown"),
+        )
+
+
+class TestWindowStatistics(ExtendedTestCase):
+    """
+    Test class for the ``WindowStatistics`` class of the ``mcdm`` package.
+    """
+    def test_statistics(self):
+        """
+        Test the statistics of the columns of a full window.
+        """
+        stats = WindowStatistics(3, 4)
+        for x_vector in get_matrix04():
+            stats.push(x_vector, None)
+        self.assertEqual(len(stats), 3)
+        self.assertAlmostEqualArrays(
+            stats.matrix(),
+            np.array(get_matrix04()[3:], dtype=np.float64),
+        )
+        self.assertAlmostEqualArrays(
+            stats.maxima(),
+            np.array([6.0, 600.0, 7.0, 7.0], dtype=np.float64),
+        )
+        self.assertAlmostEqualArrays(
+            stats.minima(),
+            np.array([0.0, 300.0, 7.0, 7.0], dtype=np.float64),
+        )
+        self.assertAlmostEqualArrays(
+            stats.std(),
+            np.std(np.array(get_matrix04()[3:]), axis=0),
+        )
+
+    def test_large_offset(self):
+        """
+        Test the standard deviations of columns with a large offset.
+        """
+        rng = np.random.default_rng(0)
+        x_matrix = 1e8 + rng.uniform(0.0, 1.0, (50, 3))
+        stats = WindowStatistics(7, 3)
+        for i in range(x_matrix.shape[0]):
+            stats.push(x_matrix[i], None)
+            np.testing.assert_allclose(
+                stats.std(),
+                np.std(x_matrix[max(0, i - 6):i + 1], axis=0),
+                rtol=1e-6,
+            )
+
+    def test_window_exception(self):
+        """
+        Test the initialization with an invalid window size.
+        """
+        self.assertRaises(ValueError, WindowStatistics, 0, 2)
+
+
+class TestRollingRanker(ExtendedTestCase):
+    """
+    Test class for the ``RollingRanker`` class of the ``mcdm`` package.
+    """
+    def test_push(self):
+        """
+        Test the insertion of alternatives with default names.
+        """
+        ranker = RollingRanker(2, w_vector=get_vector01())
+        self.assertAlmostEqualRankings(
+            ranker.push(np.array([0.0, 1.0], dtype=np.float64)),
+            [("a1", 0.3)],
+        )
+        self.assertAlmostEqualRankings(
+            ranker.push([1.0, 0.0]),
+            [("a2", 0.7), ("a1", 0.3)],
+        )
+        self.assertAlmostEqualRankings(
+            ranker.push([0.5, 0.5], alt_name="B"),
+            [("a2", 0.7), ("B", 0.5)],
+        )
+        self.assertAlmostEqualRankings(
+            ranker.rank(),
+            [("a2", 0.7), ("B", 0.5)],
+        )
+
+    def test_window_exception(self):
+        """
+        Test the initialization with an invalid window size.
+        """
+        self.assertRaises(ValueError, RollingRanker, 0)
+
+    def test_shape_exception(self):
+        """
+        Test the insertion of an alternative with the wrong number of values.
+        """
+        ranker = RollingRanker(2)
+        ranker.push([0.0, 1.0])
+        self.assertRaises(ValueError, ranker.push, [0.0, 0.5, 1.0])
+
+    def test_is_benefit_x_exception(self):
+        """
+        Test the insertion of alternatives with the wrong number of criteria
+        types.
+        """
+        ranker = RollingRanker(2, is_benefit_x=[True, True, True])
+        self.assertRaises(ValueError, ranker.push, [0.0, 1.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
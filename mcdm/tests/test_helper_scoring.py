@@ -28,10 +28,13 @@ Test script for the ``helper_scoring.py`` file of the ``mcdm`` package.
 import unittest
 
 import numpy as np
-from mcdm import score
+from mcdm import QuantizedMatrix, register_method, score
+from mcdm.helper_registry import METHODS
+from mcdm.scoring import topsis
 
 from .helper_testing import (
     ExtendedTestCase,
+    get_matrix01,
     get_matrix03,
     get_vector05,
 )
@@ -55,5 +58,163 @@ class TestScore(ExtendedTestCase):
         )
 
 
+class TestScoreInto(ExtendedTestCase):
+    """
+    Test class for the scoring with preallocated arrays with the ``score``
+    function of the ``mcdm`` package.
+    """
+    def tearDown(self):
+        METHODS["scoring"].pop("CUSTOM", None)
+
+    def test_out(self):
+        """
+        Test the scoring into an output array with each method.
+        """
+        z_matrix = np.array(get_matrix01(), dtype=np.float64)
+        w_vector = np.array([0.5, 0.3, 0.2], dtype=np.float64)
+        for s_method in ["SAW", "MEW", "TOPSIS", "mTOPSIS"]:
+            expected = score(z_matrix, [True, True, True], w_vector, s_method)
+            out = np.zeros(7, dtype=np.float64)
+            obtained = score(
+                z_matrix,
+                [True, True, True],
+                w_vector,
+                s_method,
+                out=out,
+                workspace=np.zeros((7, 3), dtype=np.float64),
+            )
+            self.assertIs(obtained[0], out)
+            self.assertAlmostEqualArrays(obtained[0], expected[0])
+            self.assertEqual(obtained[1], expected[1])
+
+    def test_workspace(self):
+        """
+        Test the scoring with a workspace array but no output array.
+        """
+        self.assertAlmostEqualArrays(
+            score(
+                get_matrix03(),
+                [True, True],
+                get_vector05(),
+                "TOPSIS",
+                dtype=np.float32,
+                workspace=np.zeros((5, 2), dtype=np.float32),
+            )[0],
+            score(
+                get_matrix03(),
+                [True, True],
+                get_vector05(),
+                "TOPSIS",
+                dtype=np.float32,
+            )[0],
+        )
+
+    def test_custom_out(self):
+        """
+        Test the scoring into an output array with a registered method that
+        cannot use it.
+        """
+        register_method("scoring", "Custom", topsis, mixed_criteria=True)
+        for workspace in [None, np.zeros((5, 2), dtype=np.float64)]:
+            out = np.zeros(5, dtype=np.float64)
+            obtained = score(
+                get_matrix03(),
+                [True, False],
+                get_vector05(),
+                "Custom",
+                out=out,
+                workspace=workspace,
+            )
+            self.assertIs(obtained[0], out)
+            self.assertAlmostEqualArrays(
+                out,
+                score(
+                    get_matrix03(),
+                    [True, False],
+                    get_vector05(),
+                    "TOPSIS",
+                )[0],
+            )
+        self.assertAlmostEqualArrays(
+            score(
+                get_matrix03(),
+                [True, False],
+                get_vector05(),
+                "Custom",
+                workspace=np.zeros((5, 2), dtype=np.float64),
+            )[0],
+            score(get_matrix03(), [True, False], get_vector05(), "TOPSIS")[0],
+        )
+
+    def test_out_exception(self):
+        """
+        Test the scoring into an output array of a different shape.
+        """
+        self.assertRaises(
+            ValueError,
+            score,
+            get_matrix03(),
+            [True, True],
+            get_vector05(),
+            "SAW",
+            out=np.zeros(4, dtype=np.float64),
+        )
+
+    def test_workspace_exception(self):
+        """
+        Test the scoring with a workspace array of a different data type.
+        """
+        self.assertRaises(
+            ValueError,
+            score,
+            get_matrix03(),
+            [True, True],
+            get_vector05(),
+            "TOPSIS",
+            workspace=np.zeros((5, 2), dtype=np.float32),
+        )
+
+    def test_aliased_exception(self):
+        """
+        Test the scoring with preallocated arrays that share memory with the
+        decision matrix.
+        """
+        z_matrix = np.array(get_matrix03(), dtype=np.float64)
+        expected = np.copy(z_matrix)
+        self.assertRaises(
+            ValueError,
+            score,
+            z_matrix,
+            [True, True],
+            get_vector05(),
+            "TOPSIS",
+            workspace=z_matrix,
+        )
+        self.assertRaises(
+            ValueError,
+            score,
+            z_matrix,
+            [True, True],
+            get_vector05(),
+            "SAW",
+            out=z_matrix[:, 0],
+        )
+        self.assertAlmostEqualArrays(z_matrix, expected)
+
+    def test_quantized_exception(self):
+        """
+        Test the scoring of a quantized matrix into an output array.
+        """
+        self.assertRaises(
+            ValueError,
+            score,
+            QuantizedMatrix(get_matrix03()),
+            [True, True],
+            get_vector05(),
+            "SAW",
+            out=np.zeros(5, dtype=np.float64),
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,184 @@
+# Copyright (c) 2022 Dimitrios-Georgios Akestoridis
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Test script for the ``helper_skyline.py`` file of the ``mcdm`` package.
+"""
+
+import unittest
+
+import numpy as np
+from mcdm import pareto_layers, skyline
+from mcdm.helper_skyline import count_dominators, dominance_counts
+
+
+def brute_force_counts(y_matrix):
+    """
+    Return the number of rows that dominate each row of the provided matrix
+    by comparing all pairs of rows.
+    """
+    y_matrix = np.array(y_matrix, dtype=np.float64)
+    return np.sum(
+        np.all(y_matrix[:, np.newaxis] >= y_matrix, axis=2)
+        & np.any(y_matrix[:, np.newaxis] > y_matrix, axis=2),
+        axis=0,
+    )
+
+
+class TestDominanceCounts(unittest.TestCase):
+    """
+    Test class for the ``dominance_counts`` function of the ``mcdm``
+    package.
+    """
+    def test_random(self):
+        """
+        Test the dominance counts of random matrices with many ties.
+        """
+        rng = np.random.default_rng(0)
+        for _ in range(20):
+            y_matrix = rng.integers(0, 4, (300, 3)).astype(np.float64)
+            expected = brute_force_counts(y_matrix)
+            for max_count in [1, 3, 10]:
+                self.assertTrue(
+                    np.array_equal(
+                        dominance_counts(y_matrix, max_count, block_size=32),
+                        np.minimum(expected, max_count),
+                    ),
+                )
+
+    def test_continuous(self):
+        """
+        Test the dominance counts of a matrix with continuous values.
+        """
+        y_matrix = np.random.default_rng(1).random((2000, 4))
+        self.assertTrue(
+            np.array_equal(
+                dominance_counts(y_matrix, 5),
+                np.minimum(brute_force_counts(y_matrix), 5),
+            ),
+        )
+
+    def test_equal_sums(self):
+        """
+        Test the dominance counts of rows with equal sums after rounding that
+        are processed in different blocks.
+        """
+        y_matrix = [[1.0, 1e-17], [1.0, 2e-17], [0.5, 0.5], [1.0, 3e-17]]
+        for block_size in [1, 2, 3]:
+            self.assertEqual(
+                dominance_counts(y_matrix, 5, block_size=block_size).tolist(),
+                brute_force_counts(y_matrix).tolist(),
+            )
+
+    def test_nested_list(self):
+        """
+        Test the dominance counts of a nested list.
+        """
+        self.assertEqual(
+            dominance_counts([[1, 2], [2, 1], [1, 1], [0, 0], [1, 1]], 3)
+            .tolist(),
+            [0, 0, 2, 3, 2],
+        )
+
+    def test_empty(self):
+        """
+        Test the dominance counts of a matrix without any rows.
+        """
+        self.assertEqual(dominance_counts(np.zeros((0, 3)), 1).shape, (0,))
+        self.assertEqual(
+            count_dominators(np.zeros((0, 3)), np.ones((2, 3))).shape,
+            (0,),
+        )
+
+
+class TestSkyline(unittest.TestCase):
+    """
+    Test class for the ``skyline`` function of the ``mcdm`` package.
+    """
+    def test_benefit(self):
+        """
+        Test the Pareto front of a matrix with benefit criteria.
+        """
+        x_matrix = [[1, 2], [2, 1], [1, 1], [0, 0], [2, 1]]
+        self.assertEqual(skyline(x_matrix).tolist(), [0, 1, 4])
+
+    def test_mixed(self):
+        """
+        Test the Pareto front of a matrix with benefit and cost criteria.
+        """
+        x_matrix = np.random.default_rng(2).random((400, 3))
+        y_matrix = x_matrix * [1, -1, 1]
+        self.assertEqual(
+            skyline(x_matrix, is_benefit_x=[True, False, True]).tolist(),
+            np.flatnonzero(brute_force_counts(y_matrix) == 0).tolist(),
+        )
+
+    def test_exception(self):
+        """
+        Test the Pareto front with invalid arguments.
+        """
+        self.assertRaises(ValueError, skyline, [1, 2, 3])
+        self.assertRaises(ValueError, skyline, [[1, 2]], [True])
+
+
+class TestParetoLayers(unittest.TestCase):
+    """
+    Test class for the ``pareto_layers`` function of the ``mcdm`` package.
+    """
+    def test_random(self):
+        """
+        Test the dominance depth of random matrices with many ties.
+        """
+        rng = np.random.default_rng(3)
+        for _ in range(10):
+            x_matrix = rng.integers(0, 5, (200, 3))
+            layers = pareto_layers(x_matrix, is_benefit_x=[False] * 3)
+            counts = brute_force_counts(-x_matrix)
+            self.assertTrue(np.all(layers[counts == 0] == 1))
+            for i in range(x_matrix.shape[0]):
+                dominators = np.all(x_matrix <= x_matrix[i], axis=1) & np.any(
+                    x_matrix < x_matrix[i],
+                    axis=1,
+                )
+                if np.any(dominators):
+                    self.assertEqual(
+                        layers[i],
+                        np.max(layers[dominators]) + 1,
+                    )
+
+    def test_max_layers(self):
+        """
+        Test the dominance depth with a maximum number of layers.
+        """
+        x_matrix = [[3, 3], [2, 2], [1, 1], [0, 0], [3, 0]]
+        self.assertEqual(
+            pareto_layers(x_matrix).tolist(),
+            [1, 2, 3, 4, 2],
+        )
+        self.assertEqual(
+            pareto_layers(x_matrix, max_layers=2).tolist(),
+            [1, 2, 0, 0, 2],
+        )
+        self.assertRaises(ValueError, pareto_layers, x_matrix, None, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
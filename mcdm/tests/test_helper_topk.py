@@ -0,0 +1,143 @@
+# Copyright (c) 2022 Dimitrios-Georgios Akestoridis
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Test script for the ``helper_topk.py`` file of the ``mcdm`` package.
+"""
+
+import unittest
+
+import numpy as np
+from mcdm import SawIndex, rank
+
+from .helper_testing import (
+    ExtendedTestCase,
+    get_matrix03,
+    get_ranking01,
+)
+
+
+class TestSawIndex(ExtendedTestCase):
+    """
+    Test class for the ``SawIndex`` class of the ``mcdm`` package.
+    """
+    def assertTopScores(self, index, z_matrix, w_vector, k, desc_order):
+        # pylint: disable=invalid-name
+        """
+        Assert that the query returns the best scores and that the names
+        match the scores.
+        """
+        s_vector = np.dot(z_matrix, w_vector)
+        expected = np.sort(s_vector)
+        if desc_order:
+            expected = expected[::-1]
+        obtained = index.query(w_vector, k)
+        self.assertEqual(len(obtained), k)
+        for i, (alt_name, alt_score) in enumerate(obtained):
+            self.assertAlmostEqual(alt_score, expected[i], places=12)
+            self.assertAlmostEqual(
+                s_vector[int(alt_name[1:]) - 1],
+                alt_score,
+                places=12,
+            )
+
+    def test_query(self):
+        """
+        Test top-k queries with random and sparse weight vectors.
+        """
+        rng = np.random.default_rng(0)
+        z_matrix = rng.random((3000, 4))
+        z_matrix[10:20] = z_matrix[0]
+        index = SawIndex(z_matrix, max_k=5)
+        self.assertLess(index.candidates.shape[0], 1000)
+        for w_vector in list(rng.dirichlet(np.ones(4), 20)) + [
+            [1.0, 0.0, 0.0, 0.0],
+            [0.0, 0.5, 0.5, 0.0],
+        ]:
+            for k in [1, 3, 5, 6]:
+                self.assertTopScores(index, z_matrix, w_vector, k, True)
+
+    def test_cost_criteria(self):
+        """
+        Test top-k queries with cost criteria.
+        """
+        rng = np.random.default_rng(1)
+        z_matrix = rng.integers(0, 5, (500, 3)) / 4.0
+        index = SawIndex(z_matrix, is_benefit_z=[False, False, False])
+        for w_vector in rng.dirichlet(np.ones(3), 10):
+            for k in [1, 10, 500]:
+                self.assertTopScores(index, z_matrix, w_vector, k, False)
+
+    def test_ranking(self):
+        """
+        Test a query of all alternatives.
+        """
+        index = SawIndex(get_matrix03(), max_k=5)
+        self.assertAlmostEqualRankings(
+            index.query([0.5, 0.5], 5),
+            get_ranking01(),
+        )
+        self.assertAlmostEqualRankings(
+            SawIndex(get_matrix03(), alt_names=list("abcde")).query(
+                [0.3, 0.7],
+                2,
+            ),
+            rank(
+                get_matrix03(),
+                alt_names=list("abcde"),
+                w_vector=[0.3, 0.7],
+            )[:2],
+        )
+
+    def test_exceptions(self):
+        """
+        Test the exceptions of the ``SawIndex`` class.
+        """
+        self.assertRaises(ValueError, SawIndex, get_matrix03(), max_k=0)
+        self.assertRaises(
+            ValueError,
+            SawIndex,
+            get_matrix03(),
+            alt_names=["a", "b"],
+        )
+        self.assertRaises(
+            ValueError,
+            SawIndex,
+            get_matrix03(),
+            is_benefit_z=[True],
+        )
+        self.assertRaises(
+            ValueError,
+            SawIndex,
+            get_matrix03(),
+            is_benefit_z=[True, False],
+        )
+        self.assertRaises(ValueError, SawIndex, [[0.5, 1.5], [0.5, 0.5]])
+        index = SawIndex(get_matrix03())
+        self.assertRaises(ValueError, index.query, [0.5, 0.5], 0)
+        self.assertRaises(ValueError, index.query, [0.5, 0.5], 6)
+        self.assertRaises(TypeError, index.query, [0.5, 0.5], 1.5)
+        self.assertRaises(ValueError, index.query, [0.5, 0.25, 0.25])
+        self.assertRaises(ValueError, index.query, [0.5, 0.6])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -30,8 +30,11 @@ import unittest
 import numpy as np
 from mcdm.helper_validation import (
     check_normalization_input,
+    check_preallocated_array,
     check_scoring_input,
     check_weighting_input,
+    has_element_above,
+    has_element_below,
 )
 
 from .helper_testing import (
@@ -98,5 +101,86 @@ class TestCheckNormalizationInput(ExtendedTestCase):
         )
 
 
+class TestHasElement(ExtendedTestCase):
+    """
+    Test class for the ``has_element_below`` and ``has_element_above``
+    functions of the ``mcdm.helper_validation`` module.
+    """
+    def test_calculations(self):
+        """
+        Test the comparison of the elements of matrices with a value.
+        """
+        z_matrix = np.array(get_matrix01(), dtype=np.float64)
+        self.assertFalse(has_element_below(z_matrix, 0.0))
+        self.assertTrue(has_element_below(z_matrix, 0.1))
+        self.assertFalse(has_element_above(z_matrix, 1.0))
+        self.assertTrue(has_element_above(z_matrix, 0.9))
+
+    def test_missing_elements(self):
+        """
+        Test the comparison of matrices with missing elements, which are
+        ignored.
+        """
+        z_matrix = np.array([[np.nan, -0.5], [1.5, np.nan]], dtype=np.float64)
+        self.assertTrue(has_element_below(z_matrix, 0.0))
+        self.assertTrue(has_element_above(z_matrix, 1.0))
+        z_matrix = np.full((2, 2), np.nan, dtype=np.float64)
+        self.assertFalse(has_element_below(z_matrix, 0.0))
+        self.assertFalse(has_element_above(z_matrix, 1.0))
+
+    def test_empty(self):
+        """
+        Test the comparison of an empty matrix.
+        """
+        z_matrix = np.zeros((0, 3), dtype=np.float64)
+        self.assertFalse(has_element_below(z_matrix, 0.0))
+        self.assertFalse(has_element_above(z_matrix, 1.0))
+
+
+class TestCheckPreallocatedArray(ExtendedTestCase):
+    """
+    Test class for the ``check_preallocated_array`` function of the
+    ``mcdm.helper_validation`` module.
+    """
+    def test_valid(self):
+        """
+        Test the validation of an appropriate preallocated array.
+        """
+        check_preallocated_array(
+            np.zeros((7, 3), dtype=np.float32),
+            (7, 3),
+            np.float32,
+            "output array",
+        )
+
+    def test_nested_list_exception(self):
+        """
+        Test the validation of a nested list instead of an array.
+        """
+        self.assertRaises(
+            ValueError,
+            check_preallocated_array,
+            get_matrix01(),
+            (7, 3),
+            np.float64,
+            "output array",
+        )
+
+    def test_readonly_exception(self):
+        """
+        Test the validation of an array that is not writeable.
+        """
+        out = np.zeros((7, 3), dtype=np.float64)
+        out.flags.writeable = False
+        self.assertRaises(
+            ValueError,
+            check_preallocated_array,
+            out,
+            (7, 3),
+            np.float64,
+            "output array",
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -51,6 +51,72 @@ class TestWeigh(ExtendedTestCase):
             "Unknown",
         )
 
+    def test_workspace(self):
+        """
+        Test the weighting with a workspace array with each method.
+        """
+        z_matrix = np.array(get_matrix01(), dtype=np.float64)
+        for w_method, c_method in [
+            ("MW", None),
+            ("EM", None),
+            ("SD", None),
+            ("CRITIC", "Pearson"),
+            ("CRITIC", "dCor"),
+            ("VIC", "dCor"),
+        ]:
+            if w_method == "EM":
+                z_matrix = z_matrix / np.sum(z_matrix, axis=0)
+            workspace = np.zeros(z_matrix.shape, dtype=np.float64)
+            self.assertAlmostEqualArrays(
+                weigh(z_matrix, w_method, c_method, workspace=workspace),
+                weigh(z_matrix, w_method, c_method),
+            )
+            z_matrix = np.array(get_matrix01(), dtype=np.float64)
+
+    def test_workspace_float32(self):
+        """
+        Test the weighting with a float32 workspace array.
+        """
+        self.assertAlmostEqualArrays(
+            weigh(
+                get_matrix01(),
+                "CRITIC",
+                dtype=np.float32,
+                workspace=np.zeros((7, 3), dtype=np.float32),
+            ),
+            weigh(get_matrix01(), "CRITIC", dtype=np.float32),
+        )
+
+    def test_workspace_exception(self):
+        """
+        Test the weighting with a workspace array of a different shape.
+        """
+        self.assertRaises(
+            ValueError,
+            weigh,
+            np.array(get_matrix01(), dtype=np.float64),
+            "SD",
+            workspace=np.zeros((3, 7), dtype=np.float64),
+        )
+
+    def test_workspace_aliased_exception(self):
+        """
+        Test the weighting with a workspace array that is the decision
+        matrix itself.
+        """
+        z_matrix = np.array(get_matrix01(), dtype=np.float64)
+        self.assertRaises(
+            ValueError,
+            weigh,
+            z_matrix,
+            "SD",
+            workspace=z_matrix,
+        )
+        self.assertAlmostEqualArrays(
+            z_matrix,
+            np.array(get_matrix01(), dtype=np.float64),
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
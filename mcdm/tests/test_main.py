@@ -25,13 +25,19 @@
 Test script for the ``main.py`` file of the ``mcdm`` package.
 """
 
+import bz2
+import gzip
 import os
+import tempfile
 import unittest
 
 import numpy as np
 from mcdm import (
+    DecisionProblem,
     load,
+    load_chunks,
     rank,
+    save,
 )
 
 from .helper_testing import (
@@ -52,6 +58,7 @@ from .helper_testing import (
     get_matrix09,
     get_matrix10,
     get_matrix49,
+    get_matrix50,
     get_ranking01,
     get_ranking02,
     get_ranking03,
@@ -69,6 +76,7 @@ from .helper_testing import (
     get_ranking15,
     get_ranking16,
     get_ranking24,
+    get_ranking25,
     get_vector01,
     get_vector02,
     get_vector03,
@@ -497,6 +505,94 @@ class TestRank(ExtendedTestCase):
             s_method="mTOPSIS",
         )
 
+    def test_problem(self):
+        """
+        Test the ranking of a decision problem, whose criterion types and
+        weights are used unless they are explicitly provided.
+        """
+        problem = DecisionProblem(
+            get_matrix50(),
+            alt_names=["a1", "a2", "a3", "a4"],
+            is_benefit_x=[False, True, True],
+            w_vector=[0.5, 0.25, 0.25],
+        )
+        self.assertAlmostEqualRankings(
+            rank(problem, n_method="Linear1"),
+            get_ranking25(),
+        )
+        self.assertAlmostEqualRankings(
+            rank(problem, n_method="Linear1", w_vector=[0.5, 0.25, 0.25]),
+            get_ranking25(),
+        )
+        self.assertRaises(
+            ValueError,
+            rank,
+            problem,
+            alt_names=["a1", "a2"],
+            n_method="Linear1",
+        )
+
+    def test_top_k(self):
+        """
+        Test the ranking of the top alternatives, with and without the skyline
+        prefilter, using both the fused and the general code paths.
+        """
+        x_matrix = np.random.default_rng(0).random((500, 4))
+        for kwargs in [
+            {"n_method": "Linear1"},
+            {"n_method": "Linear2", "w_method": "SD"},
+            {"n_method": "Linear1", "s_method": "MEW"},
+            {"is_benefit_x": [False] * 4, "n_method": "Vector"},
+            {"is_benefit_x": [False] * 4, "s_method": "MEW"},
+        ]:
+            expected = rank(x_matrix, **kwargs)
+            for top_k in [1, 5, 600]:
+                self.assertAlmostEqualRankings(
+                    rank(x_matrix, top_k=top_k, **kwargs),
+                    expected[:top_k],
+                )
+                self.assertAlmostEqualRankings(
+                    rank(x_matrix, top_k=top_k, prefilter=True, **kwargs),
+                    expected[:top_k],
+                )
+
+    def test_top_k_exception(self):
+        """
+        Test the ranking of the top alternatives with invalid arguments.
+        """
+        self.assertRaises(ValueError, rank, get_matrix03(), top_k=0)
+        self.assertRaises(ValueError, rank, get_matrix03(), prefilter=True)
+        self.assertRaises(
+            ValueError,
+            rank,
+            get_matrix03(),
+            s_method="TOPSIS",
+            top_k=1,
+            prefilter=True,
+        )
+
+    def test_dtype(self):
+        """
+        Test the ranking of alternatives with float32 computations.
+        """
+        for kwargs in [
+            {},
+            {"n_method": "Linear2", "w_method": "SD"},
+            {"n_method": "Vector", "w_method": "SD", "s_method": "TOPSIS"},
+            {"n_method": "Linear1", "w_method": "VIC", "s_method": "MEW"},
+        ]:
+            obtained_ranking = rank(get_matrix01(), dtype="float32", **kwargs)
+            self.assertAlmostEqualRankings(
+                obtained_ranking,
+                rank(get_matrix01(), **kwargs),
+            )
+            self.assertIsInstance(obtained_ranking[0][1], np.float32)
+        self.assertAlmostEqualRankings(
+            rank(get_matrix03(), dtype=np.float32, dedup=True),
+            get_ranking01(),
+        )
+        self.assertRaises(ValueError, rank, get_matrix03(), dtype="int32")
+
 
 class TestLoad(ExtendedTestCase):
     """
@@ -677,6 +773,401 @@ class TestLoad(ExtendedTestCase):
             labeled_rows=True,
         )
 
+    def test_compressed(self):
+        """
+        Test the loading of gzip-compressed CSV and TSV files, with and
+        without row labels.
+        """
+        with tempfile.TemporaryDirectory() as tmp_dirpath:
+            for filename in ["example01.csv", "example09.tsv"]:
+                with open(
+                    os.path.join(DIR_PATH, "data", filename),
+                    mode="rb",
+                ) as src_fp, gzip.open(
+                    os.path.join(tmp_dirpath, filename + ".gz"),
+                    mode="wb",
+                ) as dst_fp:
+                    dst_fp.write(src_fp.read())
+            obtained_matrix, obtained_row_labels = load(
+                os.path.join(tmp_dirpath, "example01.csv.gz"),
+                workers=2,
+            )
+            self.assertAlmostEqualArrays(
+                obtained_matrix,
+                np.array(get_matrix01(), dtype=np.float64),
+            )
+            self.assertEqual(obtained_row_labels, None)
+            obtained_matrix, obtained_row_labels = load(
+                os.path.join(tmp_dirpath, "example09.tsv.gz"),
+                delimiter="\t",
+                skiprows=1,
+                labeled_rows=True,
+            )
+            self.assertAlmostEqualArrays(
+                obtained_matrix,
+                np.array(get_matrix09(), dtype=np.float64),
+            )
+            self.assertEqual(obtained_row_labels, get_labels04())
+
+    def test_example10(self):
+        """
+        Test the loading of a decision problem from a CSV file whose header
+        rows contain the criterion names, types, and weights, with and
+        without parallel parsing.
+        """
+        for workers in [None, 2]:
+            problem = load(
+                os.path.join(DIR_PATH, "data", "example10.csv"),
+                skiprows=1,
+                labeled_rows=True,
+                workers=workers,
+                header=["names", "types", "weights"],
+            )
+            self.assertIsInstance(problem, DecisionProblem)
+            self.assertAlmostEqualArrays(
+                problem.x_matrix,
+                np.array(get_matrix50(), dtype=np.float64),
+            )
+            self.assertEqual(problem.alt_names, ["a1", "a2", "a3", "a4"])
+            self.assertEqual(
+                problem.criteria_names,
+                ["Cost", "Speed", "Reliability, %"],
+            )
+            self.assertEqual(problem.is_benefit_x, [False, True, True])
+            self.assertAlmostEqualArrays(
+                problem.w_vector,
+                np.array([0.5, 0.25, 0.25], dtype=np.float64),
+            )
+            self.assertAlmostEqualRankings(
+                rank(problem, n_method="Linear1"),
+                get_ranking25(),
+            )
+
+    def test_header_unlabeled(self):
+        """
+        Test the loading of a decision problem from a TSV file without row
+        labels, using whitespace as the delimiter.
+        """
+        with tempfile.TemporaryDirectory() as tmp_dirpath:
+            filepath = os.path.join(tmp_dirpath, "example10.tsv")
+            with open(filepath, mode="w", encoding="utf-8") as fp:
+                fp.write("C1 C2 C3\ncost benefit benefit\n")
+                for row in get_matrix50():
+                    fp.write(" ".join(str(value) for value in row) + "\n")
+            problem = load(
+                filepath,
+                delimiter=None,
+                header=["names", "types"],
+            )
+        self.assertAlmostEqualArrays(
+            problem.x_matrix,
+            np.array(get_matrix50(), dtype=np.float64),
+        )
+        self.assertEqual(problem.alt_names, None)
+        self.assertEqual(problem.criteria_names, ["C1", "C2", "C3"])
+        self.assertEqual(problem.is_benefit_x, [False, True, True])
+        self.assertEqual(problem.w_vector, None)
+
+    def test_header_binary(self):
+        """
+        Test the loading of a decision problem from a binary file, which
+        stores the criterion types.
+        """
+        with tempfile.TemporaryDirectory() as tmp_dirpath:
+            filepath = os.path.join(tmp_dirpath, "example10.bin")
+            save(filepath, get_matrix50(), is_benefit_x=[False, True, True])
+            problem = load(filepath, mmap_mode=None, header=[])
+        self.assertAlmostEqualArrays(
+            problem.x_matrix,
+            np.array(get_matrix50(), dtype=np.float64),
+        )
+        self.assertEqual(problem.is_benefit_x, [False, True, True])
+        self.assertEqual(problem.criteria_names, None)
+
+    def test_dtype(self):
+        """
+        Test the loading of float32 matrices from text and binary files.
+        """
+        obtained_matrix, _ = load(
+            os.path.join(DIR_PATH, "data", "example01.csv"),
+            dtype=np.float32,
+        )
+        self.assertAlmostEqualArrays(
+            obtained_matrix,
+            np.array(get_matrix01(), dtype=np.float32),
+        )
+        for workers in [None, 2]:
+            obtained_matrix, obtained_row_labels = load(
+                os.path.join(DIR_PATH, "data", "example09.tsv"),
+                delimiter="\t",
+                skiprows=1,
+                labeled_rows=True,
+                workers=workers,
+                dtype="float32",
+            )
+            self.assertAlmostEqualArrays(
+                obtained_matrix,
+                np.array(get_matrix09(), dtype=np.float32),
+            )
+            self.assertEqual(obtained_row_labels, get_labels04())
+        with tempfile.TemporaryDirectory() as tmp_dirpath:
+            filepath = os.path.join(tmp_dirpath, "example01.bin")
+            save(filepath, get_matrix01())
+            obtained_matrix, _ = load(filepath, dtype=np.float32)
+        self.assertAlmostEqualArrays(
+            obtained_matrix,
+            np.array(get_matrix01(), dtype=np.float32),
+        )
+        self.assertRaises(
+            ValueError,
+            load,
+            os.path.join(DIR_PATH, "data", "example01.csv"),
+            dtype=np.int64,
+        )
+
+
+class TestSave(ExtendedTestCase):
+    """
+    Test class for the ``save`` function of the ``mcdm`` package.
+    """
+    def test_example09(self):
+        """
+        Test the saving of a large matrix with row labels to a binary file
+        and its subsequent loading and ranking.
+        """
+        x_matrix, alt_names = load(
+            os.path.join(DIR_PATH, "data", "example09.tsv"),
+            delimiter="\t",
+            skiprows=1,
+            labeled_rows=True,
+        )
+        with tempfile.TemporaryDirectory() as tmp_dirpath:
+            filepath = os.path.join(tmp_dirpath, "example09.bin")
+            save(filepath, x_matrix, alt_names=alt_names)
+            obtained_matrix, obtained_row_labels = load(
+                filepath,
+                labeled_rows=True,
+            )
+            self.assertAlmostEqualArrays(
+                np.asarray(obtained_matrix),
+                np.array(get_matrix09(), dtype=np.float64),
+            )
+            self.assertEqual(obtained_row_labels, get_labels04())
+            self.assertAlmostEqualRankings(
+                rank(
+                    obtained_matrix,
+                    alt_names=obtained_row_labels,
+                    w_method="VIC",
+                    s_method="MEW",
+                ),
+                get_ranking16(),
+            )
+            del obtained_matrix
+
+    def test_example01(self):
+        """
+        Test the saving of a matrix without row labels to a binary file and
+        its subsequent loading without memory mapping.
+        """
+        with tempfile.TemporaryDirectory() as tmp_dirpath:
+            filepath = os.path.join(tmp_dirpath, "example01.bin")
+            save(filepath, get_matrix01())
+            obtained_matrix, obtained_row_labels = load(
+                filepath,
+                mmap_mode=None,
+            )
+            self.assertAlmostEqualArrays(
+                obtained_matrix,
+                np.array(get_matrix01(), dtype=np.float64),
+            )
+            self.assertEqual(obtained_row_labels, None)
+            self.assertRaises(
+                ValueError,
+                load,
+                filepath,
+                labeled_rows=True,
+            )
+
+    def test_labels_ignored(self):
+        """
+        Test the loading of a binary file with row labels without labeling
+        the rows.
+        """
+        with tempfile.TemporaryDirectory() as tmp_dirpath:
+            filepath = os.path.join(tmp_dirpath, "example01.bin")
+            save(
+                filepath,
+                get_matrix01(),
+                alt_names=["a" + str(i + 1) for i in range(7)],
+            )
+            obtained_matrix, obtained_row_labels = load(
+                filepath,
+                mmap_mode=None,
+            )
+            self.assertAlmostEqualArrays(
+                obtained_matrix,
+                np.array(get_matrix01(), dtype=np.float64),
+            )
+            self.assertEqual(obtained_row_labels, None)
+
+    def test_mmap_mode_exception(self):
+        """
+        Test the loading of a binary file with mapping modes that would
+        modify it.
+        """
+        with tempfile.TemporaryDirectory() as tmp_dirpath:
+            filepath = os.path.join(tmp_dirpath, "example01.bin")
+            save(filepath, get_matrix01())
+            for mmap_mode in ["w+", "r+", "x"]:
+                self.assertRaises(
+                    ValueError,
+                    load,
+                    filepath,
+                    mmap_mode=mmap_mode,
+                )
+            obtained_matrix, _ = load(filepath, mmap_mode="r")
+            self.assertAlmostEqualArrays(
+                np.asarray(obtained_matrix),
+                np.array(get_matrix01(), dtype=np.float64),
+            )
+            del obtained_matrix
+
+
+class TestLoadChunks(ExtendedTestCase):
+    """
+    Test class for the ``load_chunks`` function of the ``mcdm`` package.
+    """
+    def test_example01(self):
+        """
+        Test the loading of chunks from a CSV file with the default parameter
+        values.
+        """
+        obtained_chunks = list(
+            load_chunks(os.path.join(DIR_PATH, "data", "example01.csv")),
+        )
+        self.assertEqual(len(obtained_chunks), 1)
+        self.assertAlmostEqualArrays(
+            obtained_chunks[0][0],
+            np.array(get_matrix01(), dtype=np.float64),
+        )
+        self.assertEqual(obtained_chunks[0][1], None)
+
+    def test_example03(self):
+        """
+        Test the loading of chunks from a TSV file that does not contain any
+        labels, using whitespace as the delimiter.
+        """
+        obtained_chunks = list(
+            load_chunks(
+                os.path.join(DIR_PATH, "data", "example03.tsv"),
+                delimiter=None,
+                chunk_rows=2,
+            ),
+        )
+        self.assertEqual(len(obtained_chunks), 3)
+        self.assertAlmostEqualArrays(
+            np.concatenate([chunk for chunk, _ in obtained_chunks]),
+            np.array(get_matrix03(), dtype=np.float64),
+        )
+        self.assertEqual(obtained_chunks[2][0].shape, (1, 2))
+
+    def test_example07(self):
+        """
+        Test the loading of chunks from a CSV file that contains a multi-line
+        comment.
+        """
+        obtained_chunks = list(
+            load_chunks(
+                os.path.join(DIR_PATH, "data", "example07.csv"),
+                skiprows=1,
+                chunk_rows=2,
+            ),
+        )
+        self.assertAlmostEqualArrays(
+            np.concatenate([chunk for chunk, _ in obtained_chunks]),
+            np.array(get_matrix07(), dtype=np.float64),
+        )
+
+    def test_example09(self):
+        """
+        Test the loading of chunks from a large TSV file.
+        """
+        obtained_chunks = list(
+            load_chunks(
+                os.path.join(DIR_PATH, "data", "example09.tsv"),
+                delimiter="\t",
+                skiprows=1,
+                labeled_rows=True,
+                chunk_rows=10,
+            ),
+        )
+        self.assertEqual(len(obtained_chunks), 4)
+        self.assertAlmostEqualArrays(
+            np.concatenate([chunk for chunk, _ in obtained_chunks]),
+            np.array(get_matrix09(), dtype=np.float64),
+        )
+        self.assertEqual(
+            [label for _, labels in obtained_chunks for label in labels],
+            get_labels04(),
+        )
+
+    def test_compressed(self):
+        """
+        Test the loading of chunks from a bzip2-compressed TSV file.
+        """
+        with tempfile.TemporaryDirectory() as tmp_dirpath:
+            filepath = os.path.join(tmp_dirpath, "example09.tsv.bz2")
+            with open(
+                os.path.join(DIR_PATH, "data", "example09.tsv"),
+                mode="rb",
+            ) as fp:
+                data = bz2.compress(fp.read())
+            with open(filepath, mode="wb") as fp:
+                fp.write(data)
+            obtained_chunks = list(
+                load_chunks(
+                    filepath,
+                    delimiter="\t",
+                    skiprows=1,
+                    labeled_rows=True,
+                    chunk_rows=16,
+                ),
+            )
+        self.assertEqual(len(obtained_chunks), 3)
+        self.assertAlmostEqualArrays(
+            np.concatenate([chunk for chunk, _ in obtained_chunks]),
+            np.array(get_matrix09(), dtype=np.float64),
+        )
+
+    def test_wrong_columns_exception(self):
+        """
+        Test the loading of chunks from TSV files that contain the wrong
+        number of columns.
+        """
+        for labeled_rows in [False, True]:
+            self.assertRaises(
+                ValueError,
+                list,
+                load_chunks(
+                    os.path.join(DIR_PATH, "data", "failure01.tsv"),
+                    delimiter="\t",
+                    labeled_rows=labeled_rows,
+                ),
+            )
+
+    def test_chunk_rows_exception(self):
+        """
+        Test the loading of chunks with an invalid number of rows per chunk.
+        """
+        self.assertRaises(
+            ValueError,
+            list,
+            load_chunks(
+                os.path.join(DIR_PATH, "data", "example01.csv"),
+                chunk_rows=0,
+            ),
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -25,10 +25,18 @@
 Test script for the integration of the ``mcdm`` package.
 """
 
+import importlib
+import json
 import os
+import shutil
+import subprocess
+import sys
+import tempfile
 import unittest
+from unittest import mock
 
 import mcdm
+from mcdm._version import read_version
 
 from .helper_testing import (
     ExtendedTestCase,
@@ -213,5 +221,139 @@ class TestMcdm(ExtendedTestCase):
         )
 
 
+class TestImport(unittest.TestCase):
+    """
+    Test class for the lazy loading of the modules of the ``mcdm`` package.
+    """
+    def get_loaded_modules(self, statement):
+        """
+        Return the names of the modules that a fresh Python interpreter has
+        loaded after importing the ``mcdm`` package and executing the
+        provided statement.
+        """
+        cp = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import json, sys, mcdm\n"
+                + statement
+                + "\nprint(json.dumps(sorted(sys.modules)))",
+            ],
+            cwd=os.path.dirname(os.path.dirname(DIR_PATH)),
+            capture_output=True,
+            check=True,
+        )
+        return set(json.loads(cp.stdout.decode()))
+
+    def test_import(self):
+        """
+        Test that importing the package does not load any of its submodules
+        other than its metadata.
+        """
+        loaded_modules = self.get_loaded_modules("pass")
+        self.assertEqual(
+            {name for name in loaded_modules if name.startswith("mcdm")},
+            {"mcdm", "mcdm._metadata", "mcdm.helper_lazy"},
+        )
+        self.assertNotIn("subprocess", loaded_modules)
+
+    def test_saw(self):
+        """
+        Test that ranking with the SAW scoring method and the MW weighting
+        method does not load the modules of the other methods.
+        """
+        loaded_modules = self.get_loaded_modules(
+            "mcdm.rank([[0.0, 1.0], [1.0, 0.0]])",
+        )
+        self.assertIn("mcdm.scoring.saw_method", loaded_modules)
+        self.assertIn("mcdm.weighting.mw_method", loaded_modules)
+        for name in [
+            "mcdm.correlation",
+            "mcdm.helper_rolling",
+            "mcdm.normalization.linear2_method",
+            "mcdm.normalization.linear3_method",
+            "mcdm.normalization.vector_method",
+            "mcdm.scoring.mew_method",
+            "mcdm.scoring.topsis_method",
+            "mcdm.scoring.mtopsis_method",
+            "mcdm.weighting.critic_method",
+            "mcdm.weighting.em_method",
+            "mcdm.weighting.sd_method",
+            "mcdm.weighting.vic_method",
+            "concurrent.futures",
+            "gzip",
+        ]:
+            self.assertNotIn(name, loaded_modules)
+
+    def test_attributes(self):
+        """
+        Test the lazily loaded attributes of the package and its subpackages.
+        """
+        self.assertIs(
+            mcdm.__getattr__("scoring"),
+            importlib.import_module("mcdm.scoring"),
+        )
+        self.assertTrue(callable(mcdm.scoring.topsis))
+        self.assertTrue(callable(mcdm.correlation.dcor))
+        self.assertTrue(callable(mcdm.normalization.vector))
+        self.assertTrue(callable(mcdm.weighting.critic))
+        self.assertTrue(set(mcdm.__all__).issubset(dir(mcdm)))
+        self.assertIn("weighting", dir(mcdm))
+        for subpackage in [
+            mcdm.correlation,
+            mcdm.normalization,
+            mcdm.scoring,
+            mcdm.weighting,
+        ]:
+            self.assertTrue(set(subpackage.__all__).issubset(dir(subpackage)))
+            self.assertRaises(AttributeError, getattr, subpackage, "missing")
+
+
+class TestVersion(unittest.TestCase):
+    """
+    Test class for the version number of the ``mcdm`` package.
+    """
+    def test_import(self):
+        """
+        Test that importing the package and reading its version number do
+        not invoke any Git commands.
+        """
+        with mock.patch(
+            "subprocess.run",
+            side_effect=AssertionError,
+        ), mock.patch("subprocess.Popen", side_effect=AssertionError):
+            importlib.reload(mcdm)
+            self.assertNotIn("__version__", vars(mcdm))
+            self.assertRegex(
+                mcdm.__version__,
+                r"^(0\+[0-9a-f]{7}|[0-9]+\.[0-9]+(\+[0-9a-f]{7})?"
+                + r"|0\+unknown)$",
+            )
+            self.assertIn("__version__", vars(mcdm))
+
+    def test_missing_attribute(self):
+        """
+        Test the access of an attribute that does not exist.
+        """
+        self.assertRaises(AttributeError, getattr, mcdm, "missing")
+
+    def test_read_version(self):
+        """
+        Test the reading of the version number from a file.
+        """
+        tmp_dirpath = tempfile.mkdtemp()
+        try:
+            self.assertEqual(read_version(tmp_dirpath), "0+unknown")
+            with open(
+                os.path.join(tmp_dirpath, "VERSION.txt"),
+                mode="w",
+                encoding="utf-8",
+            ) as fp:
+                fp.write("1.4+abcdef0\n")
+            self.assertEqual(read_version(tmp_dirpath), "1.4+abcdef0")
+        finally:
+            shutil.rmtree(tmp_dirpath)
+
+
 if __name__ == "__main__":
     unittest.main()
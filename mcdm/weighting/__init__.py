@@ -23,11 +23,33 @@
 Python implementation of weighting methods.
 """
 
-from .critic_method import critic
-from .em_method import em
-from .mw_method import mw
-from .sd_method import sd
-from .vic_method import vic
+from typing import TYPE_CHECKING
 
+from ..helper_lazy import load_attribute
+
+if TYPE_CHECKING:
+    from .critic_method import critic
+    from .em_method import em
+    from .mw_method import mw
+    from .sd_method import sd
+    from .vic_method import vic
+
+
+# Each method module is imported only when its function is first accessed
+_METHOD_MODULES = {
+    "critic": ".critic_method",
+    "em": ".em_method",
+    "mw": ".mw_method",
+    "sd": ".sd_method",
+    "vic": ".vic_method",
+}
 
 __all__ = ["mw", "em", "sd", "critic", "vic"]
+
+
+def __getattr__(name):
+    return load_attribute(globals(), _METHOD_MODULES, name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -32,34 +32,49 @@ see the following publication:
 
 import numpy as np
 
+from ..correlation.pearson_method import column_sd, pearson, pearson_sums
 from ..helper_correlation import correlate
+from ..helper_dtype import current_dtype
+from ..helper_registry import get_method
 from ..helper_validation import check_weighting_input
 
 
-def critic(z_matrix, c_method="Pearson"):
+def critic(z_matrix, c_method="Pearson", workspace=None):
     """
     Return the weight vector of the provided decision matrix using the
-    Criteria Importance Through Intercriteria Correlation method.
+    Criteria Importance Through Intercriteria Correlation method. If a
+    workspace array is provided, the temporary matrices of the standard
+    deviations and of the built-in Pearson correlation method are
+    constructed in it.
     """
     # Perform sanity checks
-    z_matrix = np.array(z_matrix, dtype=np.float64)
+    z_matrix = np.asarray(z_matrix, dtype=current_dtype())
     if c_method is None:
         c_method = "Pearson"
     check_weighting_input(z_matrix, c_method, "CRITIC")
 
     # Compute the standard deviation of each criterion
-    sd_vector = np.std(z_matrix, axis=0, dtype=np.float64)
+    sd_vector = column_sd(z_matrix, workspace)
 
-    # Compute the correlation coefficients between pairs of criteria
-    corr_matrix = correlate(z_matrix, c_method)
+    # Sum the correlation coefficients of each criterion with all criteria,
+    # which does not require the correlation matrix for the built-in
+    # Pearson correlation method
+    if get_method("correlation", c_method).function is pearson:
+        corr_sums = pearson_sums(z_matrix, workspace)
+    else:
+        corr_sums = np.sum(correlate(z_matrix, c_method), axis=1)
 
+    return critic_weights(sd_vector, corr_sums)
+
+
+def critic_weights(sd_vector, corr_sums):
+    """
+    Return the CRITIC weight vector of the criteria with the provided
+    standard deviations and sums of correlation coefficients with all
+    criteria.
+    """
     # Compute the importance of each criterion
-    imp_vector = np.zeros(z_matrix.shape[1], dtype=np.float64)
-    for j_col in range(z_matrix.shape[1]):
-        tmp_sum = 0.0
-        for l_col in range(z_matrix.shape[1]):
-            tmp_sum += 1.0 - corr_matrix[j_col, l_col]
-        imp_vector[j_col] = sd_vector[j_col] * tmp_sum
+    imp_vector = sd_vector * (sd_vector.shape[0] - corr_sums)
 
     # Normalize the importance of each criterion
     return imp_vector / np.sum(imp_vector)
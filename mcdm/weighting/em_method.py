@@ -36,6 +36,7 @@ the following publications:
 
 import numpy as np
 
+from ..helper_dtype import current_dtype
 from ..helper_validation import check_weighting_input
 
 
@@ -45,16 +46,16 @@ def em(z_matrix):
     Measure method.
     """
     # Perform sanity checks
-    z_matrix = np.array(z_matrix, dtype=np.float64)
+    z_matrix = np.array(z_matrix, dtype=current_dtype())
     check_weighting_input(z_matrix, "", "EM")
 
     # Compute the normalization constant
     k_constant = 1.0 / np.log(z_matrix.shape[0])
 
     # Compute the entropy of each criterion
-    e_vector = np.zeros(z_matrix.shape[1], dtype=np.float64)
+    e_vector = np.zeros(z_matrix.shape[1], dtype=z_matrix.dtype)
     for j in range(z_matrix.shape[1]):
-        tmp_sum = 0.0
+        tmp_sum = np.float64(0.0)
         for i in range(z_matrix.shape[0]):
             if z_matrix[i, j] > 0.0:
                 tmp_sum += z_matrix[i, j] * np.log(z_matrix[i, j])
@@ -32,6 +32,7 @@ the following publication:
 
 import numpy as np
 
+from ..helper_dtype import current_dtype
 from ..helper_validation import check_weighting_input
 
 
@@ -41,10 +42,12 @@ def mw(z_matrix):
     Weights method.
     """
     # Perform sanity checks
-    z_matrix = np.array(z_matrix, dtype=np.float64)
+    z_matrix = np.array(z_matrix, dtype=current_dtype())
     check_weighting_input(z_matrix, "", "MW")
 
     # Each criterion is considered equally important
-    return (
-        np.full(z_matrix.shape[1], 1.0 / z_matrix.shape[1], dtype=np.float64)
+    return np.full(
+        z_matrix.shape[1],
+        1.0 / z_matrix.shape[1],
+        dtype=z_matrix.dtype,
     )
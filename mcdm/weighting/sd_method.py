@@ -32,20 +32,23 @@ the following publication:
 
 import numpy as np
 
+from ..correlation.pearson_method import column_sd
+from ..helper_dtype import current_dtype
 from ..helper_validation import check_weighting_input
 
 
-def sd(z_matrix):
+def sd(z_matrix, workspace=None):
     """
     Return the weight vector of the provided decision matrix using the
-    Standard Deviation method.
+    Standard Deviation method. If a workspace array is provided, the
+    deviations from the mean of each criterion are computed in it.
     """
     # Perform sanity checks
-    z_matrix = np.array(z_matrix, dtype=np.float64)
+    z_matrix = np.asarray(z_matrix, dtype=current_dtype())
     check_weighting_input(z_matrix, "", "SD")
 
     # Compute the standard deviation of each criterion
-    sd_vector = np.std(z_matrix, axis=0, dtype=np.float64)
+    sd_vector = column_sd(z_matrix, workspace)
 
     # The importance of each criterion corresponds to
     # its normalized standard deviation
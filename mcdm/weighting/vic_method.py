@@ -32,7 +32,9 @@ the following publication:
 
 import numpy as np
 
+from ..correlation.pearson_method import column_sd
 from ..helper_correlation import correlate
+from ..helper_dtype import current_dtype
 from ..helper_validation import check_weighting_input
 
 
@@ -42,22 +44,27 @@ def vic(z_matrix, c_method="dCor"):
     Variability and Interdependencies of Criteria method.
     """
     # Perform sanity checks
-    z_matrix = np.array(z_matrix, dtype=np.float64)
+    z_matrix = np.array(z_matrix, dtype=current_dtype())
     if c_method is None:
         c_method = "dCor"
     check_weighting_input(z_matrix, c_method, "VIC")
 
     # Compute the standard deviation of each criterion
-    sd_vector = np.std(z_matrix, axis=0, dtype=np.float64)
+    sd_vector = column_sd(z_matrix)
 
     # Compute the correlation coefficients between pairs of criteria
     corr_matrix = correlate(z_matrix, c_method)
 
+    return vic_weights(sd_vector, np.sum(corr_matrix, axis=1))
+
+
+def vic_weights(sd_vector, corr_sums):
+    """
+    Return the VIC weight vector of the criteria with the provided standard
+    deviations and sums of correlation coefficients with all criteria.
+    """
     # Compute the importance of each criterion
-    imp_vector = np.zeros(z_matrix.shape[1], dtype=np.float64)
-    for j_col in range(z_matrix.shape[1]):
-        tmp_sum = float(np.sum(corr_matrix[j_col]))
-        imp_vector[j_col] = sd_vector[j_col] / tmp_sum
+    imp_vector = sd_vector / corr_sums
 
     # Normalize the importance of each criterion
     return imp_vector / np.sum(imp_vector)
@@ -83,6 +83,7 @@ def setup():
         keywords=metadata["__keywords__"],
         classifiers=metadata["__classifiers__"],
         install_requires=metadata["__install_requires__"],
+        extras_require=metadata["__extras_require__"],
         python_requires=metadata["__python_requires__"],
         include_package_data=True,
         zip_safe=False,